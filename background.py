@@ -0,0 +1,95 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundWorker:
+    """
+    Runs slow calls (Dijkstra, searches, file loading, scheduling) off the Tk
+    main thread. Finished results go into a thread-safe queue that the Tk loop
+    polls with root.after, so the done/error callbacks always run on the main
+    thread and may touch widgets. A failure goes to the request's on_error,
+    or else to the worker's, or else to Tk's usual traceback report, so no
+    error is ever dropped.
+
+    Every request belongs to a channel (e.g. "path"). A newer request on the
+    same channel supersedes the older one: if the old one has not started it
+    is cancelled, otherwise its result is dropped when it arrives.
+    """
+
+    POLL_MS = 16  # ~60 fps while anything is running
+
+    def __init__(self, root, max_workers=2, on_busy=None, on_error=None):
+        self.root = root
+        self.on_busy = on_busy  # called with True when work starts and False when all is done
+        self.on_error = on_error  # called with the exception of a request that has no on_error
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="campus-worker")
+        self._results = queue.Queue()
+        self._latest = {}  # channel -> (generation, future) of the newest request
+        self._pending = 0
+        self._polling = False
+
+    def submit(self, channel, fn, *args, on_done=None, on_error=None):
+        """Runs fn(*args) on a worker thread and hands the result to on_done(result)"""
+        generation = self.cancel(channel)
+        future = self._executor.submit(self._run, channel, generation, fn, args, on_done, on_error)
+        self._latest[channel] = (generation, future)
+        self._pending += 1
+        if self._pending == 1 and self.on_busy is not None:
+            self.on_busy(True)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+        return generation
+
+    def cancel(self, channel):
+        """Supersedes whatever is running on channel; returns the next generation number"""
+        generation, future = self._latest.get(channel, (0, None))
+        self._latest[channel] = (generation + 1, None)
+        if future is not None and future.cancel():
+            # Never started, so no result will come back for it
+            self._finished()
+        return generation + 1
+
+    def is_current(self, channel, generation):
+        return self._latest.get(channel, (None,))[0] == generation
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, channel, generation, fn, args, on_done, on_error):
+        # Worker thread: never touch Tk here, only the queue
+        try:
+            self._results.put((channel, generation, True, fn(*args), on_done, on_error))
+        except Exception as e:
+            self._results.put((channel, generation, False, e, on_done, on_error))
+
+    def _finished(self):
+        self._pending -= 1
+        if self._pending == 0 and self.on_busy is not None:
+            self.on_busy(False)
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    channel, generation, ok, value, on_done, on_error = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                self._finished()
+                if not self.is_current(channel, generation):
+                    continue  # superseded while it was running
+                if ok:
+                    if on_done is not None:
+                        on_done(value)
+                elif on_error is not None:
+                    on_error(value)
+                elif self.on_error is not None:
+                    self.on_error(value)
+                else:
+                    self.root.report_callback_exception(type(value), value, value.__traceback__)
+        finally:
+            # Keep polling even if a callback raised
+            if self._pending > 0:
+                self.root.after(self.POLL_MS, self._poll)
+            else:
+                self._polling = False
@@ -0,0 +1,178 @@
+"""
+Batch scheduling for a whole student body.
+
+Reads one task set per student from a JSON Lines (or JSON array) export,
+where every record looks like {"student": "...", "tasks": [...]}, runs the
+activity selector for each student in worker processes and streams one
+result line per student to the output file, in input order.
+
+    python batch_schedule.py students.jsonl schedules.jsonl --mode weighted --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from campus_core import CampusGraph
+from scheduling import PRIORITY_WEIGHTS
+from task_loader import LoadReport, iter_task_records, validate_records, format_minutes
+from task_store import TaskStore, PRIORITY_NAMES
+
+MODES = ("end_time", "priority", "weighted")
+
+# Set once per worker process by init_worker so chunks stay small to pickle
+_worker_settings = {}
+
+
+def init_worker(valid_locations, mode, distances):
+    _worker_settings["valid_locations"] = set(valid_locations)
+    _worker_settings["mode"] = mode
+    _worker_settings["distances"] = distances
+
+
+def schedule_student(student, raw_tasks, valid_locations, mode, distances=None):
+    """Validates one student's tasks and returns their recommended schedule as a dict"""
+    report = LoadReport(max_samples=5)
+    if not isinstance(raw_tasks, list):
+        raw_tasks = []
+        report.reject(0, "malformed", "tasks must be a list")
+    store = TaskStore.from_tasks(validate_records(enumerate(raw_tasks, 1), valid_locations, report))
+
+    if mode == "weighted":
+        chosen = store.weighted_select(PRIORITY_WEIGHTS, distances)
+    else:
+        chosen = store.greedy_select(mode)
+
+    schedule = []
+    value = 0
+    for i in chosen:
+        priority = PRIORITY_NAMES[store.priorities[i]]
+        value += PRIORITY_WEIGHTS[priority]
+        schedule.append({
+            "title": store.titles[i],
+            "startTime": format_minutes(store.starts[i]),
+            "endTime": format_minutes(store.ends[i]),
+            "location": store.location_names[store.locations[i]],
+            "priority": priority,
+        })
+    return {
+        "student": student,
+        "schedule": schedule,
+        "value": value,
+        "tasks": len(raw_tasks),
+        "rejected": report.rejected,
+    }
+
+
+def schedule_chunk(chunk):
+    """Worker entry point: schedules a chunk of students and returns encoded result lines"""
+    settings = _worker_settings
+    lines = []
+    for student, raw_tasks in chunk:
+        result = schedule_student(student, raw_tasks, settings["valid_locations"],
+                                  settings["mode"], settings["distances"])
+        lines.append(json.dumps(result))
+    return lines, sum(len(t) if isinstance(t, list) else 0 for _, t in chunk)
+
+
+def iter_chunks(filename, report, chunk_size):
+    """Groups (student, tasks) pairs from the export into lists of chunk_size"""
+    chunk = []
+    for number, record in iter_task_records(filename, report):
+        if not isinstance(record, dict) or "tasks" not in record:
+            report.reject(number, "not a student record", repr(record)[:80])
+            continue
+        chunk.append((record.get("student", number), record["tasks"]))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(input_file, output_file, valid_locations, mode="end_time", workers=None,
+              chunk_size=500, distances=None, progress=None):
+    """
+    Schedules every student in input_file and writes one JSON line per student
+    to output_file. At most two chunks per worker are in flight, so memory stays
+    bounded however large the export is. Returns a stats dict with throughput.
+    """
+    workers = workers or os.cpu_count() or 1
+    report = LoadReport()
+    students = 0
+    tasks = 0
+    started = time.perf_counter()
+
+    def write(out, lines, task_count):
+        nonlocal students, tasks
+        out.write("\n".join(lines))
+        out.write("\n")
+        students += len(lines)
+        tasks += task_count
+        if progress is not None:
+            progress(students, tasks, time.perf_counter() - started)
+
+    with open(output_file, "w") as out:
+        chunks = iter_chunks(input_file, report, chunk_size)
+        if workers == 1:
+            init_worker(valid_locations, mode, distances)
+            for chunk in chunks:
+                write(out, *schedule_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                     initargs=(list(valid_locations), mode, distances)) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(schedule_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        write(out, *pending.popleft().result())
+                while pending:
+                    write(out, *pending.popleft().result())
+
+    elapsed = time.perf_counter() - started
+    return {
+        "students": students,
+        "tasks": tasks,
+        "seconds": elapsed,
+        "students_per_sec": students / elapsed if elapsed else 0.0,
+        "tasks_per_sec": tasks / elapsed if elapsed else 0.0,
+        "workers": workers,
+        "rejected_records": report.to_dict(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recommend schedules for every student in an export")
+    parser.add_argument("input", help="JSON Lines (or JSON array) of {\"student\", \"tasks\"} records")
+    parser.add_argument("output", help="where to write one JSON result line per student")
+    parser.add_argument("--mode", choices=MODES, default="end_time")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (1 runs in this process)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="students per work unit")
+    parser.add_argument("--travel", action="store_true",
+                        help="leave time to walk between buildings (weighted mode)")
+    args = parser.parse_args(argv)
+    if args.travel and args.mode != "weighted":
+        parser.error("--travel is only supported with --mode weighted")
+
+    campus = CampusGraph()
+    distances = campus.walking_times() if args.travel else None
+
+    def progress(students, tasks, elapsed):
+        print(f"\r{students} students, {tasks / elapsed if elapsed else 0:.0f} tasks/sec",
+              end="", file=sys.stderr)
+
+    stats = run_batch(args.input, args.output, campus.get_buildings(), args.mode,
+                      args.workers, args.chunk_size, distances, progress)
+    print(file=sys.stderr)
+    print(f"Scheduled {stats['students']} students ({stats['tasks']} tasks) in {stats['seconds']:.2f}s "
+          f"with {stats['workers']} workers: {stats['students_per_sec']:.0f} students/sec, "
+          f"{stats['tasks_per_sec']:.0f} tasks/sec", file=sys.stderr)
+
+
+# Main
+if __name__ == "__main__":
+    main()
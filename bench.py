@@ -0,0 +1,314 @@
+"""
+Benchmarks for the navigator's algorithms on generated data.
+
+Every generator is seeded, so the same size and seed always give the same
+graph, task set or name directory, and runs can be compared over time.
+Results are written as one JSON object per line (default bench_output.txt).
+
+    python bench.py --sizes 100 1000 10000 --repeat 5
+    python bench.py --only dijkstra --kinds grid geometric --sizes 1000000
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import networkx as nx
+
+from campus_core import CampusGraph, kmp_search
+from layout import SPRING_LIMIT, campus_layout
+from scheduling import greedy_schedule, weighted_schedule
+from task_loader import LoadReport, load_validate_tasks, validate_records, format_minutes
+
+GRAPH_KINDS = ("grid", "geometric", "scale_free")
+BENCHMARKS = ("dijkstra", "kmp_search", "load_tasks", "schedule", "layout", "indoor")
+WORDS = ["Hall", "Library", "Center", "Annex", "Gym", "Lab", "Tower", "Pavilion",
+         "Commons", "Studio", "Arena", "House", "Plaza", "Garage", "Union"]
+PRIORITIES = ["High", "Medium", "Low"]
+LAYOUT_LIMIT = 100000  # the multilevel layout takes tens of seconds beyond this
+
+
+# Generators
+
+def grid_graph(n, seed=42):
+    """Roughly n buildings on a square grid with random walking distances"""
+    rng = random.Random(seed)
+    side = max(2, round(math.sqrt(n)))
+    graph = nx.Graph()
+    for r in range(side):
+        for c in range(side):
+            name = f"B{r * side + c}"
+            graph.add_node(name)
+            if c:
+                graph.add_edge(f"B{r * side + c - 1}", name, weight=rng.randint(1, 20))
+            if r:
+                graph.add_edge(f"B{(r - 1) * side + c}", name, weight=rng.randint(1, 20))
+    return graph
+
+
+def geometric_graph(n, seed=42):
+    """
+    n buildings at random points in the unit square, joined when closer than
+    a radius just above the connectivity threshold. Points are bucketed into
+    cells of that radius, so only neighbouring cells are compared.
+    """
+    rng = random.Random(seed)
+    radius = math.sqrt(1.5 * math.log(max(n, 2)) / (math.pi * n))
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    cells = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(i)
+
+    graph = nx.Graph()
+    for i, (x, y) in enumerate(points):
+        graph.add_node(f"B{i}", pos=(x, y))
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cells.get((cx + dx, cy + dy), ()):
+                    for i in members:
+                        if i < j:
+                            d = math.dist(points[i], points[j])
+                            if d <= radius:
+                                graph.add_edge(f"B{i}", f"B{j}", weight=max(1, round(d * 1000)))
+    return graph
+
+
+def scale_free_graph(n, seed=42, m=2):
+    """Barabási–Albert preferential attachment: a few hub buildings, many leaves"""
+    rng = random.Random(seed)
+    graph = nx.Graph()
+    ends = []  # every edge endpoint, so a uniform pick is degree-proportional
+    for i in range(m + 1):
+        graph.add_node(f"B{i}")
+        for j in range(i):
+            graph.add_edge(f"B{j}", f"B{i}", weight=rng.randint(1, 20))
+            ends += [i, j]
+    for i in range(m + 1, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(ends[rng.randrange(len(ends))])
+        for j in targets:
+            graph.add_edge(f"B{j}", f"B{i}", weight=rng.randint(1, 20))
+            ends += [i, j]
+    return graph
+
+
+GENERATORS = {"grid": grid_graph, "geometric": geometric_graph, "scale_free": scale_free_graph}
+
+
+def indoor_graph(n, seed=42, floors=4, rooms=24):
+    """
+    About n nodes of buildings mapped indoors: each has floors of rooms off
+    a corridor, a stairwell at both ends of the corridor, and two ground
+    floor entrances onto a grid of outdoor paths
+    """
+    rng = random.Random(seed)
+    per_building = floors * rooms * 2
+    buildings = max(2, n // per_building)
+    side = max(2, math.ceil(math.sqrt(buildings)) + 1)
+    graph = grid_graph(side * side, seed)
+    graph = nx.relabel_nodes(graph, {name: f"P{name[1:]}" for name in graph.nodes})
+    for b in range(buildings):
+        name = f"B{b}"
+        for f in range(floors):
+            for r in range(rooms):
+                hall, room = f"{name}.{f}.h{r}", f"{name}.{f}.r{r}"
+                graph.add_node(hall, building=name)
+                graph.add_node(room, building=name, kind="room")
+                graph.add_edge(hall, room, weight=rng.randint(1, 3))
+                if r:
+                    graph.add_edge(f"{name}.{f}.h{r - 1}", hall, weight=rng.randint(1, 4))
+            if f:
+                for r in (0, rooms - 1):
+                    graph.add_edge(f"{name}.{f - 1}.h{r}", f"{name}.{f}.h{r}", weight=6, stairs=1)
+        # Entrances at both ends of the ground floor, onto neighbouring path nodes
+        row, col = divmod(b, side - 1)
+        graph.add_edge(f"{name}.0.h0", f"P{row * side + col}", weight=rng.randint(1, 5))
+        graph.add_edge(f"{name}.0.h{rooms - 1}", f"P{(row + 1) * side + col + 1}", weight=rng.randint(1, 5))
+    return graph
+
+
+def generate_tasks(n, locations, seed=42):
+    """n task records in the tasks.json format, spread over the day"""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(n):
+        start = rng.randrange(6 * 60, 21 * 60)
+        end = min(start + rng.choice((15, 30, 45, 50, 60, 75, 90, 120, 180)), 24 * 60 - 1)
+        tasks.append({
+            "title": f"Task {i}",
+            "startTime": format_minutes(start),
+            "endTime": format_minutes(end),
+            "location": rng.choice(locations),
+            "priority": rng.choice(PRIORITIES),
+        })
+    return tasks
+
+
+def generate_names(n, seed=42):
+    """A directory of n building names like 'North Library 17'"""
+    rng = random.Random(seed)
+    prefixes = ["North", "South", "East", "West", "Upper", "Lower", "Old", "New"]
+    return [f"{rng.choice(prefixes)} {rng.choice(WORDS)} {i}" for i in range(n)]
+
+
+# Timing
+
+def measure(fn, repeat):
+    """Runs fn repeat times and returns the wall times in seconds"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def record(name, size, times, ops=1, **extra):
+    best = min(times)
+    result = {
+        "benchmark": name,
+        "size": size,
+        "repeat": len(times),
+        "ops": ops,
+        "best": best,
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "ops_per_sec": ops / best if best else None,
+    }
+    result.update(extra)
+    return result
+
+
+def bench_dijkstra(kind, size, repeat, seed, queries=20):
+    graph = GENERATORS[kind](size, seed)
+    campus = CampusGraph(graph)
+    rng = random.Random(seed)
+    names = list(graph.nodes)
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(queries)]
+    campus.dijkstra(*pairs[0])  # builds and caches the index outside the timing
+    times = measure(lambda: [campus.dijkstra(a, b) for a, b in pairs], repeat)
+    return record("dijkstra", graph.number_of_nodes(), times, queries, graph=kind,
+                  edges=graph.number_of_edges())
+
+
+def bench_kmp(size, repeat, seed, queries=20):
+    names = [name.lower() for name in generate_names(size, seed)]
+    rng = random.Random(seed)
+    # Half the queries hit somewhere in the directory, half miss everywhere
+    patterns = [rng.choice(WORDS).lower() if i % 2 else "zz" + rng.choice(WORDS).lower()
+                for i in range(queries)]
+    times = measure(lambda: [[kmp_search(name, p) for name in names] for p in patterns], repeat)
+    return record("kmp_search", size, times, queries * size)
+
+
+def bench_load(size, repeat, seed, directory):
+    locations = list(CampusGraph().get_buildings())
+    path = os.path.join(directory, f"tasks_{size}.json")
+    with open(path, "w") as f:
+        json.dump(generate_tasks(size, locations, seed), f)
+    times = measure(lambda: load_validate_tasks(path, locations), repeat)
+    return record("load_tasks", size, times, size, bytes=os.path.getsize(path))
+
+
+def bench_schedule(size, repeat, seed):
+    locations = list(CampusGraph().get_buildings())
+    records = generate_tasks(size, locations, seed)
+    tasks = list(validate_records(enumerate(records, 1), locations, LoadReport()))
+    results = []
+    for mode in ("end_time", "priority"):
+        times = measure(lambda: greedy_schedule(tasks, mode), repeat)
+        results.append(record("schedule", size, times, size, mode=mode))
+    times = measure(lambda: weighted_schedule(tasks), repeat)
+    results.append(record("schedule", size, times, size, mode="weighted"))
+    distances = CampusGraph().distance_table()
+    times = measure(lambda: weighted_schedule(tasks, distances=distances), repeat)
+    results.append(record("schedule", size, times, size, mode="weighted_travel"))
+    return results
+
+
+def bench_layout(kind, size, repeat, seed):
+    graph = GENERATORS[kind](size, seed)
+    # Generated coordinates are ignored so the force-directed engines are timed
+    times = measure(lambda: campus_layout(graph, seed, coordinates=False), repeat)
+    engine = "spring" if graph.number_of_nodes() <= SPRING_LIMIT else "multilevel"
+    return record("layout", graph.number_of_nodes(), times, 1, graph=kind, engine=engine,
+                  edges=graph.number_of_edges())
+
+
+def bench_indoor(size, repeat, seed, queries=20):
+    """Room-to-room routes, flat Dijkstra against the building hierarchy"""
+    graph = indoor_graph(size, seed)
+    campus = CampusGraph(graph)
+    rng = random.Random(seed)
+    rooms = [node for node, data in graph.nodes(data=True) if data.get("kind") == "room"]
+    pairs = [(rng.choice(rooms), rng.choice(rooms)) for _ in range(queries)]
+    campus.dijkstra(*pairs[0])
+    started = time.perf_counter()
+    campus.indoor_route(*pairs[0])
+    build = time.perf_counter() - started
+    results = []
+    for mode, route in (("flat", campus.dijkstra), ("hierarchy", campus.indoor_route)):
+        times = measure(lambda: [route(a, b) for a, b in pairs], repeat)
+        results.append(record("indoor", graph.number_of_nodes(), times, queries, mode=mode,
+                              edges=graph.number_of_edges(), build_seconds=build))
+    return results
+
+
+def run(sizes, kinds, only, repeat, seed):
+    """Yields one result dict per benchmark, size and variant"""
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            if "dijkstra" in only:
+                for kind in kinds:
+                    yield bench_dijkstra(kind, size, repeat, seed)
+            if "kmp_search" in only:
+                yield bench_kmp(size, repeat, seed)
+            if "load_tasks" in only:
+                yield bench_load(size, repeat, seed, directory)
+            if "schedule" in only:
+                yield from bench_schedule(size, repeat, seed)
+            if "indoor" in only:
+                yield from bench_indoor(size, repeat, seed)
+            if "layout" in only and size <= LAYOUT_LIMIT:
+                for kind in kinds:
+                    yield bench_layout(kind, size, repeat, seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the navigator's algorithms on generated data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="graph nodes / tasks / directory names per run (up to 1000000)")
+    parser.add_argument("--kinds", nargs="+", choices=GRAPH_KINDS, default=list(GRAPH_KINDS))
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_output.txt", help="JSON Lines results file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    meta = {"python": platform.python_version(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed}
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for result in run(args.sizes, args.kinds, args.only, args.repeat, args.seed):
+            result.update(meta)
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            variant = result.get("graph") or result.get("mode") or ""
+            print(f"{result['benchmark']:<11} {variant:<16} {result['size']:>8}  "
+                  f"best {result['best'] * 1000:10.2f} ms  {result['ops_per_sec']:14.0f} ops/s", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+# Main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,898 @@
+"""
+The navigator's engine without any GUI: the campus graph with Dijkstra,
+KMP building search and the map renderer. Every front end (main_OG,
+main_cyb, main_min, the HTTP service, batch tools) shares this module, so
+a speed-up here reaches all of them. Themes only change how things look.
+"""
+import heapq
+import math
+import time
+
+import networkx as nx
+
+import indoor
+import metrics
+import multicriteria
+import timedep
+
+class VersionedGraph(nx.Graph):
+    """nx.Graph that counts the changes made through its methods, so CampusGraph can tell its caches are stale"""
+
+    version = 0
+
+    def _changed(self):
+        self.version += 1
+
+    def add_node(self, *args, **kwargs):
+        super().add_node(*args, **kwargs)
+        self._changed()
+
+    def add_nodes_from(self, *args, **kwargs):
+        super().add_nodes_from(*args, **kwargs)
+        self._changed()
+
+    def remove_node(self, *args):
+        super().remove_node(*args)
+        self._changed()
+
+    def remove_nodes_from(self, *args):
+        super().remove_nodes_from(*args)
+        self._changed()
+
+    def add_edge(self, *args, **kwargs):
+        super().add_edge(*args, **kwargs)
+        self._changed()
+
+    def add_edges_from(self, *args, **kwargs):
+        super().add_edges_from(*args, **kwargs)
+        self._changed()
+
+    def remove_edge(self, *args):
+        super().remove_edge(*args)
+        self._changed()
+
+    def remove_edges_from(self, *args):
+        super().remove_edges_from(*args)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._changed()
+
+
+class CampusGraph:
+    """
+    Class to handle campus graph data and algorithms.
+
+    Indexes and tables derived from the graph are cached. They are dropped
+    when self.graph is replaced, gains or loses nodes, or (for the
+    VersionedGraph built here) is changed through any of its methods. An
+    edge attribute edited in place, e.g. graph.edges[u, v]["weight"] = 3,
+    cannot be seen: change weights with set_weights(), or call
+    _clear_caches() after editing the graph by hand. The same goes for
+    adding or removing edges on a plain nx.Graph passed in.
+    """
+    
+    def __init__(self, graph=None):
+        self._clear_caches()
+        if graph is None:
+            self.graph = VersionedGraph()
+            self.build_graph()
+        else:
+            # Any weighted networkx graph works, e.g. a generated one for benchmarks
+            self.graph = graph
+    
+    def build_graph(self):
+        buildings = ['Pollak', 'TSU', 'SGMH', 'MH', 'ECS', 'SRC', 'LH', 'KHS']
+        edges = [
+            ('Pollak', 'TSU', 2), ('TSU', 'SRC', 3), ('TSU', 'MH', 4),
+            ('MH', 'LH', 5), ('LH', 'SGMH', 6), ('SGMH', 'Pollak', 7),
+            ('Pollak', 'ECS', 8), ('ECS', 'KHS', 9), ('KHS', 'SRC', 10),
+            ('SRC', 'KHS', 11), ('SRC', 'Pollak', 12), ('LH', 'Pollak', 13),
+            ('MH', 'Pollak', 14)
+        ]
+        # What each building offers, for nearest() ("closest food to ECS")
+        categories = {
+            'Pollak': ['library', 'study', 'restroom'],
+            'TSU': ['food', 'study', 'restroom'],
+            'SRC': ['recreation', 'restroom'],
+            'KHS': ['restroom'],
+            'ECS': ['restroom'],
+            'MH': ['restroom'],
+            'LH': ['restroom'],
+            'SGMH': ['restroom'],
+        }
+        # (latitude, longitude) of each entrance, for snap(..., "gps"); the
+        # graph keeps its schematic layout, so there is no "pos"
+        gps = {
+            'Pollak': (33.8813, -117.8854),
+            'TSU': (33.8817, -117.8882),
+            'SGMH': (33.8787, -117.8834),
+            'MH': (33.8797, -117.8856),
+            'ECS': (33.8823, -117.8827),
+            'SRC': (33.8831, -117.8878),
+            'LH': (33.8791, -117.8844),
+            'KHS': (33.8828, -117.8859),
+        }
+        for building in buildings:
+            self.graph.add_node(building, categories=categories[building], gps=gps[building])
+        for u, v, w in edges:
+            self.graph.add_edge(u, v, weight=w)
+        self._clear_caches()
+
+    def _clear_caches(self):
+        """Drops everything derived from the graph; call after changing it"""
+        self._index = None
+        self._distance_table = None
+        self._cost_index = None
+        self._profile_index = None
+        self._travel_times = None
+        self._hierarchy = None
+        self._categories = None
+        self._locators = {}
+        self._graph_key = None
+
+    def _check_graph(self):
+        """Drops the caches when the graph is not the one they were built from (see the class docstring)"""
+        graph = self.graph
+        key = (id(graph), len(graph), getattr(graph, "version", None))
+        if key != self._graph_key:
+            if self._graph_key is not None:
+                self._clear_caches()
+            self._graph_key = key
+    
+    def set_weights(self, changes):
+        """Sets edge weights from {(u, v): weight} and drops what was derived from the old ones"""
+        for (u, v), weight in changes.items():
+            self.graph.edges[u, v]['weight'] = weight
+        self._clear_caches()
+
+    def get_buildings(self):
+        return list(self.graph.nodes())
+    
+    def _index_graph(self):
+        """Maps node names to indices and builds an adjacency list of (index, weight)"""
+        self._check_graph()
+        if self._index is not None:
+            return self._index
+        name_to_index = {name: i for i, name in enumerate(self.graph.nodes)}
+        index_to_name = {i: name for name, i in name_to_index.items()}
+
+        n = len(self.graph.nodes)
+        graph_list = [[] for _ in range(n)]
+
+        for u, v, data in self.graph.edges(data=True):
+            u_idx = name_to_index[u]
+            v_idx = name_to_index[v]
+            weight = data.get('weight', 1)
+            graph_list[u_idx].append((v_idx, weight))
+            graph_list[v_idx].append((u_idx, weight))
+        self._index = (name_to_index, index_to_name, graph_list)
+        return self._index
+    
+    def _shortest_paths(self, graph_list, src_idx):
+        """Runs Dijkstra from src_idx and returns the dist and prev lists"""
+        if metrics.enabled:
+            return self._measured_shortest_paths(graph_list, src_idx)
+        n = len(graph_list)
+        dist = [float('inf')] * n
+        prev = [None] * n
+        dist[src_idx] = 0
+        pq = [(0, src_idx)]  # Priority queue (distance, node)
+
+        # Main Dijkstra algorithm
+        while pq:
+            current_dist, u = heapq.heappop(pq)
+            if current_dist > dist[u]:
+                continue
+            for v, weight in graph_list[u]:
+                if dist[u] + weight < dist[v]:
+                    dist[v] = dist[u] + weight
+                    prev[v] = u
+                    heapq.heappush(pq, (dist[v], v))
+        return dist, prev
+
+    def _measured_shortest_paths(self, graph_list, src_idx):
+        """_shortest_paths that also counts heap pushes and times the run, for metrics"""
+        n = len(graph_list)
+        dist = [float('inf')] * n
+        prev = [None] * n
+        dist[src_idx] = 0
+        pq = [(0, src_idx)]
+        pushes = 1
+        started = time.perf_counter()
+        while pq:
+            current_dist, u = heapq.heappop(pq)
+            if current_dist > dist[u]:
+                continue
+            for v, weight in graph_list[u]:
+                if dist[u] + weight < dist[v]:
+                    dist[v] = dist[u] + weight
+                    prev[v] = u
+                    heapq.heappush(pq, (dist[v], v))
+                    pushes += 1
+        metrics.record_dijkstra(graph_list, dist, pushes, time.perf_counter() - started)
+        return dist, prev
+    
+    def dijkstra(self, source, target):
+        """
+        Implements Dijkstra's algorithm to find the shortest path between two named nodes
+        Returns both the total distance and the complete path
+        """
+        name_to_index, index_to_name, graph_list = self._index_graph()
+        src_idx = name_to_index[source]
+        tgt_idx = name_to_index[target]
+        dist, prev = self._shortest_paths(graph_list, src_idx)
+        return dist[tgt_idx], self._trace(prev, src_idx, tgt_idx, index_to_name)
+
+    @staticmethod
+    def _trace(prev, src_idx, tgt_idx, index_to_name):
+        """Reconstructs the path to tgt_idx from a prev list; [] when it was not reached"""
+        path = []
+        current = tgt_idx
+        if prev[current] is not None or current == src_idx:
+            while current is not None:
+                path.append(index_to_name[current])
+                current = prev[current]
+        
+        path.reverse()
+        return path
+    
+    def shortest_path_tree(self, source):
+        """
+        Distance from source to every building and each building's previous
+        stop on its shortest path, as two dicts keyed by name
+        """
+        name_to_index, index_to_name, graph_list = self._index_graph()
+        dist, prev = self._shortest_paths(graph_list, name_to_index[source])
+        distances = {index_to_name[i]: d for i, d in enumerate(dist)}
+        previous = {index_to_name[i]: index_to_name[p] for i, p in enumerate(prev) if p is not None}
+        return distances, previous
+    
+    def distance_table(self):
+        """
+        Shortest-path distance between every pair of buildings, as a nested
+        dict table[a][b]. Computed once (one Dijkstra per building) and reused,
+        so looking up the walk between two buildings is O(1)
+        """
+        self._check_graph()
+        if self._distance_table is None:
+            name_to_index, index_to_name, graph_list = self._index_graph()
+            table = {}
+            for name, src_idx in name_to_index.items():
+                dist, _ = self._shortest_paths(graph_list, src_idx)
+                table[name] = {index_to_name[i]: d for i, d in enumerate(dist)}
+            self._distance_table = table
+        return self._distance_table
+
+    def _index_costs(self):
+        """Cost-vector adjacency for multi-criteria routing, and its accessible-only part"""
+        self._check_graph()
+        if self._cost_index is None:
+            index = multicriteria.index_costs(self.graph)
+            self._cost_index = (index, multicriteria.accessible_adjacency(index[2]))
+        return self._cost_index
+
+    def pareto_routes(self, source, target, max_labels=multicriteria.MAX_LABELS):
+        """
+        Routes that trade distance against stairs, time in the open and
+        accessibility: every route no other route beats on all of them, as
+        dicts with "path" and one key per multicriteria.CRITERIA, shortest
+        first. Returns (routes, truncated): truncated is True when the
+        max_labels cap cut the search short, so some Pareto-optimal routes
+        may be missing (see multicriteria)
+        """
+        index, _ = self._index_costs()
+        routes, truncated = multicriteria.pareto_search(index, source, target, max_labels)
+        return [dict(zip(multicriteria.CRITERIA, costs), path=path) for costs, path in routes], truncated
+
+    def fastest_accessible(self, source, target):
+        """
+        Like dijkstra, but only over wheelchair accessible edges (no stairs
+        unless marked accessible); (inf, []) when there is no such route
+        """
+        (name_to_index, index_to_name, _), accessible = self._index_costs()
+        src_idx = name_to_index[source]
+        tgt_idx = name_to_index[target]
+        dist, prev = self._shortest_paths(accessible, src_idx)
+        return dist[tgt_idx], self._trace(prev, src_idx, tgt_idx, index_to_name)
+
+    def _index_profiles(self):
+        """Adjacency list of (index, minutes, travel-time profile or None) for time-dependent routing"""
+        self._check_graph()
+        if self._profile_index is None:
+            name_to_index, index_to_name, _ = self._index_graph()
+            self._profile_index = timedep.index_profiles(self.graph, name_to_index)
+        return self._profile_index
+
+    def time_dependent(self):
+        """True when some edge has a travel-time "profile" (see timedep)"""
+        return any(profile is not None for edges in self._index_profiles() for _, _, profile in edges)
+
+    def earliest_arrivals(self, source, depart):
+        """Earliest arrival minute at every building when leaving source at minute depart"""
+        name_to_index, index_to_name, _ = self._index_graph()
+        arrival, _ = timedep.earliest_arrivals(self._index_profiles(), name_to_index[source], depart)
+        return {index_to_name[i]: t for i, t in enumerate(arrival)}
+
+    def travel_time(self, source, target, depart):
+        """
+        Like dijkstra, but edges with a "profile" take as long as they do at
+        the time they are reached, leaving source at minute depart (a
+        datetime.time works too). Returns the travel minutes and the path
+        """
+        if not isinstance(depart, (int, float)):
+            depart = depart.hour * 60 + depart.minute
+        name_to_index, index_to_name, _ = self._index_graph()
+        src_idx = name_to_index[source]
+        tgt_idx = name_to_index[target]
+        arrival, prev = timedep.earliest_arrivals(self._index_profiles(), src_idx, depart)
+        return arrival[tgt_idx] - depart, self._trace(prev, src_idx, tgt_idx, index_to_name)
+
+    def walking_times(self):
+        """
+        What the scheduler needs to leave time to walk between tasks: the
+        distance_table, or when travel times depend on the hour a
+        timedep.TravelTimes to call with (from, to, departure minute)
+        """
+        self._check_graph()
+        if not self.time_dependent():
+            return self.distance_table()
+        if self._travel_times is None:
+            self._travel_times = timedep.TravelTimes(self)
+        return self._travel_times
+
+    def indoor_route(self, source, target):
+        """
+        dijkstra for graphs mapped indoors, with rooms and floors tagged by
+        "building": only the two buildings involved and the outdoor overlay
+        are searched (see indoor.BuildingHierarchy, built on first use)
+        """
+        self._check_graph()
+        if self._hierarchy is None:
+            self._hierarchy = indoor.BuildingHierarchy(self.graph)
+        return self._hierarchy.route(source, target)
+
+    def _index_categories(self):
+        """Inverted index {category: set of node indices} over the nodes' "categories" tags"""
+        self._check_graph()
+        if self._categories is None:
+            name_to_index, _, _ = self._index_graph()
+            index = {}
+            for name, data in self.graph.nodes(data=True):
+                for category in data.get("categories", ()):
+                    index.setdefault(category, set()).add(name_to_index[name])
+            self._categories = index
+        return self._categories
+
+    def categories(self):
+        return sorted(self._index_categories())
+
+    def _nearest_members(self, graph_list, src_idx, members, k):
+        """Dijkstra from src_idx that stops as soon as k of members are settled"""
+        dist = {src_idx: 0}
+        pq = [(0, src_idx)]
+        found = []
+        while pq and len(found) < k:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            if u in members:
+                found.append((d, u))
+            for v, weight in graph_list[u]:
+                if d + weight < dist.get(v, float('inf')):
+                    dist[v] = d + weight
+                    heapq.heappush(pq, (dist[v], v))
+        return found
+
+    def nearest(self, source, category, k=1):
+        """
+        The k buildings tagged category closest to source, as (distance,
+        building) pairs, nearest first (fewer when fewer are reachable).
+        One Dijkstra, stopped once k of them are settled
+        """
+        return self.nearest_many([source], category, k)[source]
+
+    def _nearest_sweep(self, graph_list, members, origins, k):
+        """
+        One Dijkstra from all members at once, in which every node keeps the
+        first k distinct members to reach it; stops when every origin has k.
+        A node that already has k closer members cannot pass a farther one
+        on to anything either, so its labels are final
+        """
+        labels = {}
+        waiting = len(origins)
+        pq = [(0, m, m) for m in members]
+        heapq.heapify(pq)
+        while pq and waiting:
+            d, u, m = heapq.heappop(pq)
+            got = labels.setdefault(u, [])
+            if len(got) >= k or any(seen == m for _, seen in got):
+                continue
+            got.append((d, m))
+            if len(got) == k and u in origins:
+                waiting -= 1
+            for v, weight in graph_list[u]:
+                if len(labels.get(v, ())) < k:
+                    heapq.heappush(pq, (d + weight, v, m))
+        return labels
+
+    def nearest_many(self, sources, category, k=1):
+        """
+        nearest() for many origins at once, as {source: pairs}. Each search
+        alone stops early, but once there are several times more distinct
+        origins than buildings in the category, one sweep out from all of
+        those buildings together is cheaper and answers every origin (the
+        graph is undirected, so distances read the same both ways)
+        """
+        started = time.perf_counter()
+        name_to_index, index_to_name, graph_list = self._index_graph()
+        members = self._index_categories().get(category, set())
+        origins = {name_to_index[source] for source in sources}
+        if len(origins) > 4 * len(members):
+            labels = self._nearest_sweep(graph_list, members, origins, k)
+            answers = {o: labels.get(o, []) for o in origins}
+        else:
+            answers = {o: self._nearest_members(graph_list, o, members, k) for o in origins}
+        if metrics.enabled:
+            metrics.observe("nearest_seconds", time.perf_counter() - started)
+        return {source: [(d, index_to_name[m]) for d, m in answers[name_to_index[source]]] for source in sources}
+
+    def locator(self, attribute="pos"):
+        """
+        KDTree over the buildings that have an attribute coordinate, and
+        those buildings in the tree's order. "pos" is a flat (x, y); "gps" is
+        (latitude, longitude), flattened by shrinking longitude by the cosine
+        of the campus's mean latitude, which is exact enough at campus scale
+        """
+        self._check_graph()
+        from spatial import KDTree
+        if attribute not in self._locators:
+            nodes = [node for node, data in self.graph.nodes(data=True) if attribute in data]
+            if not nodes:
+                raise ValueError(f"no building has '{attribute}' coordinates")
+            xy = [self.graph.nodes[node][attribute] for node in nodes]
+            scale = 1.0
+            if attribute == "gps":
+                scale = math.cos(math.radians(sum(lat for lat, _ in xy) / len(xy)))
+                xy = [(lon * scale, lat) for lat, lon in xy]
+            self._locators[attribute] = (KDTree(xy), nodes, scale)
+        tree, nodes, _ = self._locators[attribute]
+        return tree, nodes
+
+    def _flatten(self, points, attribute):
+        if attribute != "gps":
+            return points
+        scale = self._locators[attribute][2]
+        return [(lon * scale, lat) for lat, lon in points]
+
+    def snap(self, point, attribute="pos"):
+        """
+        The building nearest to point: (x, y), or (latitude, longitude) when
+        attribute is "gps". Snap a raw position before routing from it
+        """
+        tree, nodes = self.locator(attribute)
+        index, _ = tree.nearest(self._flatten([point], attribute)[0])
+        return nodes[index]
+
+    def snap_many(self, points, attribute="pos"):
+        """snap() for each of points, as a list of buildings"""
+        tree, nodes = self.locator(attribute)
+        indices, _ = tree.nearest_many(self._flatten(points, attribute))
+        return [nodes[i] for i in indices]
+
+
+# KMP Search Algorithm
+def kmp_search(text, pattern):
+    if metrics.enabled and isinstance(text, str):
+        # Reruns the search on a wrapped text that counts comparisons
+        return metrics.count_comparisons(kmp_search, text, pattern)
+
+    def build_lps(pattern):
+        lps = [0] * len(pattern)
+        length = 0
+        i = 1
+        while i < len(pattern):
+            if pattern[i] == pattern[length]:
+                length += 1
+                lps[i] = length
+                i += 1
+            else:
+                if length != 0:
+                    length = lps[length-1]
+                else:
+                    lps[i] = 0
+                    i += 1
+        return lps
+
+    lps = build_lps(pattern)
+    i = j = 0
+    while i < len(text):
+        if pattern[j] == text[i]:
+            i += 1
+            j += 1
+        if j == len(pattern):
+            return i - j
+        elif i < len(text) and pattern[j] != text[i]:
+            if j != 0:
+                j = lps[j-1]
+            else:
+                i += 1
+    return -1
+
+
+# How render_campus_map draws the map; themes override any of these
+MAP_STYLE = {
+    "mpl_style": "default",     # matplotlib style sheet used while drawing
+    "background": None,         # figure color, None keeps the style's
+    "font_family": "sans-serif",
+    "edge_color": "gray",
+    "edge_alpha": 0.5,
+    "edge_width": 1.0,
+    "path_color": "blue",
+    "path_width": 4.0,
+    "path_glow_width": None,    # a wide translucent stroke under the path
+    "arrow_size": 20,
+    "node_colors": {"start": "green", "end": "red", "path": "lightblue", "other": "pink",
+                    "highlight": "red", "plain": "pink"},
+    "node_sizes": {"start": 3500, "end": 3500, "path": 3000, "other": 2500,
+                   "highlight": 3500, "plain": 2500},
+    "node_glow": False,         # a larger translucent disc behind each node
+    "node_edge_color": "black",
+    "node_edge_width": 1.0,
+    "label_color": "black",
+    "edge_label_color": "black",
+    "title_color": "black",
+    "title_weight": "normal",
+    "footer_color": "black",
+    "path_title": "Shortest Path: {path}",
+    "map_title": "CSUF Campus Map",
+    "distance_footer": "Total Distance: {distance} units",
+    "highlight_footer": "Highlighted Building: {building}",
+    # Level of detail: past these counts of visible nodes/edges the map
+    # switches to an overview that skips the expensive parts
+    "detail_limit": 150,        # more visible nodes than this: minor ones become dots
+    "label_limit": 40,          # most node names drawn in the overview
+    "edge_label_limit": 60,     # more visible edges than this: no weight labels
+    "rasterize_limit": 5000,    # more visible edges or dots than this: draw them as pixels
+    "overview_size": 120,       # marker cap for the nodes still drawn in the overview
+    "dot_size": 4,
+    "arrow_limit": 25,          # longer routes are drawn as plain lines, without arrows
+    "pick_radius": 30,          # clicks farther than this many pixels from every building pick nothing
+    # Route playback (MapView.animate)
+    "walker_color": "orange",
+    "walker_size": 14,
+    "walked_width": 6.0,
+}
+
+
+def node_role(node, path, highlighted):
+    if path:
+        if node == path[0]:
+            return "start"
+        if node == path[-1]:
+            return "end"
+        return "path" if node in path else "other"
+    return "highlight" if node == highlighted else "plain"
+
+
+def route_text(path, limit=8):
+    """The route as 'A → B → C', shortened in the middle when it has more than limit stops"""
+    if len(path) <= limit:
+        return " → ".join(path)
+    return " → ".join(path[:limit // 2] + ["…"] + path[-(limit // 2):]) + f" ({len(path)} stops)"
+
+
+class MapView:
+    """
+    The campus map drawn on one matplotlib figure that can be redrawn for
+    any part of the map. Node positions and edge boxes are indexed in a
+    SpatialGrid, so each redraw only touches what lies inside the view.
+
+    Small views are drawn in full. When more nodes are visible than the
+    style's detail_limit, only the route ends, the highlighted building and
+    the busiest named buildings (not kind="waypoint") keep markers and
+    labels, the rest become dots, and edge weights are dropped, so the
+    drawing time follows what can actually be seen rather than the size of
+    the graph. connect() adds scroll-wheel zoom and drag-to-pan, and a click
+    that does not drag calls on_pick with the nearest building, found in a
+    KDTree over the node positions. animate() plays the route back with a
+    walker moving along it.
+    """
+
+    def __init__(self, graph, pos, path=None, distance=None, highlighted=None, style=None, on_pick=None):
+        import matplotlib.pyplot as plt
+        import numpy as np
+        from matplotlib.collections import LineCollection
+        from spatial import SpatialGrid
+
+        self.graph = graph
+        self.path = path
+        self.highlighted = highlighted
+        self.style = s = MAP_STYLE if style is None else dict(MAP_STYLE, **style)
+        self.nodes = list(graph.nodes)
+        index = {node: i for i, node in enumerate(self.nodes)}
+        self.xy = np.array([pos[node] for node in self.nodes], dtype=float).reshape(-1, 2)
+        self.edges = np.array([(index[u], index[v]) for u, v in graph.edges],
+                              dtype=np.int64).reshape(-1, 2)
+        self.grid = SpatialGrid(self.xy, self.edges)
+        self.tree = None  # KDTree for picking, built on the first click
+        self.on_pick = on_pick
+
+        # Overview importance: the route ends and highlighted building, then
+        # named buildings by degree, then waypoints by degree
+        keep = {path[0], path[-1]} if path else set()
+        if highlighted is not None:
+            keep.add(highlighted)
+        rank = np.array([(node not in keep, graph.nodes[node].get("kind") == "waypoint", -graph.degree(node))
+                         for node in self.nodes], dtype=[("keep", bool), ("waypoint", bool), ("degree", int)])
+        self.rank = np.empty(len(self.nodes), dtype=np.int64)
+        self.rank[np.argsort(rank, order=("keep", "waypoint", "degree"), kind="stable")] = np.arange(len(self.nodes))
+        self.named = np.array([graph.nodes[node].get("kind") != "waypoint" or node in keep
+                               for node in self.nodes], dtype=bool)
+        roles = [node_role(node, path, highlighted) for node in self.nodes]
+        self.colors = np.array([s["node_colors"][role] for role in roles], dtype=object)
+        self.sizes = np.array([s["node_sizes"][role] for role in roles], dtype=float)
+
+        font = s["font_family"]
+        with plt.style.context(s["mpl_style"]):
+            self.fig, self.ax = plt.subplots(figsize=(10, 8), facecolor=s["background"])
+            ax = self.ax
+            if s["background"]:
+                ax.set_facecolor(s["background"])
+
+            # All visible edges as one NaN-separated polyline in a single
+            # collection, so matplotlib builds one path instead of one per edge
+            self.edge_lines = LineCollection([], colors=s["edge_color"], linewidths=s["edge_width"],
+                                             alpha=s["edge_alpha"], zorder=1)
+            ax.add_collection(self.edge_lines)
+
+            # Draw path edges on top, optionally over a glow
+            if path and len(path) > 1:
+                path_edges = [(path[i], path[i+1]) for i in range(len(path)-1)]
+                route = [[pos[node] for node in path]]
+                if s["path_glow_width"]:
+                    ax.add_collection(LineCollection(route, colors=s["path_color"], linewidths=s["path_glow_width"],
+                                                     alpha=0.3, zorder=1))
+                if len(path_edges) <= s["arrow_limit"]:
+                    nx.draw_networkx_edges(graph, pos, edgelist=path_edges, width=s["path_width"],
+                                           edge_color=s["path_color"], arrows=True,
+                                           arrowstyle='->', arrowsize=s["arrow_size"], ax=ax)
+                else:
+                    # Arrow patches are slow to draw; a long route reads fine as one line
+                    ax.add_collection(LineCollection(route, colors=s["path_color"], linewidths=s["path_width"],
+                                                     zorder=1))
+
+            # Minor nodes as dots, the rest as markers colored by role
+            self.dots = ax.scatter([], [], s=s["dot_size"], c=s["node_colors"]["plain"], linewidths=0, zorder=2)
+            self.glow = ax.scatter([], [], alpha=0.3, edgecolors='none', zorder=2) if s["node_glow"] else None
+            self.markers = ax.scatter([], [], edgecolors=s["node_edge_color"], linewidths=s["node_edge_width"],
+                                      zorder=2)
+            self.labels = []
+
+            # Add a title based on what's being shown
+            if path:
+                title = s["path_title"].format(path=route_text(path))
+                footer = s["distance_footer"].format(distance=distance)
+            else:
+                title = s["map_title"]
+                footer = s["highlight_footer"].format(building=highlighted) if highlighted else None
+            ax.set_title(title, fontsize=14, color=s["title_color"], fontweight=s["title_weight"], fontfamily=font)
+            if footer:
+                self.fig.text(0.5, 0.01, footer, fontsize=12, color=s["footer_color"], ha='center', fontfamily=font)
+            ax.axis('off')
+            self.fig.tight_layout()
+
+        # The whole map with a small margin is the home view
+        if len(self.xy):
+            lo, hi = self.xy.min(axis=0), self.xy.max(axis=0)
+        else:
+            lo, hi = np.zeros(2), np.ones(2)
+        margin = np.maximum((hi - lo) * 0.05, 0.05)
+        self.home = tuple(float(v) for v in (lo[0] - margin[0], hi[0] + margin[0],
+                                             lo[1] - margin[1], hi[1] + margin[1]))
+        self.view = None
+        self._drag = None
+        self.animation = None
+
+    def draw(self, view=None):
+        """Redraws the map for view (xmin, xmax, ymin, ymax); the whole map when None"""
+        import numpy as np
+        s = self.style
+        view = self.home if view is None else tuple(view)
+        self.view = view
+        # A margin keeps big markers just outside the edge from popping in and out
+        pad_x, pad_y = (view[1] - view[0]) * 0.05, (view[3] - view[2]) * 0.05
+        points, edges = self.grid.query((view[0] - pad_x, view[1] + pad_x, view[2] - pad_y, view[3] + pad_y))
+        detailed = len(points) <= s["detail_limit"]
+
+        if len(edges):
+            segments = np.full((len(edges), 3, 2), np.nan)
+            segments[:, :2] = self.xy[self.edges[edges]]
+            self.edge_lines.set_segments([segments.reshape(-1, 2)])
+        else:
+            self.edge_lines.set_segments([])
+        self.edge_lines.set_rasterized(len(edges) > s["rasterize_limit"])
+
+        # Which nodes get markers and names at this level of detail
+        if detailed:
+            shown, dots = points, points[:0]
+        else:
+            named = points[self.named[points]]
+            limit = min(s["label_limit"], len(named))
+            shown = named[np.argsort(self.rank[named])[:limit]]
+            dots = np.setdiff1d(points, shown, assume_unique=True)
+        self.dots.set_offsets(self.xy[dots] if len(dots) else np.zeros((0, 2)))
+        self.dots.set_rasterized(len(dots) > s["rasterize_limit"])
+
+        sizes = self.sizes[shown] if detailed else np.minimum(self.sizes[shown], s["overview_size"])
+        colors = list(self.colors[shown])
+        self.markers.set_offsets(self.xy[shown] if len(shown) else np.zeros((0, 2)))
+        self.markers.set_sizes(sizes)
+        self.markers.set_facecolors(colors)
+        if self.glow is not None:
+            self.glow.set_offsets(self.xy[shown] if len(shown) else np.zeros((0, 2)))
+            self.glow.set_sizes(sizes * 1.5)
+            self.glow.set_facecolors(colors)
+
+        # Node labels and, when few enough are visible, edge weights
+        for label in self.labels:
+            label.remove()
+        font = s["font_family"]
+        self.labels = [self.ax.text(x, y, self.nodes[i], fontsize=10 if detailed else 7, color=s["label_color"],
+                                    fontweight='bold', fontfamily=font, ha='center', va='center', zorder=3,
+                                    clip_on=True)
+                       for i, (x, y) in zip(shown, self.xy[shown])]
+        if len(edges) <= s["edge_label_limit"]:
+            for u, v in self.edges[edges]:
+                data = self.graph.edges[self.nodes[u], self.nodes[v]]
+                if 'weight' in data:
+                    (x1, y1), (x2, y2) = self.xy[u], self.xy[v]
+                    bbox = dict(boxstyle='round', ec=(1.0, 1.0, 1.0), fc=(1.0, 1.0, 1.0))
+                    if s["background"]:
+                        bbox = dict(bbox, ec=s["background"], fc=s["background"])
+                    self.labels.append(self.ax.text((x1 + x2) / 2, (y1 + y2) / 2, str(data['weight']),
+                                                    fontsize=8, color=s["edge_label_color"], fontfamily=font,
+                                                    ha='center', va='center', bbox=bbox, zorder=1, clip_on=True))
+
+        self.ax.set_xlim(view[0], view[1])
+        self.ax.set_ylim(view[2], view[3])
+        return self.fig
+
+    def animate(self, seconds=8.0, fps=30, repeat=True):
+        """
+        Plays the route back: a walker moves along it, covering each edge in
+        time proportional to its weight, and leaves the walked part drawn
+        over the route. Frames are blitted, so only the walker and the walked
+        line are redrawn and the rest of the map is a cached background.
+        Returns the FuncAnimation (also kept as self.animation), or None
+        without a route
+        """
+        import numpy as np
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.collections import LineCollection
+        path = self.path
+        if not path or len(path) < 2:
+            return None
+        s = self.style
+        index = {node: i for i, node in enumerate(self.nodes)}
+        route = self.xy[[index[node] for node in path]]
+        weights = np.array([self.graph.edges[u, v].get('weight', 1) for u, v in zip(path, path[1:])], dtype=float)
+        if weights.sum() <= 0:
+            weights = np.ones(len(weights))  # no usable weights: one step per edge
+        ends = np.cumsum(weights)
+        starts = ends - weights
+        frames = max(2, int(seconds * fps))
+
+        walked = LineCollection([], colors=s["walker_color"], linewidths=s["walked_width"], alpha=0.8,
+                                zorder=4, animated=True)
+        self.ax.add_collection(walked)
+        walker, = self.ax.plot([], [], "o", color=s["walker_color"], markersize=s["walker_size"],
+                               markeredgecolor=s["node_edge_color"], zorder=5, animated=True)
+
+        def start():
+            walked.set_segments([])
+            walker.set_data([], [])
+            return walked, walker
+
+        def step(frame):
+            done = ends[-1] * frame / (frames - 1)
+            i = min(int(np.searchsorted(ends, done, side="right")), len(weights) - 1)
+            t = (done - starts[i]) / weights[i] if weights[i] > 0 else 1.0
+            point = route[i] + (route[i + 1] - route[i]) * min(max(t, 0.0), 1.0)
+            walked.set_segments([np.vstack([route[:i + 1], point])])
+            walker.set_data([point[0]], [point[1]])
+            return walked, walker
+
+        self.animation = FuncAnimation(self.fig, step, frames=frames, init_func=start, interval=1000 / fps,
+                                       blit=True, repeat=repeat, repeat_delay=1000)
+        return self.animation
+
+    # Pan and zoom
+
+    def connect(self):
+        """Scroll to zoom around the cursor, drag with the left button to pan, click to pick"""
+        canvas = self.fig.canvas
+        canvas.mpl_connect("scroll_event", self._on_scroll)
+        canvas.mpl_connect("button_press_event", self._on_press)
+        canvas.mpl_connect("motion_notify_event", self._on_motion)
+        canvas.mpl_connect("button_release_event", self._on_release)
+        return self
+
+    def _toolbar_busy(self):
+        toolbar = getattr(self.fig.canvas, "toolbar", None)
+        return toolbar is not None and bool(getattr(toolbar, "mode", ""))
+
+    def zoom(self, factor, x=None, y=None):
+        """Zooms in by factor (out when below 1), keeping (x, y) where it is on screen"""
+        xmin, xmax, ymin, ymax = self.view or self.home
+        x = (xmin + xmax) / 2 if x is None else x
+        y = (ymin + ymax) / 2 if y is None else y
+        self.draw((x - (x - xmin) / factor, x + (xmax - x) / factor,
+                   y - (y - ymin) / factor, y + (ymax - y) / factor))
+        self.fig.canvas.draw_idle()
+
+    def pan(self, dx, dy):
+        xmin, xmax, ymin, ymax = self.view or self.home
+        self.draw((xmin + dx, xmax + dx, ymin + dy, ymax + dy))
+        self.fig.canvas.draw_idle()
+
+    def _on_scroll(self, event):
+        if event.inaxes is self.ax and not self._toolbar_busy():
+            self.zoom(1.25 if event.button == "up" else 1 / 1.25, event.xdata, event.ydata)
+
+    def _on_press(self, event):
+        if event.inaxes is self.ax and event.button == 1 and not self._toolbar_busy():
+            self._drag = (event.x, event.y, self.view or self.home)
+
+    def _on_motion(self, event):
+        if self._drag is None:
+            return
+        # Work in pixels, since data coordinates move with the view
+        x0, y0, (xmin, xmax, ymin, ymax) = self._drag
+        width, height = self.ax.bbox.width, self.ax.bbox.height
+        dx = -(event.x - x0) * (xmax - xmin) / width
+        dy = -(event.y - y0) * (ymax - ymin) / height
+        self.draw((xmin + dx, xmax + dx, ymin + dy, ymax + dy))
+        self.fig.canvas.draw_idle()
+
+    def _on_release(self, event):
+        drag, self._drag = self._drag, None
+        # A press and release in (nearly) the same spot is a click, not a drag
+        if drag is None or self.on_pick is None or event.inaxes is not self.ax:
+            return
+        if abs(event.x - drag[0]) + abs(event.y - drag[1]) > 4:
+            return
+        building = self.pick(event.xdata, event.ydata, (event.x, event.y))
+        if building is not None:
+            self.on_pick(building)
+
+    def pick(self, x, y, pixel=None):
+        """
+        The building nearest to map point (x, y), or None; with the click's
+        pixel, also None when the building is more than pick_radius away on screen
+        """
+        from spatial import KDTree
+        if self.tree is None:
+            self.tree = KDTree(self.xy)
+        index, _ = self.tree.nearest((x, y))
+        if index < 0:
+            return None
+        if pixel is not None:
+            px, py = self.ax.transData.transform(self.xy[index])
+            if math.hypot(px - pixel[0], py - pixel[1]) > self.style["pick_radius"]:
+                return None
+        return self.nodes[index]
+
+
+def render_campus_map(graph, pos, path=None, distance=None, highlighted=None, style=None, view=None):
+    """
+    Draws the campus map into a new pyplot figure, with a route or a
+    highlighted building, and returns the figure. style overrides MAP_STYLE;
+    view (xmin, xmax, ymin, ymax) limits drawing to that part of the map
+    """
+    return MapView(graph, pos, path, distance, highlighted, style).draw(view)
@@ -0,0 +1,400 @@
+"""
+Local HTTP/JSON service for kiosks and the web portal.
+
+Serves routes, building search and schedules from one warm CampusGraph,
+using only asyncio from the standard library:
+
+    GET  /route?from=Pollak&to=KHS      -> {"from", "to", "distance", "path"}
+    POST /routes   {"routes": [["Pollak", "KHS"], ...]}
+    GET  /search?q=pol                  -> {"query", "matches"}
+    GET  /snap?lat=33.88&lon=-117.88    -> {"lat", "lon", "building"}
+    POST /snap     {"points": [[lat, lon], ...]}  -> {"buildings"}
+    GET  /nearest?from=ECS&category=food&k=3     -> {"from", "category", "nearest"}
+    POST /nearest  {"from": ["ECS", ...], "category": "food", "k": 3}  -> {"nearest"}
+    POST /schedule {"tasks": [...], "mode": "weighted", "travel": true}
+    GET  /stats
+    GET  /metrics                       -> Prometheus text (with --metrics)
+
+Route requests that arrive together are batched: every source that is not
+cached yet gets one shortest-path tree for all its waiting targets, and
+trees are kept in an LRU cache so later requests from the same building
+never run Dijkstra again. Tree building and scheduling run in a pool of
+worker processes so the event loop only parses requests and copies paths.
+
+    python campus_service.py --port 8036 --workers 4
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs
+
+import metrics
+from batch_schedule import MODES, schedule_student
+from campus_core import CampusGraph, kmp_search
+
+MAX_BODY = 1 << 20
+
+# Set once per worker process by init_worker
+_worker = {}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def init_worker():
+    """Builds the graph and its distance table once per worker process"""
+    campus = CampusGraph()
+    _worker["campus"] = campus
+    _worker["buildings"] = set(campus.get_buildings())
+    _worker["distances"] = campus.walking_times()
+
+
+def worker_ready():
+    return os.getpid()
+
+
+def route_trees(sources):
+    """Worker entry point: one shortest-path tree per source building"""
+    campus = _worker["campus"]
+    return [(source, campus.shortest_path_tree(source)) for source in sources]
+
+
+def schedule_tasks(raw_tasks, mode, travel):
+    """Worker entry point: validates raw task records and picks the schedule"""
+    distances = _worker["distances"] if travel else None
+    return schedule_student(None, raw_tasks, _worker["buildings"], mode, distances)
+
+
+def trace_path(previous, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+
+class CampusService:
+    def __init__(self, workers=None, cache_size=1024):
+        self.campus = CampusGraph()
+        self.buildings = self.campus.get_buildings()
+        self.known = set(self.buildings)
+        self.search = lru_cache(maxsize=4096)(self._search)
+
+        # workers=0 runs everything in this process (handy for tests)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        if self.workers:
+            # Workers must not inherit client sockets: a forked copy of one would
+            # keep it open after we close it, and the client would never see EOF.
+            # So they come from a fork server, and all start here, before serve()
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                            initializer=init_worker)
+            for future in [self.pool.submit(worker_ready) for _ in range(self.workers)]:
+                future.result()
+        else:
+            self.pool = None
+            init_worker()
+
+        self.cache_size = cache_size
+        self._trees = OrderedDict()  # source -> (distances, previous), least recently used first
+        self._inflight = {}          # source -> future of its tree
+        self._batch = []             # sources waiting for the next flush
+        self._builds = set()         # running _build_trees tasks (the loop only keeps weak references)
+        self.stats = {"requests": 0, "routes": 0, "tree_hits": 0, "tree_misses": 0,
+                      "batches": 0, "searches": 0, "schedules": 0, "snaps": 0, "nearest": 0, "errors": 0}
+        self.started = time.time()
+
+    async def run(self, fn, *args):
+        if self.pool is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    # Routing
+
+    async def tree(self, source):
+        tree = self._trees.get(source)
+        if tree is not None:
+            self._trees.move_to_end(source)
+            self.stats["tree_hits"] += 1
+            return tree
+        self.stats["tree_misses"] += 1
+        future = self._inflight.get(source)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._inflight[source] = future
+            self._batch.append(source)
+            if len(self._batch) == 1:
+                # Everything that arrives before the loop comes back round joins this batch
+                loop.call_soon(self._flush)
+        # Shielded so one client hanging up does not cancel the tree for the others
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        sources = self._batch
+        self._batch = []
+        self.stats["batches"] += 1
+        task = asyncio.get_running_loop().create_task(self._build_trees(sources))
+        self._builds.add(task)
+        task.add_done_callback(self._build_done)
+
+    def _build_done(self, task):
+        self._builds.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"building shortest-path trees failed: {task.exception()!r}", file=sys.stderr)
+
+    async def _build_trees(self, sources):
+        try:
+            trees = await self.run(route_trees, sources)
+        except Exception as e:
+            for source in sources:
+                self._inflight.pop(source).set_exception(e)
+            return
+        for source, tree in trees:
+            self._trees[source] = tree
+            if len(self._trees) > self.cache_size:
+                self._trees.popitem(last=False)
+            self._inflight.pop(source).set_result(tree)
+
+    async def route(self, source, target):
+        for name in (source, target):
+            if name not in self.known:
+                raise HTTPError(404, f"unknown building '{name}'")
+        self.stats["routes"] += 1
+        distances, previous = await self.tree(source)
+        distance = distances[target]
+        if distance == float("inf"):
+            return {"from": source, "to": target, "distance": None, "path": []}
+        return {"from": source, "to": target, "distance": distance,
+                "path": trace_path(previous, source, target)}
+
+    # GPS snapping
+
+    def snap(self, points):
+        """Nearest building to each (latitude, longitude), for routing from a phone or kiosk fix"""
+        try:
+            points = [(float(lat), float(lon)) for lat, lon in points]
+        except (TypeError, ValueError):
+            raise HTTPError(400, "points must be [latitude, longitude] pairs of numbers")
+        try:
+            buildings = self.campus.snap_many(points, "gps")
+        except ValueError as e:
+            raise HTTPError(404, str(e))
+        self.stats["snaps"] += len(points)
+        return buildings
+
+    # Nearest facilities
+
+    def nearest(self, sources, category, k):
+        """The k closest buildings tagged category to each source, as {source: [{"building", "distance"}]}"""
+        for name in sources:
+            if name not in self.known:
+                raise HTTPError(404, f"unknown building '{name}'")
+        try:
+            k = int(k)
+        except (TypeError, ValueError):
+            raise HTTPError(400, "'k' must be a whole number")
+        if k < 1:
+            raise HTTPError(400, "'k' must be at least 1")
+        self.stats["nearest"] += len(sources)
+        found = self.campus.nearest_many(sources, category, k)
+        return {source: [{"building": b, "distance": d} for d, b in pairs] for source, pairs in found.items()}
+
+    # Search and scheduling
+
+    def _search(self, query):
+        query = query.lower()
+        return [b for b in self.buildings if kmp_search(b.lower(), query) != -1]
+
+    async def schedule(self, body):
+        tasks = body.get("tasks")
+        mode = body.get("mode", "end_time")
+        if not isinstance(tasks, list):
+            raise HTTPError(400, "'tasks' must be a list")
+        if mode not in MODES:
+            raise HTTPError(400, f"'mode' must be one of {', '.join(MODES)}")
+        travel = bool(body.get("travel", False))
+        if travel and mode != "weighted":
+            raise HTTPError(400, "'travel' is only supported with mode 'weighted'")
+        self.stats["schedules"] += 1
+        result = await self.run(schedule_tasks, tasks, mode, travel)
+        del result["student"]
+        return result
+
+    # HTTP
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+
+        def param(name):
+            values = query.get(name)
+            if not values or not values[0]:
+                raise HTTPError(400, f"missing query parameter '{name}'")
+            return values[0]
+
+        def json_body():
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError as e:
+                raise HTTPError(400, f"invalid JSON: {e}")
+            if not isinstance(data, dict):
+                raise HTTPError(400, "request body must be a JSON object")
+            return data
+
+        if url.path == "/route" and method == "GET":
+            return await self.route(param("from"), param("to"))
+        if url.path == "/routes" and method == "POST":
+            pairs = json_body().get("routes")
+            if not isinstance(pairs, list) or not all(isinstance(p, list) and len(p) == 2 for p in pairs):
+                raise HTTPError(400, "'routes' must be a list of [from, to] pairs")
+            results = await asyncio.gather(*(self.route(a, b) for a, b in pairs), return_exceptions=True)
+            return {"routes": [{"error": r.message} if isinstance(r, HTTPError) else r for r in results]}
+        if url.path == "/search" and method == "GET":
+            self.stats["searches"] += 1
+            q = param("q")
+            return {"query": q, "matches": self.search(q)}
+        if url.path == "/snap" and method == "GET":
+            building = self.snap([(param("lat"), param("lon"))])[0]
+            return {"lat": float(param("lat")), "lon": float(param("lon")), "building": building}
+        if url.path == "/snap" and method == "POST":
+            points = json_body().get("points")
+            if not isinstance(points, list) or not all(isinstance(p, list) and len(p) == 2 for p in points):
+                raise HTTPError(400, "'points' must be a list of [latitude, longitude] pairs")
+            return {"buildings": self.snap(points)}
+        if url.path == "/nearest" and method == "GET":
+            source, category = param("from"), param("category")
+            k = query.get("k", ["1"])[0]
+            return {"from": source, "category": category, "nearest": self.nearest([source], category, k)[source]}
+        if url.path == "/nearest" and method == "POST":
+            data = json_body()
+            sources, category = data.get("from"), data.get("category")
+            if not isinstance(sources, list) or not all(isinstance(s, str) for s in sources):
+                raise HTTPError(400, "'from' must be a list of building names")
+            if not isinstance(category, str):
+                raise HTTPError(400, "'category' must be a string")
+            return {"nearest": self.nearest(sources, category, data.get("k", 1))}
+        if url.path == "/schedule" and method == "POST":
+            return await self.schedule(json_body())
+        if url.path == "/stats" and method == "GET":
+            return dict(self.stats, uptime=time.time() - self.started, cached_trees=len(self._trees),
+                        workers=self.workers)
+        if url.path == "/metrics" and method == "GET":
+            return metrics.prometheus_text()
+        if url.path in ("/route", "/routes", "/search", "/snap", "/nearest", "/schedule", "/stats", "/metrics"):
+            raise HTTPError(405, f"{method} not allowed on {url.path}")
+        raise HTTPError(404, f"no such endpoint {url.path}")
+
+    async def handle(self, reader, writer):
+        """Serves one connection, keeping it open between requests (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self.respond(writer, 400, {"error": "invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, {"error": "request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                self.stats["requests"] += 1
+                try:
+                    status, payload = 200, await self.dispatch(method, target, body)
+                except HTTPError as e:
+                    self.stats["errors"] += 1
+                    status, payload = e.status, {"error": e.message}
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    status, payload = 500, {"error": str(e)}
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive):
+        if isinstance(payload, str):
+            content_type = "text/plain; version=0.0.4"
+            body = payload.encode()
+        else:
+            content_type = "application/json"
+            body = json.dumps(payload).encode()
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                  413: "Payload Too Large", 500: "Internal Server Error"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\n"
+                     f"Content-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body)
+        await writer.drain()
+
+    async def serve(self, host="127.0.0.1", port=8036):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve campus routes, search and schedules over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8036)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes for Dijkstra and scheduling (0 runs them in this process)")
+    parser.add_argument("--cache-size", type=int, default=1024, help="shortest-path trees to keep")
+    parser.add_argument("--metrics", action="store_true", help="record hot-path metrics for GET /metrics (work done in worker processes is not included)")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        metrics.enable()
+
+    service = CampusService(args.workers, args.cache_size)
+    print(f"Serving on http://{args.host}:{args.port} with {service.workers} workers")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+# Main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Two-level routing for campuses mapped indoors (floors, stairwells, rooms).
+
+Indoor nodes carry a "building" attribute; everything else (paths, plazas,
+parking) is outdoors. A building's entrances are its nodes with an edge
+leaving the building. BuildingHierarchy precomputes, for every building,
+the shortest indoor walk between each pair of its entrances, and keeps an
+overlay graph of the outdoor nodes and all entrances in which each
+building is just a clique of those walks.
+
+A route then runs three small searches: inside the source building from
+the source to its entrances, across the overlay, and inside the target
+building from its entrances to the target. Rooms in every other building
+are never looked at, however many floors they have.
+"""
+import heapq
+
+
+def seeded_dijkstra(adjacency, seeds, stop=None):
+    """
+    Dijkstra over adjacency {node: [(neighbour, weight, via), ...]} from
+    seeds {node: distance}. Returns (dist, prev) dicts, prev[v] being
+    (previous node, via). With stop(node, distance) returning True the
+    search ends there
+    """
+    dist = dict(seeds)
+    prev = {}
+    pq = [(d, i, node) for i, (node, d) in enumerate(seeds.items())]
+    heapq.heapify(pq)
+    pushes = len(pq)
+    done = set()
+    while pq:
+        d, _, u = heapq.heappop(pq)
+        if u in done:
+            continue
+        done.add(u)
+        if stop is not None and stop(u, d):
+            break
+        for v, weight, via in adjacency.get(u, ()):
+            if d + weight < dist.get(v, float('inf')):
+                dist[v] = d + weight
+                prev[v] = (u, via)
+                heapq.heappush(pq, (dist[v], pushes, v))
+                pushes += 1
+    return dist, prev
+
+
+def unwind(prev, node):
+    """Path from a seed to node as a list of (node, via) steps, via being how node was reached"""
+    steps = []
+    while node in prev:
+        previous, via = prev[node]
+        steps.append((node, via))
+        node = previous
+    steps.append((node, None))
+    steps.reverse()
+    return steps
+
+
+class BuildingHierarchy:
+    """Entrance cliques per building plus the outdoor overlay; see the module docstring"""
+
+    def __init__(self, graph):
+        self.building_of = {node: data.get("building") for node, data in graph.nodes(data=True)}
+        self.indoor = {}     # building -> adjacency of its own nodes
+        self.entrances = {}  # building -> its entrances
+        self.overlay = {}    # outdoor nodes and entrances -> [(neighbour, weight, indoor path or None)]
+
+        for u, v, data in graph.edges(data=True):
+            weight = data.get('weight', 1)
+            bu, bv = self.building_of[u], self.building_of[v]
+            if bu is not None and bu == bv:
+                building = self.indoor.setdefault(bu, {})
+                building.setdefault(u, []).append((v, weight, None))
+                building.setdefault(v, []).append((u, weight, None))
+                continue
+            for a, b in ((u, v), (v, u)):
+                self.overlay.setdefault(a, []).append((b, weight, None))
+                if self.building_of[a] is not None:
+                    self.entrances.setdefault(self.building_of[a], set()).add(a)
+
+        # Each building becomes a clique of its entrances in the overlay
+        for building, entrances in self.entrances.items():
+            indoor = self.indoor.get(building, {})
+            for entrance in entrances:
+                dist, prev = seeded_dijkstra(indoor, {entrance: 0})
+                for other in entrances:
+                    if other != entrance and other in dist:
+                        walk = [node for node, _ in unwind(prev, other)]
+                        self.overlay[entrance].append((other, dist[other], walk))
+
+    def route(self, source, target):
+        """
+        Shortest (distance, path) from source to target, searching only the
+        two buildings involved and the overlay; (inf, []) when unreachable
+        """
+        inf = float('inf')
+        sb, tb = self.building_of[source], self.building_of[target]
+
+        # Source building: from the source out to its entrances
+        if sb is not None:
+            up_dist, up_prev = seeded_dijkstra(self.indoor.get(sb, {}), {source: 0})
+            seeds = {e: up_dist[e] for e in self.entrances.get(sb, ()) if e in up_dist}
+        else:
+            up_dist, up_prev = {source: 0}, {}
+            seeds = {source: 0}
+
+        # Target building: from its entrances in to the target (the graph is undirected)
+        if tb is not None:
+            down_dist, down_prev = seeded_dijkstra(self.indoor.get(tb, {}), {target: 0})
+            exits = {e: down_dist[e] for e in self.entrances.get(tb, ()) if e in down_dist}
+        else:
+            down_dist, down_prev = {target: 0}, {}
+            exits = {target: 0}
+
+        # Staying inside one building is a candidate too
+        best, meet = (up_dist.get(target, inf), None) if sb is not None and sb == tb else (inf, None)
+
+        def stop(node, d):
+            nonlocal best, meet
+            if d >= best:
+                return True
+            if node in exits and d + exits[node] < best:
+                best, meet = d + exits[node], node
+            return False
+
+        dist, prev = seeded_dijkstra(self.overlay, seeds, stop)
+        if best == inf:
+            return inf, []
+        if meet is None:
+            return best, [node for node, _ in unwind(up_prev, target)]
+
+        # Stitch: indoor walk out, overlay (unpacking cliques), indoor walk in
+        steps = unwind(prev, meet)
+        path = [node for node, _ in unwind(up_prev, steps[0][0])] if sb is not None else [source]
+        for node, via in steps[1:]:
+            path.extend(via[1:] if via else [node])
+        if tb is not None:
+            inward = [node for node, _ in unwind(down_prev, meet)]
+            inward.reverse()
+            path.extend(inward[1:])
+        return best, path
@@ -0,0 +1,176 @@
+class _Node:
+    __slots__ = ("key", "start", "end", "item", "left", "right", "height", "max_end")
+
+    def __init__(self, key, start, end, item):
+        self.key = key
+        self.start = start
+        self.end = end
+        self.item = item
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.max_end = end
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.max_end = node.end
+    if node.left and node.left.max_end > node.max_end:
+        node.max_end = node.left.max_end
+    if node.right and node.right.max_end > node.max_end:
+        node.max_end = node.right.max_end
+
+
+def _rotate_right(node):
+    top = node.left
+    node.left = top.right
+    top.right = node
+    _update(node)
+    _update(top)
+    return top
+
+
+def _rotate_left(node):
+    top = node.right
+    node.right = top.left
+    top.left = node
+    _update(node)
+    _update(top)
+    return top
+
+
+def _balance(node):
+    _update(node)
+    diff = _height(node.left) - _height(node.right)
+    if diff > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if diff < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class IntervalIndex:
+    """
+    Interval tree over task times: an AVL tree ordered by start time where
+    every node also stores the largest end time in its subtree. Insert and
+    remove are O(log n); overlap and free-time queries are O(log n + k).
+    Intervals are half-open, so a task ending at 1:00 does not overlap one
+    starting at 1:00 (the same rule the activity selector uses).
+    """
+
+    def __init__(self):
+        self._root = None
+        self._keys = {}  # id(item) -> key of its node
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        """Yields (start, end, item) in start-time order"""
+        stack = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.item
+            node = node.right
+
+    def insert(self, start, end, item):
+        """Adds an interval and returns the items it overlaps (found before inserting)"""
+        conflicts = self.overlaps(start, end)
+        self._counter += 1
+        key = (start, end, self._counter)
+        self._keys[id(item)] = key
+        self._root = self._insert(self._root, _Node(key, start, end, item))
+        return conflicts
+
+    def _insert(self, node, new):
+        if node is None:
+            return new
+        if new.key < node.key:
+            node.left = self._insert(node.left, new)
+        else:
+            node.right = self._insert(node.right, new)
+        return _balance(node)
+
+    def remove(self, item):
+        """Removes a previously inserted item; returns False if it is not in the index"""
+        key = self._keys.pop(id(item), None)
+        if key is None:
+            return False
+        self._root = self._remove(self._root, key)
+        return True
+
+    def _remove(self, node, key):
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = self._remove(node.left, key)
+        elif key > node.key:
+            node.right = self._remove(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Replace with the smallest node of the right subtree
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.key, node.start, node.end, node.item = (
+                successor.key, successor.start, successor.end, successor.item)
+            node.right = self._remove(node.right, successor.key)
+        return _balance(node)
+
+    def clear(self):
+        self._root = None
+        self._keys = {}
+
+    def overlaps(self, start, end):
+        """Items whose interval overlaps [start, end), in start-time order"""
+        found = []
+        self._collect(self._root, start, end, found)
+        return [item for _, _, item in found]
+
+    def _collect(self, node, start, end, found):
+        # Skip subtrees that end before the window or start after it
+        if node is None or node.max_end <= start:
+            return
+        self._collect(node.left, start, end, found)
+        if node.start >= end:
+            return
+        if node.end > start:
+            found.append((node.start, node.end, node.item))
+        self._collect(node.right, start, end, found)
+
+    def free_slots(self, start, end, keep=None):
+        """
+        Gaps inside [start, end) that no interval covers, as (start, end)
+        pairs. With keep, only intervals whose item passes keep(item) count,
+        e.g. the tasks that happen on one date
+        """
+        found = []
+        self._collect(self._root, start, end, found)
+        slots = []
+        cursor = start
+        for s, e, item in found:
+            if keep is not None and not keep(item):
+                continue
+            if s > cursor:
+                slots.append((cursor, s))
+            if e > cursor:
+                cursor = e
+        if cursor < end:
+            slots.append((cursor, end))
+        return slots
@@ -0,0 +1,216 @@
+"""
+Node positions for the campus map.
+
+campus_layout picks the cheapest layout that looks right:
+
+    real coordinates   every node has a "pos" attribute (e.g. from GPS)
+    spring layout      up to SPRING_LIMIT nodes; networkx's seed-42
+                       Fruchterman-Reingold, the map everyone knows
+    multilevel layout  bigger graphs; the graph is coarsened by merging
+                       matched neighbours until it is small, laid out, and
+                       then uncoarsened level by level, refining with a few
+                       force-directed steps on each
+
+The refinement steps compute repulsion with a Barnes-Hut style quadtree
+approximation in NumPy: far away nodes only act through the centroid of
+their quadtree cell, so a step costs O(n log n) instead of O(n^2).
+"""
+import math
+
+import numpy as np
+import networkx as nx
+
+SPRING_LIMIT = 500   # networkx needs scipy for spring_layout beyond this anyway
+COARSEST = 50        # stop coarsening at about this many nodes
+EXACT_LIMIT = 300    # below this many nodes repulsion is summed over all pairs
+LEAF_SIZE = 4        # average nodes per cell in the finest quadtree level
+
+
+def campus_layout(graph, seed=42, coordinates=True):
+    """Positions {node: (x, y)} for drawing graph; see the module docstring"""
+    if coordinates and graph.number_of_nodes() and all("pos" in data for _, data in graph.nodes(data=True)):
+        return {node: tuple(data["pos"]) for node, data in graph.nodes(data=True)}
+    if graph.number_of_nodes() <= SPRING_LIMIT:
+        return nx.spring_layout(graph, seed=seed, k=0.9)
+    return multilevel_layout(graph, seed)
+
+
+def multilevel_layout(graph, seed=42):
+    """Force-directed layout by multilevel coarsening, scaled to [-1, 1] like spring_layout"""
+    nodes = list(graph.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in graph.edges if u != v], dtype=np.int64).reshape(-1, 2)
+    rng = np.random.default_rng(seed)
+
+    # Coarsen: each level maps its nodes to the next (smaller) level's
+    levels = [(len(nodes), edges)]
+    parents = []
+    while levels[-1][0] > COARSEST:
+        n, level_edges = levels[-1]
+        parent, coarse_n = _match(n, level_edges, rng)
+        if coarse_n > 0.9 * n:
+            break  # barely shrinking (e.g. many isolated nodes); stop here
+        coarse_edges = np.unique(np.sort(parent[level_edges], axis=1), axis=0)
+        coarse_edges = coarse_edges[coarse_edges[:, 0] != coarse_edges[:, 1]]
+        parents.append(parent)
+        levels.append((coarse_n, coarse_edges))
+
+    # Lay out the coarsest graph from scratch, then refine on the way back up
+    n, level_edges = levels[-1]
+    k = 1 / math.sqrt(n)
+    pos = rng.random((n, 2))
+    # Hot and long, so the coarse shape does not settle folded over itself
+    pos = _refine(pos, level_edges, k, iterations=500, temperature=1.0)
+    for (n, level_edges), parent in zip(reversed(levels[:-1]), reversed(parents)):
+        k = 1 / math.sqrt(n)
+        # Children start at their parent's spot, nudged apart
+        pos = pos[parent] + rng.normal(scale=k * 0.1, size=(n, 2))
+        # Coarse levels settle the overall shape, so fine ones need fewer steps
+        pos = _refine(pos, level_edges, k, iterations=max(10, min(50, 50000 // n)), temperature=k * 2)
+
+    pos = _rescale(pos)
+    return {node: tuple(p) for node, p in zip(nodes, pos)}
+
+
+def _match(n, edges, rng):
+    """
+    Random maximal matching; matched pairs merge into one coarse node and
+    each unmatched node joins a neighbour's group, so stars shrink too.
+    Returns (parent of each node, number of coarse nodes)
+    """
+    both = np.concatenate([edges, edges[:, ::-1]])
+    order = np.argsort(both[:, 0], kind="stable")
+    targets = both[order, 1]
+    starts = np.searchsorted(both[order, 0], np.arange(n + 1))
+
+    mate = np.full(n, -1, dtype=np.int64)
+    for u in rng.permutation(n):
+        if mate[u] != -1:
+            continue
+        for v in targets[starts[u]:starts[u + 1]]:
+            if mate[v] == -1 and v != u:
+                mate[u], mate[v] = v, u
+                break
+
+    parent = np.full(n, -1, dtype=np.int64)
+    coarse_n = 0
+    for u in range(n):
+        if parent[u] == -1 and mate[u] != -1:
+            parent[u] = parent[mate[u]] = coarse_n
+            coarse_n += 1
+    for u in range(n):
+        if parent[u] == -1:
+            neighbours = targets[starts[u]:starts[u + 1]]
+            if len(neighbours):
+                parent[u] = parent[neighbours[0]]
+            else:
+                parent[u] = coarse_n
+                coarse_n += 1
+    return parent, coarse_n
+
+
+def _refine(pos, edges, k, iterations, temperature):
+    """Fruchterman-Reingold steps with linear cooling; repulsion is approximated on big graphs"""
+    for step in range(iterations):
+        if len(pos) <= EXACT_LIMIT:
+            disp = _exact_repulsion(pos, k)
+        else:
+            disp = _quadtree_repulsion(pos, k)
+        if len(edges):
+            # Attraction d^2/k along each edge
+            delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            pull = delta * (np.hypot(delta[:, 0], delta[:, 1]) / k)[:, None]
+            for axis in range(2):
+                disp[:, axis] -= np.bincount(edges[:, 0], pull[:, axis], len(pos))
+                disp[:, axis] += np.bincount(edges[:, 1], pull[:, axis], len(pos))
+        length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 1e-12)
+        limit = temperature * (1 - step / iterations)
+        pos = pos + disp * (np.minimum(length, limit) / length)[:, None]
+    return pos
+
+
+def _exact_repulsion(pos, k):
+    """Repulsion k^2/d between every pair of nodes"""
+    delta = pos[:, None, :] - pos[None, :, :]
+    d2 = np.maximum((delta ** 2).sum(axis=2), 1e-12)
+    np.fill_diagonal(d2, np.inf)
+    return (delta * (k * k / d2)[:, :, None]).sum(axis=1)
+
+
+def _quadtree_repulsion(pos, k):
+    """
+    Repulsion k^2/d approximated on a quadtree of square cells. On each
+    level a node feels the cells that are children of its parent cell's
+    neighbours but not neighbours of its own cell, each through the cell's
+    centroid and node count; those cells are well separated from it, and
+    every other node is covered exactly once, by a deeper level. On the
+    finest level the node's own and neighbouring cells act through their
+    centroids too, with the node itself taken out of its own cell.
+    """
+    n = len(pos)
+    lo = pos.min(axis=0)
+    span = max(float((pos.max(axis=0) - lo).max()), 1e-12)
+    unit = (pos - lo) / span
+    depth = max(1, math.ceil(math.log(n / LEAF_SIZE, 4)))
+    k2 = k * k
+    disp = np.zeros_like(pos)
+
+    for level in range(1, depth + 1):
+        g = 1 << level
+        cell = np.minimum((unit * g).astype(np.int64), g - 1)
+        key = cell[:, 0] * g + cell[:, 1]
+        count = np.bincount(key, minlength=g * g).astype(float)
+        sum_x = np.bincount(key, pos[:, 0], g * g)
+        sum_y = np.bincount(key, pos[:, 1], g * g)
+        parity = (cell[:, 0] & 1) * 2 + (cell[:, 1] & 1)
+
+        for px in (0, 1):
+            for py in (0, 1):
+                points = np.flatnonzero(parity == px * 2 + py)
+                if not len(points):
+                    continue
+                # One row per node, one column per cell it interacts with
+                offsets = _interaction_offsets(px, py, level == depth)
+                tx = cell[points, :1] + offsets[:, 0]
+                ty = cell[points, 1:] + offsets[:, 1]
+                inside = (tx >= 0) & (tx < g) & (ty >= 0) & (ty < g)
+                target = np.where(inside, tx * g + ty, 0)
+                mass = np.where(inside, count[target], 0.0)
+                sx, sy = sum_x[target], sum_y[target]
+                x, y = pos[points, :1], pos[points, 1:]
+                own = (offsets[:, 0] == 0) & (offsets[:, 1] == 0)
+                if own.any():
+                    mass[:, own] -= 1
+                    sx[:, own] -= x
+                    sy[:, own] -= y
+                safe = np.maximum(mass, 1)
+                dx = x - sx / safe
+                dy = y - sy / safe
+                f = np.where(mass > 0, k2 * mass / np.maximum(dx * dx + dy * dy, 1e-12), 0.0)
+                disp[points, 0] += (dx * f).sum(axis=1)
+                disp[points, 1] += (dy * f).sum(axis=1)
+    return disp
+
+
+_offsets = {}
+
+
+def _interaction_offsets(px, py, finest):
+    """
+    Cell offsets, from a cell whose coordinates have parities (px, py), to
+    the children of its parent's neighbours; the cell's own neighbours
+    (and itself) only on the finest level
+    """
+    offsets = _offsets.get((px, py, finest))
+    if offsets is None:
+        offsets = np.array([(dx, dy) for dx in range(-2 - px, 4 - px) for dy in range(-2 - py, 4 - py)
+                            if finest or abs(dx) > 1 or abs(dy) > 1], dtype=np.int64)
+        _offsets[(px, py, finest)] = offsets
+    return offsets
+
+
+def _rescale(pos, scale=1.0):
+    """Centers positions on the origin and scales the largest coordinate to scale"""
+    pos = pos - pos.mean(axis=0)
+    extent = np.abs(pos).max()
+    return pos * (scale / extent) if extent > 0 else pos
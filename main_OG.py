@@ -1,177 +1,61 @@
 import tkinter as tk
-from tkinter import ttk
-import networkx as nx
+from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
-import heapq
-import json
-from datetime import datetime
-
-#formatting time 
-def parse_time(time_str):
-    return datetime.strptime(time_str.strip(), "%I:%M %p").time()
-
-#loading json tasks
-def load_validate_tasks(filename, valid_locations):
-    with open(filename, "r") as f:
-        data = json.load(f)
-
-    parsed_tasks = []
-    for item in data:
-        title = item.get("title") or item.get("className") or item.get("taskName")
-        start_str = item["startTime"]
-        end_str = item["endTime"]
-        location = item["location"]
-        priority = item.get("priority", "Medium")
-
-        if location not in valid_locations:
-            print(f"invalid location '{location} for task '{title}")
-            continue
-
-        start = parse_time(start_str)
-        end = parse_time(end_str)
-
-        if end <= start:
-            print(f"End time must be after start time for task '{title}'")
-            continue
-
-        parsed_tasks.append({
-            "title": title,
-            "start": start,
-            "end" : end,
-            "location": location,
-            "priority" : priority
-        })
-    return parsed_tasks
-
-# Configure style settings
-MAIN_BG = "#F5F5F5"  # Main background color
-TITLE_COLOR = "#FF6600"  # Orange for titles
-BUTTON_BG = "#FFCC99"  # Light orange for buttons
-BUTTON_BG_HOVER = "#FFA64D"  # Darker orange for button hover
-DIJKSTRA_BUTTON_BG = "#99CCFF"  # Light blue for Dijkstra buttons
-DIJKSTRA_BUTTON_BG_HOVER = "#66B2FF"  # Darker blue for Dijkstra button hover
-SUCCESS_COLOR = "#008000"  # Green for success messages
-ERROR_COLOR = "#B22222"  # Red for error messages
-
-class CampusGraph:
-    """Class to handle campus graph data and algorithms"""
-    
-    def __init__(self):
-        self.graph = nx.Graph()
-        self.build_graph()
-    
-    def build_graph(self):
-        buildings = ['Pollak', 'TSU', 'SGMH', 'MH', 'ECS', 'SRC', 'LH', 'KHS']
-        edges = [
-            ('Pollak', 'TSU', 2), ('TSU', 'SRC', 3), ('TSU', 'MH', 4),
-            ('MH', 'LH', 5), ('LH', 'SGMH', 6), ('SGMH', 'Pollak', 7),
-            ('Pollak', 'ECS', 8), ('ECS', 'KHS', 9), ('KHS', 'SRC', 10),
-            ('SRC', 'KHS', 11), ('SRC', 'Pollak', 12), ('LH', 'Pollak', 13),
-            ('MH', 'Pollak', 14)
-        ]
-        for building in buildings:
-            self.graph.add_node(building)
-        for u, v, w in edges:
-            self.graph.add_edge(u, v, weight=w)
-    
-    def get_buildings(self):
-        return list(self.graph.nodes())
-    
-    def dijkstra(self, source, target):
-        """
-        Implements Dijkstra's algorithm to find the shortest path between two named nodes
-        Returns both the total distance and the complete path
-        """
-        name_to_index = {name: i for i, name in enumerate(self.graph.nodes)}
-        index_to_name = {i: name for name, i in name_to_index.items()}
-
-        n = len(self.graph.nodes)
-        graph_list = [[] for _ in range(n)]
-
-        for u, v, data in self.graph.edges(data=True):
-            u_idx = name_to_index[u]
-            v_idx = name_to_index[v]
-            weight = data.get('weight', 1)
-            graph_list[u_idx].append((v_idx, weight))
-            graph_list[v_idx].append((u_idx, weight))
-
-        # Initialize distances and previous node tracking
-        dist = [float('inf')] * n
-        prev = [None] * n
-        src_idx = name_to_index[source]
-        tgt_idx = name_to_index[target]
-        dist[src_idx] = 0
-        pq = [(0, src_idx)]  # Priority queue (distance, node)
-
-        # Main Dijkstra algorithm
-        while pq:
-            current_dist, u = heapq.heappop(pq)
-            if current_dist > dist[u]:
-                continue
-            for v, weight in graph_list[u]:
-                if dist[u] + weight < dist[v]:
-                    dist[v] = dist[u] + weight
-                    prev[v] = u
-                    heapq.heappush(pq, (dist[v], v))
-
-        # Reconstruct the path
-        path = []
-        current = tgt_idx
-        if prev[current] is not None or current == src_idx:
-            while current is not None:
-                path.append(index_to_name[current])
-                current = prev[current]
-        
-        path.reverse()
-        return dist[tgt_idx], path
-
-
-# KMP Search Algorithm
-def kmp_search(text, pattern):
-    def build_lps(pattern):
-        lps = [0] * len(pattern)
-        length = 0
-        i = 1
-        while i < len(pattern):
-            if pattern[i] == pattern[length]:
-                length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length-1]
-                else:
-                    lps[i] = 0
-                    i += 1
-        return lps
-
-    lps = build_lps(pattern)
-    i = j = 0
-    while i < len(text):
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-        if j == len(pattern):
-            return i - j
-        elif i < len(text) and pattern[j] != text[i]:
-            if j != 0:
-                j = lps[j-1]
-            else:
-                i += 1
-    return -1
-
+import time
+import metrics
+from campus_core import CampusGraph, MapView, kmp_search
+from layout import campus_layout
+from scheduling import IncrementalSchedule, task_weight
+from task_loader import parse_time, load_validate_tasks, LoadReport
+from interval_index import IntervalIndex
+from recurrence import CalendarScheduler, parse_days, format_days, may_coincide, occurs_on
+from datetime import date, timedelta
+from background import BackgroundWorker
+from profiling import ActionProfiler, NULL_SESSION, format_summary
+from themes import Theme, available_themes, load_theme
 
 class SmartCampusNavigator:
-    def __init__(self, root):
+    """
+    The navigator window. All three editions are this class; the theme
+    (a name or a loaded Theme) only decides colors, fonts, texts and buttons
+    """
+
+    def __init__(self, root, theme="classic", profile=False):
         self.root = root
-        self.root.title("CSUF Smart Campus Navigator")
-        self.root.geometry("800x600")
-        self.root.configure(bg=MAIN_BG)
+        self.theme = theme if isinstance(theme, Theme) else load_theme(theme)
+        self.root.title(self.theme.window_title)
+        self.root.geometry(self.theme.geometry)
+        self.root.configure(bg=self.theme.colors["window"])
+        self.theme.configure_styles(root)
         
         # Initialize campus graph
         self.campus = CampusGraph()
         self.highlighted_building = None
         self.current_path = None
+        self.current_distance = None
+        self.map_pos = None  # layout of the campus graph, computed on the first map
+        self.map_views = []  # open map windows
+        
+        # Slow work runs on background threads; the bar shows while it does
+        self.busy_bar = ttk.Progressbar(root, mode="indeterminate", length=150)
+        self.worker = BackgroundWorker(root, on_busy=self.set_busy, on_error=self.show_error)
+        
+        # Per-action CPU and allocation profiling, shown on the Diagnostics tab
+        self.profiler = ActionProfiler(on_report=self.add_report)
+        
+        # Optional title above the tabs and status bar below them
+        if self.theme.header is not None:
+            title_text, subtitle_text = self.theme.header
+            title_frame = self.frame(root)
+            title_frame.pack(fill=tk.X, pady=(20, 10))
+            self.label(title_frame, title_text, "header", "header").pack()
+            self.label(title_frame, subtitle_text, "subtitle", "subtitle").pack()
+        self.status_bar = None
+        if self.theme.status_bar:
+            self.status_bar = tk.Label(root, text=self.theme.text("ready"), bd=1, relief=tk.SUNKEN, anchor=tk.W,
+                                       bg=self.theme.colors["panel"], fg=self.theme.colors["status"],
+                                       font=self.theme.fonts["small"])
+            self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Create notebook for tabs
         self.notebook = ttk.Notebook(root)
@@ -182,110 +66,174 @@ class SmartCampusNavigator:
         self.search_frame = ttk.Frame(self.notebook)
         self.dijkstra_frame = ttk.Frame(self.notebook)
         self.activity_frame = ttk.Frame(self.notebook)
+        self.diagnostics_frame = ttk.Frame(self.notebook)
         
         # Add frames to notebook
-        self.notebook.add(self.home_frame, text="Home")
-        self.notebook.add(self.search_frame, text="Search Buildings")
-        self.notebook.add(self.dijkstra_frame, text="Find Shortest Path")
-        self.notebook.add(self.activity_frame, text="Create a Schedule")
+        tabs = self.theme.tabs
+        self.notebook.add(self.home_frame, text=tabs["home"])
+        self.notebook.add(self.search_frame, text=tabs["search"])
+        self.notebook.add(self.dijkstra_frame, text=tabs["path"])
+        self.notebook.add(self.activity_frame, text=tabs["schedule"])
+        self.notebook.add(self.diagnostics_frame, text=tabs["diagnostics"])
         
         # Setup all tabs
         self.setup_home_tab()
         self.setup_search_tab()
         self.setup_dijkstra_tab()
         self.setup_activity_tab()
+        self.setup_diagnostics_tab()
+        if profile:
+            self.profile_var.set(True)
+            self.toggle_profiling()
+
+    def label(self, master, text="", font="body", color="text", **kwargs):
+        """A tk.Label in one of the theme's fonts and colors"""
+        if self.theme.colors["bg"] is not None:
+            kwargs.setdefault("bg", self.theme.colors["bg"])
+        return tk.Label(master, text=text, font=self.theme.fonts[font], fg=self.theme.colors[color], **kwargs)
+
+    def frame(self, master):
+        if self.theme.colors["bg"] is None:
+            return ttk.Frame(master)
+        return tk.Frame(master, bg=self.theme.colors["bg"])
+
+    def result_panel(self, master, header_key):
+        """
+        Where a tab shows its results: with the theme's RESULT_PANELS a
+        bordered panel under a header, else master itself. Returns the
+        parent and the extra options that labels placed in it need when
+        created and when packed
+        """
+        if not self.theme.result_panels:
+            return master, {}, {}
+        colors = self.theme.colors
+        panel = tk.Frame(master, bg=colors["panel"], bd=1, relief="solid")
+        panel.pack(fill=tk.X, padx=20, pady=10)
+        header_color = "panel_header" if "panel_header" in colors else "muted"
+        self.label(panel, self.theme.text(header_key), "small", header_color,
+                   bg=colors["panel"], anchor=tk.W).pack(fill=tk.X, padx=10, pady=5)
+        return panel, {"bg": colors["panel"], "anchor": tk.W}, {"fill": tk.X, "padx": 10}
+
+    def set_status(self, key, **values):
+        if self.status_bar is not None:
+            self.status_bar.config(text=self.theme.text(key, **values))
+
+    def show_error(self, error):
+        """Reports a failed background request that has nothing better to do with it"""
+        self.set_status("task_failed", error=error)
+        messagebox.showerror(self.theme.window_title, self.theme.text("task_failed", error=error))
+
+    def set_busy(self, busy):
+        if busy:
+            self.busy_bar.pack(side=tk.BOTTOM, anchor=tk.E, padx=10, pady=(0, 5))
+            self.busy_bar.start(15)
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.pack_forget()
+
+    def setup_diagnostics_tab(self):
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.diagnostics_frame, text="Profile actions (CPU and memory)",
+                        variable=self.profile_var, command=self.toggle_profiling).pack(anchor=tk.W, padx=10, pady=10)
+        self.label(self.diagnostics_frame, f"Reports are saved to {self.profiler.directory}/",
+                   "small").pack(anchor=tk.W, padx=10)
+
+        self.report_list = tk.Listbox(self.diagnostics_frame, height=6, font=self.theme.fonts["small"])
+        self.report_list.pack(fill=tk.X, padx=10, pady=5)
+        self.report_list.bind("<<ListboxSelect>>", lambda event: self.show_report())
+
+        self.report_text = tk.Text(self.diagnostics_frame, height=18, font=self.theme.fonts["mono"])
+        self.report_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    def toggle_profiling(self):
+        if self.profile_var.get():
+            self.profiler.enable()
+        else:
+            self.profiler.disable()
+
+    def add_report(self, summary):
+        self.report_list.insert(tk.END, f"{summary['time']}  {summary['action']}  "
+                                        f"{summary['wall'] * 1000:.1f} ms")
+        self.report_list.selection_clear(0, tk.END)
+        self.report_list.selection_set(tk.END)
+        self.show_report()
+
+    def show_report(self):
+        selection = self.report_list.curselection()
+        if not selection:
+            return
+        summary = self.profiler.reports[selection[0]]
+        self.report_text.delete("1.0", tk.END)
+        self.report_text.insert(tk.END, format_summary(summary) + f"\nSaved to {summary['report']}\n")
 
     def setup_home_tab(self):
         # Create and place widgets for the home tab
-        title = tk.Label(self.home_frame, text="CSUF Smart Campus Navigator", 
-                        font=("Helvetica", 16, "bold"), fg=TITLE_COLOR)
+        title = self.label(self.home_frame, self.theme.text("home_title"), "title", "title")
         title.pack(pady=30)
         
-        welcome_text = """Welcome to the CSUF Smart Campus Navigator!
-        
-        This application helps you navigate around the CSUF campus.
-        
-        Features:
-        • Search for buildings
-        • View the campus map
-        • Find the shortest path between buildings
-        • Create an ideal schedule
-        
-        Select a tab above to get started.
-        """
-        
-        welcome = tk.Label(self.home_frame, text=welcome_text, 
-                          font=("Helvetica", 12), justify=tk.LEFT)
+        welcome = self.label(self.home_frame, self.theme.home_text, justify=tk.LEFT)
         welcome.pack(pady=20)
         
         # Add map button to home tab
-        map_btn = tk.Button(self.home_frame, text="Show Campus Map", 
-                           font=("Helvetica", 12), bg=BUTTON_BG, fg="black", 
-                           relief="raised", bd=3, command=lambda: self.show_map())
+        map_btn = self.theme.make_button(self.home_frame, text=self.theme.text("map_button"),
+                                         command=lambda: self.show_map())
         map_btn.pack(pady=20, ipadx=20, ipady=10)
-        
-        # Configure button hover effects
-        map_btn.bind("<Enter>", lambda e: map_btn.config(bg=BUTTON_BG_HOVER))
-        map_btn.bind("<Leave>", lambda e: map_btn.config(bg=BUTTON_BG))
 
     def setup_search_tab(self):
         # Create and place widgets for the search tab
-        title = tk.Label(self.search_frame, text="Search Buildings", 
-                        font=("Helvetica", 16, "bold"), fg=TITLE_COLOR)
+        title = self.label(self.search_frame, self.theme.text("search_title"), "title", "title")
         title.pack(pady=20)
         
-        instruction = tk.Label(self.search_frame, 
-                              text="Enter the name of the building to search:", 
-                              font=("Helvetica", 12))
+        instruction = self.label(self.search_frame, self.theme.text("search_prompt"))
         instruction.pack(pady=10)
         
         # Search entry and button frame
-        search_frame = ttk.Frame(self.search_frame)
+        search_frame = self.frame(self.search_frame)
         search_frame.pack(pady=10)
         
-        self.search_entry = tk.Entry(search_frame, font=("Helvetica", 12), width=25)
+        self.search_entry = tk.Entry(search_frame, font=self.theme.fonts["body"], width=25,
+                                     bg=self.theme.colors["entry_bg"], fg=self.theme.colors["entry_fg"],
+                                     insertbackground=self.theme.colors["entry_fg"])
         self.search_entry.pack(side=tk.LEFT, padx=5)
         
-        search_btn = tk.Button(search_frame, text="Search", font=("Helvetica", 12), 
-                              bg=BUTTON_BG_HOVER, fg="white", command=self.search_building)
+        search_btn = self.theme.make_button(search_frame, "search", text=self.theme.text("search_button"),
+                                            command=self.search_building)
         search_btn.pack(side=tk.LEFT, padx=5)
         
-        # Configure button hover effects
-        search_btn.bind("<Enter>", lambda e: search_btn.config(bg=BUTTON_BG_HOVER))
-        search_btn.bind("<Leave>", lambda e: search_btn.config(bg=BUTTON_BG_HOVER))
-        
         # Result display
-        self.search_result = tk.Label(self.search_frame, text="", 
-                                     font=("Helvetica", 14), fg=SUCCESS_COLOR)
-        self.search_result.pack(pady=20)
+        results, options, placement = self.result_panel(self.search_frame, "search_results_header")
+        self.search_result = self.label(results, self.theme.text("search_waiting"), "result", "success", **options)
+        self.search_result.pack(pady=20, **placement)
         
         # Show on map button (initially disabled)
-        self.show_on_map_btn = tk.Button(self.search_frame, text="Show on Map", 
-                                        font=("Helvetica", 12), bg=BUTTON_BG, 
-                                        fg="black", relief="raised", bd=3, state=tk.DISABLED, 
-                                        command=lambda: self.show_map())
+        self.show_on_map_btn = self.theme.make_button(self.search_frame, text=self.theme.text("show_on_map"),
+                                                      state=tk.DISABLED, command=lambda: self.show_map())
         self.show_on_map_btn.pack(pady=10)
-        
-        # Configure button hover effects
-        self.show_on_map_btn.bind("<Enter>", lambda e: self.show_on_map_btn.config(bg=BUTTON_BG_HOVER))
-        self.show_on_map_btn.bind("<Leave>", lambda e: self.show_on_map_btn.config(bg=BUTTON_BG))
+        if self.theme.reset_buttons:
+            self.theme.make_button(self.search_frame, "secondary", text=self.theme.text("reset_button"),
+                                   command=self.reset_search).pack(pady=5)
 
     def setup_dijkstra_tab(self):
         # Create and place widgets for the Dijkstra tab
-        title = tk.Label(self.dijkstra_frame, text="Find Shortest Path", 
-                        font=("Helvetica", 16, "bold"), fg=TITLE_COLOR)
+        title = self.label(self.dijkstra_frame, self.theme.text("path_title"), "title", "title")
         title.pack(pady=20)
         
+        if self.theme.text("path_prompt"):
+            self.label(self.dijkstra_frame, self.theme.text("path_prompt")).pack(pady=10)
+        
         # Start and end selection
         selection_frame = ttk.Frame(self.dijkstra_frame)
         selection_frame.pack(pady=10)
         
-        ttk.Label(selection_frame, text="Start: ").grid(row=0, column=0, padx=5, pady=5)
-        ttk.Label(selection_frame, text="End: ").grid(row=1, column=0, padx=5, pady=5)
+        ttk.Label(selection_frame, text=self.theme.text("start_label")).grid(row=0, column=0, padx=5, pady=5)
+        ttk.Label(selection_frame, text=self.theme.text("end_label")).grid(row=1, column=0, padx=5, pady=5)
         
         buildings = self.campus.get_buildings()
         self.start_var = tk.StringVar()
         self.end_var = tk.StringVar()
+        # A new selection makes any path still being computed stale
+        self.start_var.trace_add("write", lambda *args: self.worker.cancel("path"))
+        self.end_var.trace_add("write", lambda *args: self.worker.cancel("path"))
         
         start_combo = ttk.Combobox(selection_frame, textvariable=self.start_var, 
                                   values=buildings, width=20)
@@ -296,43 +244,55 @@ class SmartCampusNavigator:
         end_combo.grid(row=1, column=1, padx=5, pady=5)
         
         # Calculate button
-        calc_btn = tk.Button(self.dijkstra_frame, text="Blammo - Show Distance", 
-                            font=("Helvetica", 12, "bold"), bg=DIJKSTRA_BUTTON_BG, fg="black", 
-                            relief="raised", bd=3, command=self.calculate_path)
+        calc_btn = self.theme.make_button(self.dijkstra_frame, "path", text=self.theme.text("path_button"),
+                                          command=self.calculate_path)
         calc_btn.pack(pady=15)
         
-        # Configure button hover effects
-        calc_btn.bind("<Enter>", lambda e: calc_btn.config(bg=DIJKSTRA_BUTTON_BG_HOVER))
-        calc_btn.bind("<Leave>", lambda e: calc_btn.config(bg=DIJKSTRA_BUTTON_BG))
-        
         # Display result
-        self.path_result = tk.Label(self.dijkstra_frame, text="", 
-                                   font=("Helvetica", 14))
-        self.path_result.pack(pady=10)
+        results, options, placement = self.result_panel(self.dijkstra_frame, "path_results_header")
+        self.path_result = self.label(results, self.theme.text("path_waiting"), "result", **options)
+        self.path_result.pack(pady=10, **placement)
         
         # Path details
-        self.path_details = tk.Label(self.dijkstra_frame, text="", 
-                                    font=("Helvetica", 12))
-        self.path_details.pack(pady=5)
+        self.path_details = self.label(results, "", **options)
+        self.path_details.pack(pady=5, **placement)
         
         # Show on map button (initially disabled)
-        self.show_path_btn = tk.Button(self.dijkstra_frame, text="Show Path on Map", 
-                                      font=("Helvetica", 12), bg=DIJKSTRA_BUTTON_BG, 
-                                      relief="raised", bd=3, state=tk.DISABLED, 
-                                      command=lambda: self.show_map(True))
+        self.show_path_btn = self.theme.make_button(self.dijkstra_frame, "path", text=self.theme.text("show_path"),
+                                                    state=tk.DISABLED, command=lambda: self.show_map(True))
         self.show_path_btn.pack(pady=10)
-        
-        # Configure button hover effects
-        self.show_path_btn.bind("<Enter>", lambda e: self.show_path_btn.config(bg=DIJKSTRA_BUTTON_BG_HOVER))
-        self.show_path_btn.bind("<Leave>", lambda e: self.show_path_btn.config(bg=DIJKSTRA_BUTTON_BG))
+
+        # Animated playback of the route, for kiosk displays
+        self.play_path_btn = self.theme.make_button(self.dijkstra_frame, "secondary", text=self.theme.text("play_path"),
+                                                    state=tk.DISABLED, command=lambda: self.show_map(True, True))
+        self.play_path_btn.pack(pady=5)
+        if self.theme.reset_buttons:
+            self.theme.make_button(self.dijkstra_frame, "secondary", text=self.theme.text("reset_button"),
+                                   command=self.reset_path_calc).pack(pady=5)
+
+    def reset_search(self):
+        """Clears the search result"""
+        self.worker.cancel("search")
+        self.search_entry.delete(0, tk.END)
+        self.search_result.config(text=self.theme.text("search_waiting"), fg=self.theme.colors["success"])
+        self.show_on_map_btn.config(state=tk.DISABLED)
+        self.highlighted_building = None
+        self.set_status("status_search_reset")
+
+    def reset_path_calc(self):
+        """Reset the path calculation fields"""
+        # Clearing the selection also supersedes a path still being computed
+        self.start_var.set("")
+        self.end_var.set("")
+        self.path_result.config(text=self.theme.text("path_waiting"), fg=self.theme.colors["text"])
+        self.path_details.config(text="")
+        self.show_path_btn.config(state=tk.DISABLED)
+        self.play_path_btn.config(state=tk.DISABLED)
+        self.current_path = None
+        self.set_status("status_path_reset")
     
     def setup_activity_tab(self):
-        self.error_label = tk.Label(
-        self.activity_frame,
-        text="",
-        fg=ERROR_COLOR,
-        font=("Helvetica", 10, "italic")
-    )
+        self.error_label = self.label(self.activity_frame, "", "italic", "error")
         self.error_label.grid(row=9, column=0, columnspan=2, pady=5)
         #checkbox to load json file
         self.use_json_var = tk.BooleanVar(value=False)
@@ -345,22 +305,26 @@ class SmartCampusNavigator:
         load_json_checkbox.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
 
         # Title
-        title = tk.Label(self.activity_frame, text="Create a Schedule",
-                        font=("Helvetica", 16, "bold"), fg=TITLE_COLOR)
+        title = self.label(self.activity_frame, self.theme.text("schedule_title"), "title", "title")
         title.grid(row=1, column=0, columnspan=2, pady=10)
 
         # Task list display
         task_list_frame = ttk.LabelFrame(self.activity_frame, text="Added Classes/Tasks")
         task_list_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", pady=10)
 
-        task_list = tk.Listbox(task_list_frame, width=70, height=9, font=("Helvetica", 10))
+        task_list = tk.Listbox(task_list_frame, width=70, height=9, font=self.theme.fonts["small"])
         task_list.grid(row=0, column=0, padx=5, pady=5)
 
         # Load tasks if JSON is selected
         self.tasks = []
+        self.tasks_version = 0
+        self.task_index = IntervalIndex()
         if self.use_json_var.get():
-            self.tasks = load_validate_tasks("tasks.json", self.campus.get_buildings())
+            report = LoadReport()
+            self.tasks = load_validate_tasks("tasks.json", self.campus.get_buildings(), report)
+            self.error_label.config(text=report.summary())
             for task in self.tasks:
+                self.task_index.insert(task["start"], task["end"], task)
                 task_list.insert(tk.END, f"• [{task['priority']}] {task['title']} @ {task['location']} ({task['start']} - {task['end']})")
 
         # Input section
@@ -386,6 +350,10 @@ class SmartCampusNavigator:
         priority_dropdown.grid(row=7, column=1, padx=5, pady=2)
         priority_dropdown.set("Medium")
 
+        ttk.Label(self.activity_frame, text="Days (e.g. MWF, TTh):").grid(row=3, column=2, sticky="e", padx=5, pady=2)
+        days_entry = ttk.Entry(self.activity_frame, width=10)
+        days_entry.grid(row=3, column=3, padx=5, pady=2)
+
         # Submit Task
         def submit_task():
             class_name = class_name_entry.get()
@@ -393,11 +361,20 @@ class SmartCampusNavigator:
             end_time = end_time_entry.get()
             building = building_entry.get()
             priority = priority_var.get()
+            days_text = days_entry.get().strip()
 
             if building not in self.campus.get_buildings():
                 self.error_label.config(text="Invalid building name. Please enter a valid CSUF building.")
                 return
 
+            days = None
+            if days_text:
+                try:
+                    days = parse_days(days_text)
+                except ValueError:
+                    self.error_label.config(text="Invalid days. Use letters like MWF or TTh.")
+                    return
+
             try:
                 start = parse_time(start_time)
                 end = parse_time(end_time)
@@ -410,16 +387,29 @@ class SmartCampusNavigator:
                         "priority" : priority
 
                     }
+                    if days is not None:
+                        task["days"] = days
                     self.tasks.append(task)
+                    conflicts = [c for c in self.task_index.insert(start, end, task) if may_coincide(c, task)]
+                    self.tasks_version += 1
+                    self.schedule.add(task)
+                    self.refresh_schedule()
                     start_str = start.strftime("%I:%M %p")
                     end_str = end.strftime("%I:%M %p")
-                    task_list.insert(tk.END, f"• {class_name} @ {building} ({start_str} - {end_str}) with {priority} priority")
+                    days_str = f" on {format_days(days)}" if days is not None else ""
+                    task_list.insert(tk.END, f"• {class_name} @ {building} ({start_str} - {end_str}){days_str} with {priority} priority")
+                    if conflicts:
+                        titles = ", ".join(conflict["title"] for conflict in conflicts)
+                        self.error_label.config(text=f"Warning: {class_name} overlaps with {titles}.")
+                    else:
+                        self.error_label.config(text="")
 
                     # Clear inputs
                     class_name_entry.delete(0, tk.END)
                     start_time_entry.delete(0, tk.END)
                     end_time_entry.delete(0, tk.END)
                     building_entry.delete(0, tk.END)
+                    days_entry.delete(0, tk.END)
                 else:
                     self.error_label.config(text="End time must be after start time.")
             except ValueError:
@@ -427,179 +417,383 @@ class SmartCampusNavigator:
 
         submit_btn = ttk.Button(self.activity_frame, text="Submit Task", command=submit_task)
         submit_btn.grid(row=8, column=2, columnspan=2, pady=10)
+
+        # Remove the selected task
+        def remove_task():
+            selection = task_list.curselection()
+            if not selection:
+                self.error_label.config(text="Select a task to remove.")
+                return
+            i = selection[0]
+            task = self.tasks.pop(i)
+            self.task_index.remove(task)
+            self.tasks_version += 1
+            self.schedule.remove(task)
+            task_list.delete(i)
+            self.error_label.config(text="")
+            self.refresh_schedule()
+
+        remove_btn = ttk.Button(self.activity_frame, text="Remove Selected", command=remove_task)
+        remove_btn.grid(row=2, column=2, sticky="n", pady=10)
+
+        # Free time between the start and end times typed above, today or on the
+        # days typed above (this week); only tasks that happen on a date block it
+        def find_free_time():
+            try:
+                start = parse_time(start_time_entry.get())
+                end = parse_time(end_time_entry.get())
+            except ValueError:
+                self.error_label.config(text="Enter a start and end time to search for free time.")
+                return
+            today = date.today()
+            days_text = days_entry.get().strip()
+            if days_text:
+                try:
+                    days = parse_days(days_text)
+                except ValueError:
+                    self.error_label.config(text="Invalid days. Use letters like MWF or TTh.")
+                    return
+                monday = today - timedelta(days=today.weekday())
+                dates = [monday + timedelta(days=d) for d in sorted(days)]
+            else:
+                dates = [today]
+
+            lines = []
+            for day in dates:
+                slots = self.task_index.free_slots(start, end, keep=lambda task: occurs_on(task, day))
+                if slots:
+                    text = ", ".join(f"{s.strftime('%I:%M %p')} - {e.strftime('%I:%M %p')}" for s, e in slots)
+                else:
+                    text = "no free time in that range"
+                name = "today" if day == today else day.strftime("%a %b %d")
+                lines.append(f"Free {name}: {text}")
+            self.error_label.config(text="")
+            self.free_time_label.config(text="\n".join(lines))
+
+        free_btn = ttk.Button(self.activity_frame, text="Find Free Time", command=find_free_time)
+        free_btn.grid(row=14, column=1, sticky="w", pady=5)
+        self.free_time_label = self.label(self.activity_frame, "", "small", "success",
+                                          wraplength=500, justify=tk.LEFT)
+        self.free_time_label.grid(row=15, column=0, columnspan=3, pady=5)
+
+        self.setup_schedule_controls()
+        self.schedule.set_tasks(self.tasks)
     
     def reload_tasks(self, task_list):
         task_list.delete(0, tk.END)
         self.tasks = []
+        self.tasks_version += 1
+        self.task_index.clear()
+        self.schedule.set_tasks(self.tasks)
         if self.use_json_var.get():
-            self.tasks = load_validate_tasks("tasks.json", self.campus.get_buildings())
-            for task in self.tasks:
-                start_str = task['start'].strftime("%I:%M %p")
-                end_str = task['end'].strftime("%I:%M %p")
-                priority = task.get('priority', 'Medium')
-                display = f"• {task['title']} @ {task['location']} ({start_str} - {end_str} with {priority} priority)"
-                task_list.insert(tk.END, display)
-
-
-        #suggesting schedule, implementing activity algorithm
-        def activity_selector():
-            mode = self.schedule_mode.get()
-            if mode == "priority":
-                priority_order = {"High": 0, "Medium": 1, "Low": 2}
-                sorted_tasks = sorted(self.tasks, key=lambda x: (priority_order[x["priority"]], x["end"]))
-            else:  # sorts by end time
-                sorted_tasks = sorted(self.tasks, key=lambda x: x["end"])
-
-            result = []
-            last_end = None
-
-            for task in sorted_tasks:
-                if last_end is None or task["start"] >= last_end:
-                    result.append(task)
-                    last_end = task["end"]
-
-            result_win = tk.Toplevel(self.activity_frame)
-            result_win.title("Recommended Schedule")
-
-            tk.Label(result_win, text="Recommended Schedule", font=("Helvetica", 14, "bold")).pack(pady=10)
+            # Large task files load on a worker thread
+            report = LoadReport()
+            self.error_label.config(text="Loading tasks.json...")
+            self.worker.submit("tasks", load_validate_tasks, "tasks.json", self.campus.get_buildings(), report,
+                               on_done=lambda tasks: self.add_loaded_tasks(task_list, tasks, report),
+                               on_error=lambda e: self.error_label.config(text=f"Could not load tasks.json: {e}"))
+        else:
+            self.worker.cancel("tasks")
+            self.error_label.config(text="")
+        self.refresh_schedule()
+
+    def add_loaded_tasks(self, task_list, tasks, report):
+        self.error_label.config(text=report.summary())
+        for task in tasks:
+            self.task_index.insert(task["start"], task["end"], task)
+            start_str = task['start'].strftime("%I:%M %p")
+            end_str = task['end'].strftime("%I:%M %p")
+            priority = task.get('priority', 'Medium')
+            days_str = f" on {format_days(task['days'])}" if "days" in task else ""
+            display = f"• {task['title']} @ {task['location']} ({start_str} - {end_str}{days_str} with {priority} priority)"
+            task_list.insert(tk.END, display)
+        self.tasks.extend(tasks)
+        self.tasks_version += 1
+        self.schedule.set_tasks(self.tasks)
+        self.refresh_schedule()
+
+    def setup_schedule_controls(self):
+        # The selector keeps its sorted order and results between runs
+        self.schedule = IncrementalSchedule()
+        self.schedule_win = None
+        self.schedule_mode = tk.StringVar(value="end_time")
 
-            result_box = tk.Listbox(result_win, width=50, height=10, font=("Helvetica", 10))
-            result_box.pack(padx=10, pady=10)
+        ttk.Label(self.activity_frame, text="Schedule by:").grid(row=10, column=0, sticky="e", padx=5)
 
+        ttk.Radiobutton(self.activity_frame, text="End Time", variable=self.schedule_mode, value="end_time", command=self.refresh_schedule).grid(row=10, column=1, sticky="w")
+        ttk.Radiobutton(self.activity_frame, text="Priority", variable=self.schedule_mode, value="priority", command=self.refresh_schedule).grid(row=11, column=1, sticky="w")
+        ttk.Radiobutton(self.activity_frame, text="Max Priority Value", variable=self.schedule_mode, value="weighted", command=self.refresh_schedule).grid(row=12, column=1, sticky="w")
+        self.travel_time_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.activity_frame, text="Leave time to walk between buildings", variable=self.travel_time_var, command=self.refresh_schedule).grid(row=13, column=1, sticky="w")
+        suggest_btn = ttk.Button(self.activity_frame, text="Suggest Schedule", command=self.show_schedule)
+        suggest_btn.grid(row=8, column=1, columnspan=2, pady=5)
+        week_btn = ttk.Button(self.activity_frame, text="Weekly Schedule", command=self.show_week)
+        week_btn.grid(row=14, column=2, sticky="w", pady=5)
+
+    #suggesting schedule, implementing activity algorithm
+    def show_schedule(self):
+        if self.schedule_win is None:
+            self.schedule_win = tk.Toplevel(self.activity_frame)
+            self.schedule_win.title("Recommended Schedule")
+            self.schedule_win.protocol("WM_DELETE_WINDOW", self.close_schedule)
+
+            tk.Label(self.schedule_win, text="Recommended Schedule", font=self.theme.fonts["heading"]).pack(pady=10)
+            self.schedule_total = tk.Label(self.schedule_win, text="", font=self.theme.fonts["small"])
+            self.schedule_total.pack()
+
+            self.schedule_box = tk.Listbox(self.schedule_win, width=50, height=10, font=self.theme.fonts["small"])
+            self.schedule_box.pack(padx=10, pady=10)
+        else:
+            self.schedule_win.lift()
+        self.refresh_schedule(self.profiler.session("suggest_schedule"))
+
+    def show_week(self):
+        """Recommended schedule for each day of the current week, honoring each task's days"""
+        mode = self.schedule_mode.get()
+        travel = self.travel_time_var.get()
+        tasks = list(self.tasks)
+        monday = date.today() - timedelta(days=date.today().weekday())
+
+        def build_week():
+            distances = self.campus.walking_times() if travel else None
+            calendar = CalendarScheduler(tasks, mode, distances)
+            return list(calendar.iter_schedule(monday, monday + timedelta(days=6)))
+
+        self.worker.submit("week", build_week, on_done=self.show_week_window, on_error=self.show_error)
+
+    def show_week_window(self, week):
+        week_win = tk.Toplevel(self.activity_frame)
+        week_win.title("Weekly Schedule")
+        tk.Label(week_win, text="Weekly Schedule", font=self.theme.fonts["heading"]).pack(pady=10)
+
+        week_box = tk.Listbox(week_win, width=60, height=20, font=self.theme.fonts["small"])
+        week_box.pack(padx=10, pady=10)
+
+        for day, result in week:
+            week_box.insert(tk.END, day.strftime("%A %m/%d"))
+            if not result:
+                week_box.insert(tk.END, "    (nothing scheduled)")
             for task in result:
                 start_str = task['start'].strftime("%I:%M %p")
                 end_str = task['end'].strftime("%I:%M %p")
-                result_box.insert(tk.END, f"• {task['title']} @ {task['location']} ({start_str} - {end_str})")
+                week_box.insert(tk.END, f"    • {task['title']} @ {task['location']} ({start_str} - {end_str})")
 
-        self.schedule_mode = tk.StringVar(value="end_time")
+    def close_schedule(self):
+        self.schedule_win.destroy()
+        self.schedule_win = None
 
-        ttk.Label(self.activity_frame, text="Schedule by:").grid(row=10, column=0, sticky="e", padx=5)
+    def refresh_schedule(self, session=NULL_SESSION):
+        """Brings the selection up to date and redraws the schedule window if it is open"""
+        if self.schedule_win is None:
+            return
+        mode = self.schedule_mode.get()
+        travel = self.travel_time_var.get()
 
-        ttk.Radiobutton(self.activity_frame, text="End Time", variable=self.schedule_mode, value="end_time").grid(row=10, column=1, sticky="w")
-        ttk.Radiobutton(self.activity_frame, text="Priority", variable=self.schedule_mode, value="priority").grid(row=11, column=1, sticky="w")
-        suggest_btn = ttk.Button(self.activity_frame, text="Suggest Schedule", command=activity_selector)
-        suggest_btn.grid(row=8, column=1, columnspan=2, pady=5)
+        if mode == self.schedule.mode and travel == (self.schedule.distances is not None) and self.schedule.incremental:
+            session.run(lambda: self.render_schedule(self.schedule.result()))
+            session.finish()
+            return
 
+        # Full recomputes run on a worker against a snapshot of the tasks
+        tasks = list(self.tasks)
+        version = self.tasks_version
+
+        def rebuild():
+            distances = self.campus.walking_times() if travel else None
+            schedule = IncrementalSchedule(mode, distances)
+            schedule.set_tasks(tasks)
+            return schedule, schedule.result()
+
+        self.worker.submit("schedule", session.wrap(rebuild),
+                           on_done=session.wrap(lambda built: self.schedule_rebuilt(built, version), last=True),
+                           on_error=session.wrap(self.schedule_failed, last=True))
+
+    def schedule_failed(self, error):
+        if self.schedule_win is not None:
+            self.schedule_total.config(text=self.theme.text("task_failed", error=error))
+            self.schedule_box.delete(0, tk.END)
+        self.show_error(error)
+
+    def schedule_rebuilt(self, built, version):
+        schedule, result = built
+        if version != self.tasks_version:
+            # Tasks changed while it was computing; go again with the new list
+            self.refresh_schedule()
+            return
+        self.schedule = schedule
+        self.render_schedule(result)
 
-    def search_building(self):
-        building = self.search_entry.get()
-        found = False
-        found_building = None
-        
+    def render_schedule(self, result):
+        if self.schedule_win is None:
+            return
+        if self.schedule.mode == "weighted":
+            total = sum(task_weight(task) for task in result)
+            self.schedule_total.config(text=f"Total priority value: {total}")
+        else:
+            self.schedule_total.config(text="")
+
+        self.schedule_box.delete(0, tk.END)
+        for task in result:
+            start_str = task['start'].strftime("%I:%M %p")
+            end_str = task['end'].strftime("%I:%M %p")
+            self.schedule_box.insert(tk.END, f"• {task['title']} @ {task['location']} ({start_str} - {end_str})")
+
+    def find_building(self, query):
+        """First building whose name contains query (case-insensitive), or None"""
         for b in self.campus.get_buildings():
-            if kmp_search(b.lower(), building.lower()) != -1:
-                found = True
-                found_building = b
-                break
-                
-        if found:
+            if kmp_search(b.lower(), query.lower()) != -1:
+                return b
+        return None
+
+    def search_building(self):
+        building = self.search_entry.get().strip()
+        if not building:
+            self.worker.cancel("search")
+            self.search_result.config(text=self.theme.text("empty_query"), fg=self.theme.colors["error"])
+            self.show_on_map_btn.config(state=tk.DISABLED)
+            self.set_status("status_empty_query")
+            return
+        session = self.profiler.session("search_building")
+        self.worker.submit("search", session.wrap(self.find_building), building,
+                           on_done=session.wrap(lambda found: self.show_search_result(building, found), last=True),
+                           on_error=session.wrap(self.show_search_error, last=True))
+
+    def show_search_error(self, error):
+        self.search_result.config(text=self.theme.text("search_failed", error=error), fg=self.theme.colors["error"])
+        self.show_on_map_btn.config(state=tk.DISABLED)
+        self.set_status("task_failed", error=error)
+
+    def show_search_result(self, building, found_building):
+        if found_building is not None:
             self.highlighted_building = found_building
-            self.search_result.config(text=f"{found_building} was found!", fg="#008000")
+            self.search_result.config(text=self.theme.text("found", building=found_building),
+                                      fg=self.theme.colors["success"])
             self.show_on_map_btn.config(state=tk.NORMAL)
+            self.set_status("status_found", building=found_building)
         else:
-            self.search_result.config(text=f"{building} was not found.", fg="#B22222")
+            self.search_result.config(text=self.theme.text("not_found", query=building),
+                                      fg=self.theme.colors["error"])
             self.show_on_map_btn.config(state=tk.DISABLED)
+            self.set_status("status_not_found", query=building)
 
     def calculate_path(self):
         start = self.start_var.get()
         end = self.end_var.get()
         
         if not start or not end:
-            self.path_result.config(text="Please select both buildings.", fg="#B22222")
+            self.path_result.config(text=self.theme.text("missing_buildings"), fg=self.theme.colors["error"])
             return
             
+        known = self.campus.get_buildings()
+        for building in (start, end):
+            if building not in known:
+                self.worker.cancel("path")
+                self.path_result.config(text=self.theme.text("unknown_building", building=building),
+                                        fg=self.theme.colors["error"])
+                self.path_details.config(text="")
+                self.show_path_btn.config(state=tk.DISABLED)
+                self.play_path_btn.config(state=tk.DISABLED)
+                self.current_path = None
+                return
+
         if start == end:
-            self.path_result.config(text="You're already there!", fg="#008000")
+            self.worker.cancel("path")
+            self.path_result.config(text=self.theme.text("same_building"), fg=self.theme.colors["warning"])
             self.show_path_btn.config(state=tk.DISABLED)
+            self.play_path_btn.config(state=tk.DISABLED)
             self.current_path = None
             return
             
-        distance, path = self.campus.dijkstra(start, end)
+        self.path_result.config(text=self.theme.text("calculating", start=start, end=end),
+                                fg=self.theme.colors["text"])
+        self.path_details.config(text="")
+        self.show_path_btn.config(state=tk.DISABLED)
+        self.play_path_btn.config(state=tk.DISABLED)
+        session = self.profiler.session("calculate_path")
+        self.worker.submit("path", session.wrap(self.campus.dijkstra), start, end,
+                           on_done=session.wrap(lambda found: self.show_path_result(start, end, found), last=True),
+                           on_error=session.wrap(self.show_path_error, last=True))
+
+    def show_path_error(self, error):
+        # The route buttons stay off: there is no path to show
+        self.path_result.config(text=self.theme.text("path_failed", error=error), fg=self.theme.colors["error"])
+        self.path_details.config(text="")
+        self.current_path = None
+        self.set_status("task_failed", error=error)
+
+    def show_path_result(self, start, end, found):
+        distance, path = found
         self.path_result.config(
-            text=f"Shortest path from {start} to {end} is {distance} units.", 
-            fg="#008000"
+            text=self.theme.text("path_found", start=start, end=end, distance=distance),
+            fg=self.theme.colors["success"]
         )
         
         path_str = " → ".join(path)
-        self.path_details.config(text=f"Path: {path_str}")
+        self.path_details.config(text=self.theme.text("path_details", path=path_str))
         
         self.current_path = path
+        self.current_distance = distance
         self.show_path_btn.config(state=tk.NORMAL)
-
-    def show_map(self, show_path=False):
-        pos = nx.spring_layout(self.campus.graph, seed=42, k=0.9)
-        
-        plt.figure(figsize=(10, 8))
-        
-        # Draw all edges in light gray
-        nx.draw_networkx_edges(self.campus.graph, pos, width=1.0, alpha=0.5, edge_color='gray')
-        
-        # Draw path edges in blue with increased width if showing path
-        if show_path and self.current_path and len(self.current_path) > 1:
-            path_edges = [(self.current_path[i], self.current_path[i+1]) 
-                          for i in range(len(self.current_path)-1)]
-            nx.draw_networkx_edges(self.campus.graph, pos, edgelist=path_edges, 
-                                  width=4.0, edge_color='blue', arrows=True, 
-                                  arrowstyle='->', arrowsize=20)
-        
-        # Color nodes appropriately
-        node_colors = []
-        node_sizes = []
-        
-        for node in self.campus.graph.nodes:
-            if show_path and self.current_path:
-                if node == self.current_path[0]:  # Starting node
-                    node_colors.append('green')
-                    node_sizes.append(3500)
-                elif node == self.current_path[-1]:  # Ending node
-                    node_colors.append('red')
-                    node_sizes.append(3500)
-                elif node in self.current_path:  # Path nodes
-                    node_colors.append('lightblue')
-                    node_sizes.append(3000)
-                else:  # Other nodes
-                    node_colors.append('pink')
-                    node_sizes.append(2500)
-            else:
-                if node == self.highlighted_building:
-                    node_colors.append('red')
-                    node_sizes.append(3500)
-                else:
-                    node_colors.append('pink')
-                    node_sizes.append(2500)
-        
-        # Draw nodes
-        nx.draw_networkx_nodes(self.campus.graph, pos, node_color=node_colors, 
-                              node_size=node_sizes, edgecolors='black')
-        
-        # Draw node labels
-        nx.draw_networkx_labels(self.campus.graph, pos, font_size=10, font_weight='bold')
-        
-        # Draw edge weights
-        edge_labels = nx.get_edge_attributes(self.campus.graph, 'weight')
-        nx.draw_networkx_edge_labels(self.campus.graph, pos, edge_labels=edge_labels, font_size=8)
-        
-        # Add a title based on what's being shown
-        if show_path and self.current_path:
-            path_str = " → ".join(self.current_path)
-            plt.title(f"Shortest Path: {path_str}", fontsize=14)
-            start = self.start_var.get()
-            end = self.end_var.get()
-            distance, _ = self.campus.dijkstra(start, end)
-            plt.figtext(0.5, 0.01, f"Total Distance: {distance} units", 
-                       fontsize=12, ha='center')
+        self.play_path_btn.config(state=tk.NORMAL)
+        self.set_status("status_path", start=start, end=end)
+
+    def show_map(self, show_path=False, animate=False):
+        # The layout is the slow part on big graphs, so it runs on a worker
+        session = self.profiler.session("show_map")
+        self.worker.submit("map", session.wrap(self.map_layout),
+                           on_done=lambda pos: self.draw_map(pos, show_path, session, animate),
+                           on_error=session.wrap(self.show_error, last=True))
+
+    def pick_building(self, building):
+        # Clicks on the map fill Start, then End, then start over
+        if self.start_var.get() and not self.end_var.get():
+            self.end_var.set(building)
+            self.set_status("status_picked_end", building=building)
         else:
-            plt.title("CSUF Campus Map", fontsize=14)
-            if self.highlighted_building:
-                plt.figtext(0.5, 0.01, f"Highlighted Building: {self.highlighted_building}", 
-                           fontsize=12, ha='center')
-        
-        plt.axis('off')
-        plt.tight_layout()
+            self.start_var.set(building)
+            self.end_var.set("")
+            self.set_status("status_picked_start", building=building)
+
+    def map_layout(self):
+        # The graph does not change, so neither does its layout
+        if self.map_pos is None:
+            with metrics.timed("map_layout_seconds"):
+                self.map_pos = campus_layout(self.campus.graph)
+        return self.map_pos
+
+    def draw_map(self, pos, show_path=False, session=NULL_SESSION, animate=False):
+        started = time.perf_counter()
+        path = self.current_path if show_path else None
+        view = session.run(MapView, self.campus.graph, pos, path, self.current_distance,
+                           self.highlighted_building, self.theme.map_style, self.pick_building)
+        session.run(view.draw)
+        session.finish()
+        if animate:
+            view.animate()
+        # Scroll to zoom, drag to pan, click to pick. matplotlib only keeps weak references
+        # to the handlers, so open maps are kept here until they are closed
+        self.map_views.append(view.connect())
+        view.fig.canvas.mpl_connect("close_event", lambda event: self.map_views.remove(view))
+        self.set_status("status_map")
+        if metrics.enabled:
+            metrics.observe("map_draw_seconds", time.perf_counter() - started)
         plt.show()
 
+def main(theme="classic", argv=None):
+    """
+    Opens the navigator. --theme NAME picks another look and --profile
+    starts with action profiling on (see the Diagnostics tab)
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="CSUF Smart Campus Navigator")
+    parser.add_argument("--theme", choices=available_themes(), default=theme)
+    parser.add_argument("--profile", action="store_true", help="profile each action from the start")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    app = SmartCampusNavigator(root, args.theme, profile=args.profile)
+    root.mainloop()
+
 # Main
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = SmartCampusNavigator(root)
-    root.mainloop()
\ No newline at end of file
+    main()
\ No newline at end of file
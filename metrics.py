@@ -0,0 +1,196 @@
+"""
+Optional counters and timings for the hot paths (Dijkstra, nearest
+facility search, KMP search, task loading, map drawing).
+
+Off by default. Instrumented code checks metrics.enabled once per call and
+does nothing else while it is False, so leaving the hooks in costs close
+to nothing. Turn it on with metrics.enable(), read the numbers with
+snapshot() or dump them for Prometheus with prometheus_text().
+"""
+import threading
+import time
+
+enabled = False
+
+PREFIX = "campus_"
+
+# name -> (type, help text)
+METRICS = {
+    "dijkstra_seconds": ("summary", "Wall time of single-source Dijkstra runs"),
+    "dijkstra_heap_pushes_total": ("counter", "Heap pushes made by Dijkstra"),
+    "dijkstra_heap_pops_total": ("counter", "Heap pops made by Dijkstra, including stale entries"),
+    "dijkstra_nodes_settled_total": ("counter", "Nodes whose final distance Dijkstra fixed"),
+    "dijkstra_edges_scanned_total": ("counter", "Edges Dijkstra looked at from settled nodes"),
+    "dijkstra_edges_relaxed_total": ("counter", "Edges that improved a tentative distance"),
+    "nearest_seconds": ("summary", "Wall time of nearest-k facility searches, one per batch of origins"),
+    "kmp_searches_total": ("counter", "Calls to kmp_search"),
+    "kmp_comparisons_total": ("counter", "Character comparisons kmp_search made against the text"),
+    "task_load_seconds": ("summary", "Wall time of load_validate_tasks"),
+    "tasks_loaded_total": ("counter", "Task records accepted while loading"),
+    "tasks_rejected_total": ("counter", "Task records rejected while loading, by reason"),
+    "task_load_records_per_second": ("gauge", "Records read per second by the last task load"),
+    "map_layout_seconds": ("summary", "Time spent computing the map layout"),
+    "map_draw_seconds": ("summary", "Time spent drawing the map"),
+}
+
+_lock = threading.Lock()  # the GUI records from worker threads too
+_counters = {}   # (name, labels) -> value
+_gauges = {}     # (name, labels) -> value
+_summaries = {}  # (name, labels) -> [count, sum, max]
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _summaries.clear()
+
+
+def inc(name, value=1, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def set_gauge(name, value, **labels):
+    with _lock:
+        _gauges[(name, tuple(sorted(labels.items())))] = value
+
+
+def observe(name, value, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        summary = _summaries.get(key)
+        if summary is None:
+            _summaries[key] = [1, value, value]
+        else:
+            summary[0] += 1
+            summary[1] += value
+            if value > summary[2]:
+                summary[2] = value
+
+
+class timed:
+    """Context manager that observes the time its block took (if enabled)"""
+
+    def __init__(self, name, **labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter() if enabled else None
+        return self
+
+    def __exit__(self, *exc):
+        if self.started is not None:
+            observe(self.name, time.perf_counter() - self.started, **self.labels)
+
+
+def record_dijkstra(graph_list, dist, pushes, seconds):
+    """
+    Records one Dijkstra run. Only pushes are counted in the loop; the rest
+    follows from the result because the loop drains the heap: every push is
+    popped once, each reachable node is settled once, every push after the
+    source's is a successful relaxation, and settled nodes scan all their edges.
+    """
+    settled = 0
+    scanned = 0
+    for u, d in enumerate(dist):
+        if d != float("inf"):
+            settled += 1
+            scanned += len(graph_list[u])
+    inc("dijkstra_heap_pushes_total", pushes)
+    inc("dijkstra_heap_pops_total", pushes)
+    inc("dijkstra_nodes_settled_total", settled)
+    inc("dijkstra_edges_scanned_total", scanned)
+    inc("dijkstra_edges_relaxed_total", pushes - 1)
+    observe("dijkstra_seconds", seconds)
+
+
+class _CountingText:
+    """Stands in for the searched text and counts every character read from it"""
+    __slots__ = ("text", "reads")
+
+    def __init__(self, text):
+        self.text = text
+        self.reads = 0
+
+    def __len__(self):
+        return len(self.text)
+
+    def __getitem__(self, i):
+        self.reads += 1
+        return self.text[i]
+
+
+def count_comparisons(search, text, pattern):
+    """Runs search(text, pattern) with the text wrapped so each character comparison is counted"""
+    counted = _CountingText(text)
+    result = search(counted, pattern)
+    inc("kmp_searches_total")
+    inc("kmp_comparisons_total", counted.reads)
+    return result
+
+
+def record_load(report, seconds):
+    inc("tasks_loaded_total", report.accepted)
+    for reason, count in report.reasons.items():
+        inc("tasks_rejected_total", count, reason=reason)
+    observe("task_load_seconds", seconds)
+    records = report.accepted + report.rejected
+    set_gauge("task_load_records_per_second", records / seconds if seconds else 0.0)
+
+
+def snapshot():
+    """Every recorded value as a plain dict, e.g. for JSON"""
+    def label_key(name, labels):
+        return name + "".join(f"[{k}={v}]" for k, v in labels)
+
+    with _lock:
+        return {
+            "enabled": enabled,
+            "counters": {label_key(n, l): v for (n, l), v in _counters.items()},
+            "gauges": {label_key(n, l): v for (n, l), v in _gauges.items()},
+            "summaries": {label_key(n, l): {"count": c, "sum": s, "max": m}
+                          for (n, l), (c, s, m) in _summaries.items()},
+        }
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+def prometheus_text():
+    """Dumps the metrics in the Prometheus text exposition format"""
+    with _lock:
+        series = {}
+        for (name, labels), value in _counters.items():
+            series.setdefault(name, []).append(f"{PREFIX}{name}{_format_labels(labels)} {value}")
+        for (name, labels), value in _gauges.items():
+            series.setdefault(name, []).append(f"{PREFIX}{name}{_format_labels(labels)} {value}")
+        for (name, labels), (count, total, _) in _summaries.items():
+            series.setdefault(name, []).extend([
+                f"{PREFIX}{name}_count{_format_labels(labels)} {count}",
+                f"{PREFIX}{name}_sum{_format_labels(labels)} {total}",
+            ])
+
+    lines = []
+    for name in sorted(series):
+        kind, help_text = METRICS.get(name, ("untyped", name))
+        lines.append(f"# HELP {PREFIX}{name} {help_text}")
+        lines.append(f"# TYPE {PREFIX}{name} {kind}")
+        lines.extend(sorted(series[name]))
+    return "\n".join(lines) + "\n"
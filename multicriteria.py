@@ -0,0 +1,162 @@
+"""
+Routes that trade distance against other costs.
+
+Every edge has a cost vector, read from its attributes:
+
+    distance   "weight" (default 1)
+    stairs     "stairs", flights of steps on the way (default 0)
+    uncovered  the part of the distance not under cover; "shade" is the
+               covered fraction of the edge (default 0, all in the open)
+    barriers   1 when the edge is not wheelchair accessible; "accessible"
+               defaults to True exactly when there are no stairs
+
+pareto_search finds the Pareto set: every route that no other route beats
+or equals on all four costs. It is a multi-criteria label-setting search
+(Martins' algorithm): each node keeps a bag of labels that do not dominate
+each other, and labels come off a heap in lexicographic order, so a label
+is final when popped. Labels are pruned when a route already found at the
+target dominates them even after adding a lower bound on the rest of the
+way (one single-criterion Dijkstra per cost); that pruning is exact.
+
+Each bag also holds at most max_labels labels, the longest ones giving way
+first. That cap keeps the search fast on big graphs, but a label it drops
+is not dominated by anything, so Pareto-optimal routes (usually long
+detours) can be missing from the result. pareto_search says when the cap
+dropped anything; raise max_labels until it does not to get the full set.
+"""
+import heapq
+
+CRITERIA = ("distance", "stairs", "uncovered", "barriers")
+MAX_LABELS = 16
+
+
+def edge_costs(data):
+    """Cost vector of an edge with attributes data, in CRITERIA order"""
+    distance = data.get("weight", 1)
+    stairs = data.get("stairs", 0)
+    accessible = data.get("accessible", not stairs)
+    return (distance, stairs, distance * (1 - data.get("shade", 0)), 0 if accessible else 1)
+
+
+def index_costs(graph):
+    """(name_to_index, index_to_name, adjacency) where adjacency[u] lists (v, cost vector)"""
+    name_to_index = {name: i for i, name in enumerate(graph.nodes)}
+    index_to_name = {i: name for name, i in name_to_index.items()}
+    adjacency = [[] for _ in range(len(name_to_index))]
+    for u, v, data in graph.edges(data=True):
+        costs = edge_costs(data)
+        adjacency[name_to_index[u]].append((name_to_index[v], costs))
+        adjacency[name_to_index[v]].append((name_to_index[u], costs))
+    return name_to_index, index_to_name, adjacency
+
+
+def accessible_adjacency(adjacency):
+    """Adjacency list of (v, distance) over the wheelchair accessible edges only"""
+    return [[(v, costs[0]) for v, costs in edges if not costs[3]] for edges in adjacency]
+
+
+def dominates(a, b):
+    """True when cost vector a is no worse than b everywhere (equal counts: one of them is enough)"""
+    # Spelled out, since this is the search's innermost test
+    return a[0] <= b[0] and a[1] <= b[1] and a[2] <= b[2] and a[3] <= b[3]
+
+
+def _lower_bounds(adjacency, target, criterion):
+    """Least cost in one criterion from every node to target"""
+    bound = [float('inf')] * len(adjacency)
+    bound[target] = 0
+    pq = [(0, target)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > bound[u]:
+            continue
+        for v, costs in adjacency[u]:
+            if d + costs[criterion] < bound[v]:
+                bound[v] = d + costs[criterion]
+                heapq.heappush(pq, (bound[v], v))
+    return bound
+
+
+def pareto_search(index, source, target, max_labels=MAX_LABELS):
+    """
+    Pareto-optimal routes from source to target as (cost vector, path)
+    pairs, shortest first, and whether the max_labels cap dropped any
+    label, in which case the routes may be only part of the Pareto set.
+    index comes from index_costs
+    """
+    name_to_index, index_to_name, adjacency = index
+    src, tgt = name_to_index[source], name_to_index[target]
+    k = len(CRITERIA)
+    bounds = list(zip(*(_lower_bounds(adjacency, tgt, c) for c in range(k))))
+    if bounds[src][0] == float('inf'):
+        return [], False
+
+    # Label i has cost vector costs[i] at node nodes[i], reached from label
+    # parents[i]; alive[i] turns False when a better label pushes it out of its bag
+    zero = (0,) * k
+    costs, nodes, parents, alive = [zero], [src], [-1], [True]
+    bags = [[] for _ in adjacency]
+    bags[src].append(0)
+    pq = [(zero, 0)]
+    found = []
+    truncated = False
+
+    while pq:
+        cost, label = heapq.heappop(pq)
+        if not alive[label]:
+            continue
+        u = nodes[label]
+        if u == tgt:
+            found.append(label)
+            continue
+        for v, edge in adjacency[u]:
+            new = (cost[0] + edge[0], cost[1] + edge[1], cost[2] + edge[2], cost[3] + edge[3])
+            # Target pruning: a route found already beats any way on from here
+            bound = bounds[v]
+            estimate = (new[0] + bound[0], new[1] + bound[1], new[2] + bound[2], new[3] + bound[3])
+            if _beaten(costs, bags[tgt], estimate) or _beaten(costs, bags[v], new):
+                continue
+            kept = []
+            for i in bags[v]:
+                if dominates(new, costs[i]):
+                    alive[i] = False
+                else:
+                    kept.append(i)
+            if len(kept) >= max_labels:
+                # Bounded bag: the longest label gives way, unless that is the new one
+                truncated = True
+                worst = max(kept, key=costs.__getitem__)
+                if costs[worst] <= new:
+                    bags[v] = kept
+                    continue
+                alive[worst] = False
+                kept.remove(worst)
+            kept.append(len(costs))
+            bags[v] = kept
+            heapq.heappush(pq, (new, len(costs)))
+            costs.append(new)
+            nodes.append(v)
+            parents.append(label)
+            alive.append(True)
+
+    routes = []
+    for label in found:
+        if not alive[label]:
+            continue
+        path = []
+        i = label
+        while i != -1:
+            path.append(index_to_name[nodes[i]])
+            i = parents[i]
+        path.reverse()
+        routes.append((costs[label], path))
+    return routes, truncated
+
+
+def _beaten(costs, bag, vector):
+    """True when some label in bag dominates vector"""
+    for i in bag:
+        c = costs[i]
+        if c[0] <= vector[0] and c[1] <= vector[1] and c[2] <= vector[2] and c[3] <= vector[3]:
+            return True
+    return False
@@ -0,0 +1,393 @@
+"""
+Routing over a graph split between worker processes, for a district of
+campuses too big for one CampusGraph process to hold and serve.
+
+partition_graph cuts the graph into parts by recursive inertial bisection:
+nodes are projected on the principal axis of their coordinates ("pos", or
+the campus_layout) and split at the balanced point, then a greedy pass
+moves boundary nodes to the side most of their edges lead to. The nodes
+with an edge into another part are boundary nodes.
+
+PartitionedRouter starts one worker process per part, each holding only
+its part's edges and talking to the coordinator over a pipe. Customizing
+asks every worker, in parallel, for the shortest in-part distances between
+its boundary nodes; those cliques plus the cut edges form the overlay. A
+query asks the source's and the target's workers for distances to their
+boundary nodes, runs Dijkstra on the overlay in the coordinator, and asks
+the workers involved for the in-part legs to stitch the full path. When
+weights change only the parts they fall in are customized again.
+
+    python partition.py --size 20000 --parts 4 --queries 50
+"""
+import argparse
+import math
+import multiprocessing
+import random
+import time
+from collections import Counter
+
+import networkx as nx
+import numpy as np
+
+from campus_core import CampusGraph
+from indoor import seeded_dijkstra, unwind
+
+IMBALANCE = 0.05   # parts may grow this much past an even share during refinement
+REFINE_PASSES = 4
+
+
+# Partitioning
+
+def partition_graph(graph, parts, seed=42):
+    """{node: part} splitting graph into parts pieces of about equal size"""
+    from layout import campus_layout
+    nodes = list(graph.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    pos = campus_layout(graph, seed)
+    xy = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    assignment = np.zeros(len(nodes), dtype=np.int64)
+    _bisect(np.arange(len(nodes)), parts, 0, xy, assignment)
+
+    edges = np.array([(index[u], index[v]) for u, v in graph.edges if u != v], dtype=np.int64).reshape(-1, 2)
+    _refine(assignment, edges, parts)
+    return {node: int(part) for node, part in zip(nodes, assignment)}
+
+
+def _bisect(members, parts, first, xy, assignment):
+    """Splits members into parts parts numbered from first, across their principal axis"""
+    if parts == 1 or len(members) <= 1:
+        assignment[members] = first
+        return
+    points = xy[members] - xy[members].mean(axis=0)
+    _, vectors = np.linalg.eigh(points.T @ points)
+    projection = points @ vectors[:, -1]
+    left_parts = parts // 2
+    split = len(members) * left_parts // parts
+    order = np.argsort(projection, kind="stable")
+    _bisect(members[order[:split]], left_parts, first, xy, assignment)
+    _bisect(members[order[split:]], parts - left_parts, first + left_parts, xy, assignment)
+
+
+def _refine(assignment, edges, parts):
+    """Greedy boundary refinement: a node moves to the part most of its edges lead to, within balance"""
+    n = len(assignment)
+    if not len(edges):
+        return
+    both = np.concatenate([edges, edges[:, ::-1]])
+    order = np.argsort(both[:, 0], kind="stable")
+    targets = both[order, 1]
+    starts = np.searchsorted(both[order, 0], np.arange(n + 1))
+    sizes = Counter(assignment.tolist())
+    cap = math.ceil(n / parts * (1 + IMBALANCE))
+    floor = math.floor(n / parts * (1 - IMBALANCE))
+
+    for _ in range(REFINE_PASSES):
+        cut = assignment[edges[:, 0]] != assignment[edges[:, 1]]
+        moved = 0
+        for u in np.unique(edges[cut]).tolist():
+            here = int(assignment[u])
+            counts = Counter(assignment[targets[starts[u]:starts[u + 1]]].tolist())
+            part, links = max(((p, c) for p, c in counts.items() if p != here), key=lambda pc: pc[1],
+                              default=(here, 0))
+            if links > counts.get(here, 0) and sizes[part] < cap and sizes[here] > floor:
+                assignment[u] = part
+                sizes[part] += 1
+                sizes[here] -= 1
+                moved += 1
+        if not moved:
+            break
+
+
+def _prune(clique):
+    """
+    Drops the clique edges a-b that are no shorter than going through
+    another boundary node c; the overlay search still finds that way, and
+    dense cliques are what makes it slow
+    """
+    nodes = list(clique)
+    k = len(nodes)
+    if k < 3:
+        return clique
+    index = {node: i for i, node in enumerate(nodes)}
+    dist = np.full((k, k), np.inf)
+    for a, found in clique.items():
+        for b, d in found.items():
+            dist[index[a], index[b]] = d
+    redundant = np.zeros((k, k), dtype=bool)
+    for c in range(k):
+        # Both legs must be positive, or a-c-b could stand in for a-b and a-b for a-c-b
+        into, out = dist[:, c:c + 1], dist[c:c + 1, :]
+        redundant |= (into + out <= dist) & (into > 0) & (out > 0)
+    return {a: {b: d for b, d in found.items() if not redundant[index[a], index[b]]}
+            for a, found in clique.items()}
+
+
+# Workers
+
+class PartWorker:
+    """One part of the graph, as its own CampusGraph, and the searches the coordinator asks for"""
+
+    def __init__(self, nodes, edges):
+        graph = nx.Graph()
+        graph.add_nodes_from(nodes)
+        graph.add_weighted_edges_from(edges)
+        self.campus = CampusGraph(graph)
+
+    def handle(self, request):
+        kind = request[0]
+        if kind == "search":
+            # Distances from each source to the given targets
+            _, sources, targets = request
+            found = {}
+            for source in sources:
+                distances, _ = self.campus.shortest_path_tree(source)
+                found[source] = {t: distances[t] for t in targets if distances[t] != float('inf')}
+            return found
+        if kind == "clique":
+            _, boundary = request
+            return self.handle(("search", boundary, boundary))
+        if kind == "paths":
+            # In-part shortest paths for (from, to) pairs, one search per distinct start
+            _, pairs = request
+            trees = {}
+            paths = []
+            for a, b in pairs:
+                if a not in trees:
+                    trees[a] = self.campus.shortest_path_tree(a)[1]
+                path = [b]
+                while path[-1] != a:
+                    path.append(trees[a][path[-1]])
+                path.reverse()
+                paths.append(path)
+            return paths
+        if kind == "weights":
+            self.campus.set_weights({(u, v): weight for u, v, weight in request[1]})
+            return None
+        raise ValueError(f"unknown request '{kind}'")
+
+
+def serve_part(conn, nodes, edges):
+    """Worker process loop: answers the coordinator's requests until it sends ("stop",)"""
+    worker = PartWorker(nodes, edges)
+    while True:
+        request = conn.recv()
+        if request[0] == "stop":
+            break
+        try:
+            reply = worker.handle(request)
+        except Exception as e:
+            reply = e
+        conn.send(reply)
+    conn.close()
+
+
+class InlineConnection:
+    """Pipe stand-in that runs a PartWorker in this process (processes=False)"""
+
+    def __init__(self, worker):
+        self.worker = worker
+        self.reply = None
+
+    def send(self, request):
+        if request[0] != "stop":
+            try:
+                self.reply = self.worker.handle(request)
+            except Exception as e:
+                self.reply = e
+
+    def recv(self):
+        return self.reply
+
+    def close(self):
+        pass
+
+
+# Coordinator
+
+class PartitionedRouter:
+    """
+    Shortest paths over graph with each of parts parts served by its own
+    worker process; see the module docstring. route() answers like
+    CampusGraph.dijkstra. Close it (or use it in a with block) to stop the
+    workers
+    """
+
+    def __init__(self, graph, parts=4, processes=True, seed=42, part_of=None):
+        self.parts = parts
+        self.part_of = partition_graph(graph, parts, seed) if part_of is None else part_of
+        part_nodes = [[] for _ in range(parts)]
+        for node, part in self.part_of.items():
+            part_nodes[part].append(node)
+        part_edges = [[] for _ in range(parts)]
+        self.cut = {}  # (u, v) -> weight for edges between parts
+        self.boundary = [set() for _ in range(parts)]
+        for u, v, data in graph.edges(data=True):
+            weight = data.get('weight', 1)
+            pu, pv = self.part_of[u], self.part_of[v]
+            if pu == pv:
+                part_edges[pu].append((u, v, weight))
+            else:
+                self.cut[(u, v)] = weight
+                self.boundary[pu].add(u)
+                self.boundary[pv].add(v)
+
+        self.processes = []
+        if processes:
+            self.conns = []
+            for nodes, edges in zip(part_nodes, part_edges):
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=serve_part, args=(child, nodes, edges), daemon=True)
+                process.start()
+                child.close()
+                self.conns.append(parent)
+                self.processes.append(process)
+        else:
+            self.conns = [InlineConnection(PartWorker(nodes, edges)) for nodes, edges in zip(part_nodes, part_edges)]
+
+        self.cliques = {}
+        self.overlay = {}
+        self.customize()
+
+    def _ask(self, requests):
+        """Sends {part: request} to every worker at once, then collects {part: reply}"""
+        for part, request in requests.items():
+            self.conns[part].send(request)
+        replies = {part: self.conns[part].recv() for part in requests}
+        for reply in replies.values():
+            if isinstance(reply, Exception):
+                raise reply
+        return replies
+
+    def customize(self, parts=None):
+        """Recomputes the boundary cliques of parts (all by default) in parallel and rebuilds the overlay"""
+        parts = range(self.parts) if parts is None else parts
+        replies = self._ask({p: ("clique", sorted(self.boundary[p], key=str)) for p in parts})
+        self.cliques.update((part, _prune(clique)) for part, clique in replies.items())
+        overlay = {}
+        for (u, v), weight in self.cut.items():
+            overlay.setdefault(u, []).append((v, weight, None))
+            overlay.setdefault(v, []).append((u, weight, None))
+        for part, clique in self.cliques.items():
+            for a, found in clique.items():
+                # The via of a clique edge is the part that can unpack it
+                overlay.setdefault(a, []).extend((b, d, part) for b, d in found.items() if b != a)
+        self.overlay = overlay
+
+    def update_weights(self, changes):
+        """
+        Sets new weights {(u, v): weight}. Cut edges change in the overlay
+        and the parts with changed edges are customized again
+        """
+        per_part = {}
+        for (u, v), weight in changes.items():
+            if (u, v) in self.cut or (v, u) in self.cut:
+                self.cut[(u, v) if (u, v) in self.cut else (v, u)] = weight
+            else:
+                per_part.setdefault(self.part_of[u], []).append((u, v, weight))
+        if per_part:
+            self._ask({part: ("weights", edges) for part, edges in per_part.items()})
+        self.customize(list(per_part))
+
+    def route(self, source, target):
+        """Shortest (distance, path) from source to target; (inf, []) when unreachable"""
+        inf = float('inf')
+        ps, pt = self.part_of[source], self.part_of[target]
+        if ps == pt:
+            found = self._ask({ps: ("search", [source, target], list(self.boundary[ps]) + [target])})[ps]
+            up, down = found[source], found[target]
+        else:
+            found = self._ask({ps: ("search", [source], list(self.boundary[ps])),
+                               pt: ("search", [target], list(self.boundary[pt]))})
+            up, down = found[ps][source], found[pt][target]
+        seeds = {b: up[b] for b in self.boundary[ps] if b in up}
+        exits = {b: down[b] for b in self.boundary[pt] if b in down}
+
+        # Staying inside the part is a candidate too
+        best, meet = (up.get(target, inf) if ps == pt else inf), None
+
+        def stop(node, d):
+            nonlocal best, meet
+            if d >= best:
+                return True
+            if node in exits and d + exits[node] < best:
+                best, meet = d + exits[node], node
+            return False
+
+        _, prev = seeded_dijkstra(self.overlay, seeds, stop)
+        if best == inf:
+            return inf, []
+        if meet is None:
+            return best, self._ask({ps: ("paths", [(source, target)])})[ps][0]
+
+        # Legs to unpack: out of the source part, clique edges, into the target part
+        steps = unwind(prev, meet)
+        legs = [(ps, source, steps[0][0])]
+        for (a, _), (b, via) in zip(steps, steps[1:]):
+            legs.append((via, a, b))
+        legs.append((pt, meet, target))
+        wanted = {}
+        for part, a, b in legs:
+            if part is not None:
+                wanted.setdefault(part, []).append((a, b))
+        replies = self._ask({part: ("paths", pairs) for part, pairs in wanted.items()})
+        taken = {part: iter(paths) for part, paths in replies.items()}
+        path = [source]
+        for part, a, b in legs:
+            leg = [a, b] if part is None else next(taken[part])
+            path.extend(leg[1:])
+        return best, path
+
+    def close(self):
+        for conn in self.conns:
+            conn.send(("stop",))
+            conn.close()
+        for process in self.processes:
+            process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    from bench import GENERATORS
+    from campus_core import CampusGraph
+    parser = argparse.ArgumentParser(description="Check and time partitioned routing against plain Dijkstra")
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--kind", choices=sorted(GENERATORS), default="geometric")
+    parser.add_argument("--parts", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--inline", action="store_true", help="run the parts in this process")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    graph = GENERATORS[args.kind](args.size, args.seed)
+    rng = random.Random(args.seed)
+    names = list(graph.nodes)
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(args.queries)]
+
+    started = time.perf_counter()
+    with PartitionedRouter(graph, args.parts, not args.inline, args.seed) as router:
+        ready = time.perf_counter() - started
+        boundary = sum(len(b) for b in router.boundary)
+        print(f"{graph.number_of_nodes()} nodes in {args.parts} parts: {len(router.cut)} cut edges, "
+              f"{boundary} boundary nodes, ready in {ready:.2f} s")
+        started = time.perf_counter()
+        routes = [router.route(a, b) for a, b in pairs]
+        partitioned = time.perf_counter() - started
+
+    campus = CampusGraph(graph)
+    campus.dijkstra(*pairs[0])
+    started = time.perf_counter()
+    expected = [campus.dijkstra(a, b) for a, b in pairs]
+    flat = time.perf_counter() - started
+    wrong = sum(1 for (d, _), (e, _) in zip(routes, expected) if d != e)
+    print(f"{args.queries} queries: partitioned {partitioned * 1000 / args.queries:.1f} ms each, "
+          f"flat {flat * 1000 / args.queries:.1f} ms each, {wrong} distances differ")
+
+
+# Main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+CPU and allocation profiling for single user actions.
+
+A session collects cProfile data and tracemalloc allocation growth for one
+action (which may run partly on a worker thread and partly on the Tk
+thread) and, when finished, saves a timestamped report. Starting a new
+session for an action that still has one open (the GUI supersedes a
+request that is still running) saves the old one's report too, marked as
+superseded, so what it collected is not lost:
+
+    profiles/20240101-120000-123456_show_map.txt   readable summary
+    profiles/20240101-120000-123456_show_map.prof  raw stats for pstats/snakeviz
+
+tracemalloc and the profiler hook are process-wide, so profiled runs are
+serialized: while one runs, a profiled run on another thread waits for it
+(only while profiling is on). Each run's allocations and peak are then its
+own.
+
+The same actions can be profiled without the GUI:
+
+    python profiling.py route Pollak KHS --repeat 100
+    python profiling.py search pol
+    python profiling.py map --path Pollak KHS
+    python profiling.py schedule tasks.json --mode weighted --travel
+"""
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+from datetime import datetime
+from time import perf_counter
+
+TRACE_FRAMES = 10
+
+# Held for the whole of a profiled run; see the module docstring
+_RUN_LOCK = threading.Lock()
+_in_run = threading.local()
+
+
+class _NullSession:
+    """Stands in for a session while profiling is off"""
+
+    def run(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    def wrap(self, fn, last=False):
+        return fn
+
+    def finish(self):
+        return None
+
+
+NULL_SESSION = _NullSession()
+
+
+class ProfileSession:
+    def __init__(self, profiler, action):
+        self.profiler = profiler
+        self.action = action
+        self.started = datetime.now()
+        self.profile = cProfile.Profile()
+        self.wall = 0.0
+        self.peak = 0
+        self.allocations = {}  # (file, line) -> [bytes, blocks] allocated and still alive after a run
+        self.runs = 0
+        self.running = 0       # runs in progress, maybe on several threads
+        self.superseded = False
+        self.summary = None    # set once the report is saved
+        self._lock = threading.Lock()
+
+    def run(self, fn, *args, **kwargs):
+        """Runs fn under the profilers and adds what it did to this session"""
+        with self._lock:
+            if self.summary is not None:
+                # Already reported (superseded); later work is not added to it
+                return fn(*args, **kwargs)
+            self.runs += 1
+            self.running += 1
+        try:
+            return self._profiled(fn, *args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def _profiled(self, fn, *args, **kwargs):
+        if getattr(_in_run, "active", False):
+            # Nested in a profiled run on this thread, which already measures it
+            return fn(*args, **kwargs)
+        with _RUN_LOCK:
+            _in_run.active = True
+            try:
+                return self._measured(fn, *args, **kwargs)
+            finally:
+                _in_run.active = False
+
+    def _measured(self, fn, *args, **kwargs):
+        before = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        if before is not None:
+            tracemalloc.reset_peak()
+        started = perf_counter()
+        self.profile.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.profile.disable()
+            self.wall += perf_counter() - started
+            if before is not None:
+                self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+                for diff in tracemalloc.take_snapshot().compare_to(before, "lineno"):
+                    if diff.size_diff > 0:
+                        frame = diff.traceback[0]
+                        totals = self.allocations.setdefault((frame.filename, frame.lineno), [0, 0])
+                        totals[0] += diff.size_diff
+                        totals[1] += max(diff.count_diff, 0)
+
+    def wrap(self, fn, last=False):
+        """fn run under this session; with last=True the session is finished afterwards"""
+        def profiled(*args, **kwargs):
+            try:
+                return self.run(fn, *args, **kwargs)
+            finally:
+                if last:
+                    self.finish()
+        return profiled
+
+    def top_functions(self, limit):
+        """(function, calls, own seconds, cumulative seconds), most own time first"""
+        stats = pstats.Stats(self.profile).stats
+        rows = []
+        for (filename, line, name), (_, calls, own, cumulative, _) in stats.items():
+            where = name if filename == "~" else f"{name} ({os.path.basename(filename)}:{line})"
+            rows.append((where, calls, own, cumulative))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:limit]
+
+    def top_allocations(self, limit):
+        """(file:line, bytes, blocks), largest first"""
+        rows = [(f"{os.path.basename(f)}:{line}", size, count)
+                for (f, line), (size, count) in self.allocations.items()]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows[:limit]
+
+    def finish(self):
+        """Saves the report and hands its summary to the profiler (only the first time)"""
+        if self.summary is None:
+            self.summary = self.profiler.save(self)
+        return self.summary
+
+
+class ActionProfiler:
+    """
+    Hands out profiling sessions for user actions while enabled; while off,
+    session() returns a shared no-op session so instrumented code costs a call
+    """
+
+    def __init__(self, directory="profiles", top=15, on_report=None):
+        self.directory = directory
+        self.top = top
+        self.on_report = on_report  # called with each finished report's summary
+        self.enabled = False
+        self.reports = []
+        self.active = {}      # action -> its newest unfinished session
+        self.superseded = []  # replaced sessions still running, saved once they stop
+
+    def enable(self):
+        self.enabled = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def disable(self):
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def session(self, action):
+        if not self.enabled:
+            return NULL_SESSION
+        session = ProfileSession(self, action)
+        old = self.active.get(action)
+        self.active[action] = session
+        if old is not None and old.summary is None:
+            old.superseded = True
+            self.superseded.append(old)
+        self._save_superseded()
+        return session
+
+    def _save_superseded(self):
+        """
+        Saves the superseded sessions that are not running any more. Called
+        from session() and save(), so on_report always hears from the thread
+        that drives the sessions (the Tk thread in the GUI), never a worker
+        """
+        waiting = []
+        for session in self.superseded:
+            if session.running:
+                waiting.append(session)
+            elif session.runs:
+                session.finish()
+            # A session that never ran (its request was cancelled before starting) has nothing to report
+        self.superseded = waiting
+
+    def save(self, session):
+        if self.active.get(session.action) is session:
+            del self.active[session.action]
+        if not session.superseded:
+            self._save_superseded()
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = session.started.strftime("%Y%m%d-%H%M%S-%f")
+        base = os.path.join(self.directory, f"{stamp}_{session.action}")
+        session.profile.dump_stats(base + ".prof")
+
+        summary = {
+            "action": session.action,
+            "time": session.started.isoformat(timespec="seconds"),
+            "wall": session.wall,
+            "peak_bytes": session.peak,
+            "functions": session.top_functions(self.top),
+            "allocations": session.top_allocations(self.top),
+            "report": base + ".txt",
+            "superseded": session.superseded,
+        }
+        with open(base + ".txt", "w") as f:
+            f.write(format_summary(summary))
+            f.write("\nFull profile by cumulative time:\n")
+            out = io.StringIO()
+            pstats.Stats(session.profile, stream=out).sort_stats("cumulative").print_stats(40)
+            f.write(out.getvalue())
+
+        self.reports.append(summary)
+        if self.on_report is not None:
+            self.on_report(summary)
+        return summary
+
+
+def format_summary(summary):
+    lines = [
+        f"{summary['action']} at {summary['time']}"
+        + (" (superseded by a newer request; may be partial)" if summary.get("superseded") else ""),
+        f"Wall time: {summary['wall'] * 1000:.1f} ms, peak traced memory: {summary['peak_bytes'] / 1024:.1f} KiB",
+        "",
+        "Top functions by own time:",
+        f"  {'own ms':>9} {'cum ms':>9} {'calls':>8}  function",
+    ]
+    for where, calls, own, cumulative in summary["functions"]:
+        lines.append(f"  {own * 1000:9.2f} {cumulative * 1000:9.2f} {calls:8d}  {where}")
+    lines += ["", "Top allocations still alive after the action:"]
+    if not summary["allocations"]:
+        lines.append("  (none traced)")
+    for where, size, count in summary["allocations"]:
+        lines.append(f"  {size / 1024:9.1f} KiB {count:8d} blocks  {where}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--repeat", type=int, default=1, help="run the action this many times in one report")
+    common.add_argument("--directory", default="profiles", help="where to save reports")
+    common.add_argument("--top", type=int, default=15, help="offenders to list")
+    parser = argparse.ArgumentParser(description="Profile one navigator action without the GUI")
+    actions = parser.add_subparsers(dest="action", required=True)
+    route = actions.add_parser("route", parents=[common], help="CampusGraph.dijkstra between two buildings")
+    route.add_argument("start")
+    route.add_argument("end")
+    search = actions.add_parser("search", parents=[common], help="kmp_search over the building names")
+    search.add_argument("query")
+    show_map = actions.add_parser("map", parents=[common], help="map layout and drawing (off screen)")
+    show_map.add_argument("--path", nargs=2, metavar=("START", "END"), help="highlight a route")
+    schedule = actions.add_parser("schedule", parents=[common], help="load a task file and suggest a schedule")
+    schedule.add_argument("tasks", help="tasks.json-style file")
+    schedule.add_argument("--mode", choices=("end_time", "priority", "weighted"), default="end_time")
+    schedule.add_argument("--travel", action="store_true", help="leave time to walk between buildings")
+    args = parser.parse_args(argv)
+
+    # Draw off screen; must happen before pyplot is imported
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from campus_core import CampusGraph, kmp_search, render_campus_map
+    from scheduling import greedy_schedule, weighted_schedule
+    from task_loader import load_validate_tasks
+    from layout import campus_layout
+
+    campus = CampusGraph()
+
+    def run_route():
+        return campus.dijkstra(args.start, args.end)
+
+    def run_search():
+        query = args.query.lower()
+        return [b for b in campus.get_buildings() if kmp_search(b.lower(), query) != -1]
+
+    def run_map():
+        pos = campus_layout(campus.graph)
+        path, distance = None, None
+        if args.path:
+            distance, path = campus.dijkstra(*args.path)
+        render_campus_map(campus.graph, pos, path, distance)
+        plt.close("all")
+
+    def run_schedule():
+        tasks = load_validate_tasks(args.tasks, campus.get_buildings())
+        distances = campus.walking_times() if args.travel else None
+        if args.mode == "weighted":
+            return weighted_schedule(tasks, distances=distances)
+        return greedy_schedule(tasks, args.mode, distances)
+
+    action = {"route": run_route, "search": run_search, "map": run_map, "schedule": run_schedule}[args.action]
+    profiler = ActionProfiler(args.directory, args.top)
+    profiler.enable()
+    session = profiler.session(args.action)
+    for _ in range(args.repeat):
+        session.run(action)
+    summary = session.finish()
+    profiler.disable()
+    print(format_summary(summary))
+    print(f"Saved {summary['report']}")
+
+
+# Main
+if __name__ == "__main__":
+    main()
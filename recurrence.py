@@ -0,0 +1,118 @@
+import re
+from datetime import date, timedelta
+
+from scheduling import greedy_schedule, weighted_schedule
+
+# Weekday codes as registrars write them (0 = Monday, like date.weekday())
+DAY_CODES = ["M", "T", "W", "Th", "F", "Sa", "Su"]
+_DAY_TOKENS = {"m": 0, "t": 1, "tu": 1, "w": 2, "th": 3, "r": 3, "f": 4,
+               "sa": 5, "s": 5, "su": 6, "u": 6}
+_DAY_PATTERN = re.compile(r"th|tu|sa|su|[mtwrfsu]", re.IGNORECASE)
+_DAY_NAMES = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def parse_days(days):
+    """
+    Parses a weekday set such as "MWF", "TTh", "TR" or ["Mon", "Wednesday"]
+    into a frozenset of weekday numbers. Raises ValueError if it can't.
+    """
+    if isinstance(days, str):
+        compact = days.replace(" ", "").replace(",", "")
+        tokens = _DAY_PATTERN.findall(compact)
+        if not tokens or "".join(tokens) != compact:
+            raise ValueError(f"invalid days '{days}'")
+        return frozenset(_DAY_TOKENS[token.lower()] for token in tokens)
+    if isinstance(days, (list, tuple)):
+        result = set()
+        for name in days:
+            key = str(name)[:3].lower()
+            if key not in _DAY_NAMES:
+                raise ValueError(f"invalid day '{name}'")
+            result.add(_DAY_NAMES.index(key))
+        if not result:
+            raise ValueError("no days given")
+        return frozenset(result)
+    raise ValueError(f"invalid days {days!r}")
+
+
+def format_days(days):
+    return "".join(DAY_CODES[d] for d in sorted(days))
+
+
+def parse_date(text):
+    return date.fromisoformat(text)
+
+
+def occurs_on(task, day):
+    """True if a task happens on the given date (tasks without a rule happen every day)"""
+    days = task.get("days")
+    if days is not None and day.weekday() not in days:
+        return False
+    start_date = task.get("start_date")
+    if start_date is not None and day < start_date:
+        return False
+    end_date = task.get("end_date")
+    if end_date is not None and day > end_date:
+        return False
+    return True
+
+
+def may_coincide(a, b):
+    """True if two tasks can ever happen on the same day"""
+    if a.get("days") is not None and b.get("days") is not None and not (a["days"] & b["days"]):
+        return False
+    if a.get("end_date") is not None and b.get("start_date") is not None and a["end_date"] < b["start_date"]:
+        return False
+    if b.get("end_date") is not None and a.get("start_date") is not None and b["end_date"] < a["start_date"]:
+        return False
+    return True
+
+
+def iter_days(first, last):
+    day = first
+    while day <= last:
+        yield day
+        day += timedelta(days=1)
+
+
+class CalendarScheduler:
+    """
+    Runs the activity selector one day at a time over recurring tasks.
+    Days are expanded lazily, so a semester is never built in memory, and
+    each distinct set of tasks happening on a day (its daily pattern) is
+    only scheduled once; every other day with that pattern is a cache hit.
+    """
+
+    def __init__(self, tasks, mode="end_time", distances=None):
+        self.tasks = list(tasks)
+        self.mode = mode
+        self.distances = distances
+        self._cache = {}  # tuple of task indices happening that day -> chosen indices
+        self.hits = 0
+        self.misses = 0
+
+    def pattern(self, day):
+        return tuple(i for i, task in enumerate(self.tasks) if occurs_on(task, day))
+
+    def day_schedule(self, day):
+        key = self.pattern(day)
+        chosen = self._cache.get(key)
+        if chosen is None:
+            self.misses += 1
+            day_tasks = [self.tasks[i] for i in key]
+            if self.mode == "weighted":
+                selected = weighted_schedule(day_tasks, distances=self.distances)
+            else:
+                selected = greedy_schedule(day_tasks, self.mode, self.distances)
+            # Identity lookups, since task dicts are not hashable
+            position = {id(task): i for i, task in zip(key, day_tasks)}
+            chosen = tuple(position[id(task)] for task in selected)
+            self._cache[key] = chosen
+        else:
+            self.hits += 1
+        return [self.tasks[i] for i in chosen]
+
+    def iter_schedule(self, first, last):
+        """Yields (date, recommended schedule) for every day from first to last"""
+        for day in iter_days(first, last):
+            yield day, self.day_schedule(day)
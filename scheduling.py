@@ -0,0 +1,348 @@
+import bisect
+
+# Order used by the "priority" greedy mode (lower sorts first)
+PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
+
+# Value of each priority level for the weighted schedule
+PRIORITY_WEIGHTS = {"High": 3, "Medium": 2, "Low": 1}
+
+
+def to_minutes(value):
+    """Converts a datetime.time to minutes since midnight (ints pass through)"""
+    if isinstance(value, int):
+        return value
+    return value.hour * 60 + value.minute
+
+
+def priority_rank(task):
+    """Sort rank of a task's priority, treating unknown priorities as Medium"""
+    return PRIORITY_ORDER.get(task.get("priority"), PRIORITY_ORDER["Medium"])
+
+
+def task_weight(task, weights=PRIORITY_WEIGHTS):
+    """Returns the weight of a task, treating unknown priorities as Medium"""
+    return weights.get(task.get("priority", "Medium"), weights["Medium"])
+
+
+def walk_minutes(distances, a, b, depart):
+    """
+    Walking minutes from a to b leaving at minute depart. distances is a
+    table distances[a][b], or a function distances(a, b, depart) when the
+    walk depends on the time of day (timedep.TravelTimes)
+    """
+    if callable(distances):
+        return distances(a, b, depart)
+    return distances[a][b]
+
+
+def fits_after(last, task, distances=None):
+    """
+    True if task can follow last (the previously chosen task, or None).
+    With a distance table (walking minutes) the gap must also cover the walk.
+    """
+    if last is None:
+        return True
+    if distances is None:
+        return task["start"] >= last["end"]
+    end = to_minutes(last["end"])
+    walk = walk_minutes(distances, last["location"], task["location"], end)
+    return to_minutes(task["start"]) - end >= walk
+
+
+def greedy_schedule(tasks, mode="end_time", distances=None):
+    """
+    Activity selection (Greedy): picks tasks by earliest end time, or by
+    priority first and then end time when mode is "priority".
+
+    If a building-to-building distance table is given (in walking minutes),
+    a task only fits if the gap after the previous task covers the walk.
+    """
+    if mode == "priority":
+        sorted_tasks = sorted(tasks, key=lambda x: (priority_rank(x), x["end"]))
+    else:  # sorts by end time
+        sorted_tasks = sorted(tasks, key=lambda x: x["end"])
+
+    result = []
+    last = None
+
+    for task in sorted_tasks:
+        if fits_after(last, task, distances):
+            result.append(task)
+            last = task
+    return result
+
+
+def weighted_indices(starts, ends, weights):
+    """
+    Weighted interval scheduling over parallel start/end/weight sequences.
+    Returns (total weight, chosen indices in end-time order).
+
+    Runs in O(n log n): one sort by end time, then for every interval a
+    binary search for the last interval that ends at or before its start.
+    """
+    order = sorted(range(len(starts)), key=ends.__getitem__)
+    sorted_ends = [ends[i] for i in order]
+    prev = [bisect.bisect_right(sorted_ends, starts[i], 0, k) for k, i in enumerate(order)]
+    return weighted_from_order(order, prev, weights)
+
+
+def weighted_from_order(order, prev, weights):
+    """
+    The DP behind weighted_indices. order lists the intervals by end time and
+    prev[k] is how many of the first k intervals in that order end at or
+    before the start of interval order[k].
+    """
+    n = len(order)
+
+    # best[k] is the best total weight using only the first k intervals
+    best = [0] * (n + 1)
+    for k, i in enumerate(order):
+        with_task = best[prev[k]] + weights[i]
+        best[k + 1] = with_task if with_task > best[k] else best[k]
+
+    # Walk back through the table to recover the chosen intervals
+    chosen = []
+    k = n
+    while k > 0:
+        if best[k] != best[k - 1]:
+            chosen.append(order[k - 1])
+            k = prev[k - 1]
+        else:
+            k -= 1
+    chosen.reverse()
+    return best[n], chosen
+
+
+def travel_weighted_indices(starts, ends, weights, locations, distances):
+    """
+    Weighted interval scheduling where consecutive intervals also need time
+    to walk between their locations. starts/ends are minutes since midnight
+    and distances[a][b] is the walking time in minutes.
+    Returns (total weight, chosen indices in end-time order).
+
+    Intervals are processed by end time, keeping for every location the end
+    times seen so far and a running best of schedules that end there. For
+    each interval one binary search per location finds the latest compatible
+    predecessor, so the cost is O(n * L * log n) for L distinct locations.
+    Shortest-path distances obey the triangle inequality, so checking only
+    the previous interval is enough.
+
+    distances may also be a function distances(a, b, depart) of the
+    departure minute. Its travel times must be FIFO (leaving later never
+    arrives sooner, as timedep guarantees), so arrival times still grow with
+    end times and the same binary search applies.
+    """
+    n = len(starts)
+    order = sorted(range(n), key=ends.__getitem__)
+    timed = callable(distances)
+
+    loc_ends = {}  # location -> end times in sorted order
+    loc_best = {}  # location -> running max of best_at over that list
+    loc_arg = {}   # location -> interval index achieving that max
+    best_at = [0] * n  # best total of a schedule that ends with interval i
+    back = [None] * n
+
+    for i in order:
+        here = locations[i]
+        value, pred = 0, None
+        for loc, ends_here in loc_ends.items():
+            if timed:
+                p = bisect.bisect_right(ends_here, starts[i], key=lambda end: end + distances(loc, here, end))
+            else:
+                p = bisect.bisect_right(ends_here, starts[i] - distances[loc][here])
+            if p and loc_best[loc][p - 1] > value:
+                value = loc_best[loc][p - 1]
+                pred = loc_arg[loc][p - 1]
+        best_at[i] = value + weights[i]
+        back[i] = pred
+
+        if here not in loc_ends:
+            loc_ends[here], loc_best[here], loc_arg[here] = [], [], []
+        loc_ends[here].append(ends[i])
+        if loc_best[here] and loc_best[here][-1] >= best_at[i]:
+            loc_best[here].append(loc_best[here][-1])
+            loc_arg[here].append(loc_arg[here][-1])
+        else:
+            loc_best[here].append(best_at[i])
+            loc_arg[here].append(i)
+
+    if n == 0:
+        return 0, []
+    last = max(range(n), key=best_at.__getitem__)
+    chosen = []
+    while last is not None:
+        chosen.append(last)
+        last = back[last]
+    chosen.reverse()
+    return best_at[chosen[-1]], chosen
+
+
+def weighted_schedule(tasks, weights=PRIORITY_WEIGHTS, distances=None):
+    """
+    Returns the schedule with the highest total priority weight (not the
+    most tasks), ordered by end time. Pass a building-to-building distance
+    table (walking minutes) to leave time to walk between tasks.
+    """
+    task_weights = [task_weight(task, weights) for task in tasks]
+    if distances is None:
+        starts = [task["start"] for task in tasks]
+        ends = [task["end"] for task in tasks]
+        _, chosen = weighted_indices(starts, ends, task_weights)
+    else:
+        starts = [to_minutes(task["start"]) for task in tasks]
+        ends = [to_minutes(task["end"]) for task in tasks]
+        locations = [task["location"] for task in tasks]
+        _, chosen = travel_weighted_indices(starts, ends, task_weights, locations, distances)
+    return [tasks[i] for i in chosen]
+
+
+class IncrementalSchedule:
+    """
+    Keeps the tasks in the selector's sort order together with the selector's
+    state at every position, so adding or removing one task only re-runs the
+    selection from that task's position onward.
+
+    Greedy modes stop as soon as the state reaches a position unchanged, which
+    means the rest of the selection is unchanged too. The weighted mode
+    recomputes the DP table from the changed position to the end. Weighted
+    scheduling with walking time has no prefix structure to reuse and is
+    recomputed in full.
+    """
+
+    def __init__(self, mode="end_time", distances=None, weights=PRIORITY_WEIGHTS):
+        self.mode = mode
+        self.distances = distances
+        self.weights = weights
+        self.evaluated = 0  # positions re-evaluated by the last update
+        self._seq = 0
+        self._key_of = {}  # id(task) -> sort key
+        self._keys = []
+        self._tasks = []
+        # Greedy state: last chosen task before each position, and whether it was picked
+        self._before = []
+        self._picked = []
+        # Weighted state: DP table over the tasks in end-time order
+        self._ends = []
+        self._prev = []
+        self._best = [0]
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def _sort_key(self, task):
+        self._seq += 1
+        if self.mode == "priority":
+            return (priority_rank(task), task["end"], self._seq)
+        return (task["end"], self._seq)
+
+    @property
+    def incremental(self):
+        return not (self.mode == "weighted" and self.distances is not None)
+
+    def configure(self, mode, distances=None):
+        """Switches mode or distance table, rebuilding the state if either changed"""
+        if mode != self.mode or distances is not self.distances:
+            tasks = list(self._tasks)
+            self.mode = mode
+            self.distances = distances
+            self.set_tasks(tasks)
+
+    def set_tasks(self, tasks):
+        self._key_of = {}
+        self._keys = []
+        self._tasks = []
+        # Sorting once and re-running from the start is cheaper than n inserts
+        keyed = sorted((self._sort_key(task), task) for task in tasks)
+        for key, task in keyed:
+            self._key_of[id(task)] = key
+            self._keys.append(key)
+            self._tasks.append(task)
+        n = len(self._tasks)
+        self._before = [None] * n
+        self._picked = [False] * n
+        self._ends = [task["end"] for task in self._tasks]
+        self._prev = [0] * n
+        self._best = [0] * (n + 1)
+        self._update(0, check_from=n)
+
+    def add(self, task):
+        key = self._sort_key(task)
+        p = bisect.bisect_left(self._keys, key)
+        self._key_of[id(task)] = key
+        self._keys.insert(p, key)
+        self._tasks.insert(p, task)
+        self._before.insert(p, None)
+        self._picked.insert(p, False)
+        self._ends.insert(p, task["end"])
+        self._prev.insert(p, 0)
+        self._best.insert(p + 1, 0)
+        self._update(p, check_from=p + 1)
+
+    def remove(self, task):
+        key = self._key_of.pop(id(task), None)
+        if key is None:
+            return False
+        p = bisect.bisect_left(self._keys, key)
+        del self._keys[p], self._tasks[p], self._before[p], self._picked[p]
+        del self._ends[p], self._prev[p], self._best[p + 1]
+        self._update(p, check_from=p)
+        return True
+
+    def _update(self, p, check_from):
+        if not self.incremental:
+            self.evaluated = len(self._tasks)
+        elif self.mode == "weighted":
+            self._rerun_weighted(p)
+        else:
+            self._rerun_greedy(p, check_from)
+
+    def _rerun_greedy(self, p, check_from):
+        """
+        Re-runs the greedy pass from position p. From check_from on, reaching
+        a position whose stored state matches means nothing after it changes.
+        """
+        tasks = self._tasks
+        if p == 0:
+            state = None
+        else:
+            state = tasks[p - 1] if self._picked[p - 1] else self._before[p - 1]
+        evaluated = 0
+        for k in range(p, len(tasks)):
+            if k >= check_from and self._before[k] is state:
+                break
+            self._before[k] = state
+            picked = fits_after(state, tasks[k], self.distances)
+            self._picked[k] = picked
+            if picked:
+                state = tasks[k]
+            evaluated += 1
+        self.evaluated = evaluated
+
+    def _rerun_weighted(self, p):
+        tasks = self._tasks
+        ends = self._ends
+        best = self._best
+        prev = self._prev
+        for k in range(p, len(tasks)):
+            task = tasks[k]
+            prev[k] = bisect.bisect_right(ends, task["start"], 0, k)
+            with_task = best[prev[k]] + task_weight(task, self.weights)
+            best[k + 1] = with_task if with_task > best[k] else best[k]
+        self.evaluated = len(tasks) - p
+
+    def result(self):
+        """The current recommended schedule"""
+        if not self.incremental:
+            return weighted_schedule(self._tasks, self.weights, self.distances)
+        if self.mode != "weighted":
+            return [task for task, picked in zip(self._tasks, self._picked) if picked]
+        chosen = []
+        k = len(self._tasks)
+        while k > 0:
+            if self._best[k] != self._best[k - 1]:
+                chosen.append(self._tasks[k - 1])
+                k = self._prev[k - 1]
+            else:
+                k -= 1
+        chosen.reverse()
+        return chosen
@@ -0,0 +1,168 @@
+"""
+Spatial indexes over map positions.
+
+SpatialGrid buckets nodes and edge bounding boxes into a uniform grid so a
+viewport query only looks at the cells the viewport covers instead of the
+whole graph. KDTree finds the point nearest to a coordinate, for picking a
+building under a click or snapping a GPS fix to the graph.
+"""
+import math
+
+import numpy as np
+
+NODES_PER_CELL = 4
+MAX_GRID = 1024
+LONG_EDGE_CELLS = 16  # edges whose box covers more cells than this are checked one by one
+
+
+class SpatialGrid:
+    """
+    Uniform grid over points xy (an (n, 2) array) and the segments edges
+    (an (m, 2) array of point indices). query(view) returns the indices of
+    the points inside view and the edges whose bounding box meets it.
+    """
+
+    def __init__(self, xy, edges=None):
+        self.xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        self.edges = np.zeros((0, 2), dtype=np.int64) if edges is None else np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        n = len(self.xy)
+        self.size = max(1, min(MAX_GRID, math.ceil(math.sqrt(n / NODES_PER_CELL))))
+        if n:
+            self.lo = self.xy.min(axis=0)
+            span = self.xy.max(axis=0) - self.lo
+        else:
+            self.lo = np.zeros(2)
+            span = np.ones(2)
+        self.cell_size = np.maximum(span, 1e-12) / self.size
+
+        # Points: cell -> slice of point_order, like a CSR matrix
+        cells = self._cells(self.xy)
+        keys = cells[:, 0] * self.size + cells[:, 1]
+        self.point_order = np.argsort(keys, kind="stable")
+        self.point_starts = np.searchsorted(keys[self.point_order], np.arange(self.size * self.size + 1))
+
+        # Edges: each one is listed in every cell its bounding box covers,
+        # except long ones, which go in a separate list
+        a, b = self.xy[self.edges[:, 0]], self.xy[self.edges[:, 1]]
+        self.edge_lo = np.minimum(a, b)
+        self.edge_hi = np.maximum(a, b)
+        c0, c1 = self._cells(self.edge_lo), self._cells(self.edge_hi)
+        spans = c1 - c0 + 1
+        covered = spans[:, 0] * spans[:, 1]
+        long = covered > LONG_EDGE_CELLS
+        self.long_edges = np.flatnonzero(long)
+
+        short = np.flatnonzero(~long)
+        counts = covered[short]
+        edge_ids = np.repeat(short, counts)
+        # Position of each repeated entry within its edge's box, row by row
+        step = np.arange(len(edge_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        height = spans[edge_ids, 1]
+        cx = c0[edge_ids, 0] + step // height
+        cy = c0[edge_ids, 1] + step % height
+        keys = cx * self.size + cy
+        order = np.argsort(keys, kind="stable")
+        self.edge_entries = edge_ids[order]
+        self.edge_starts = np.searchsorted(keys[order], np.arange(self.size * self.size + 1))
+
+    def _cells(self, xy):
+        return np.clip(((xy - self.lo) / self.cell_size).astype(np.int64), 0, self.size - 1)
+
+    def _gather(self, starts, entries, view):
+        """Entries listed in the cells the view covers (rows of cells are contiguous)"""
+        xmin, xmax, ymin, ymax = view
+        (cx0, cy0), (cx1, cy1) = self._cells(np.array([[xmin, ymin], [xmax, ymax]]))
+        chunks = [entries[starts[cx * self.size + cy0]:starts[cx * self.size + cy1 + 1]]
+                  for cx in range(cx0, cx1 + 1)]
+        return np.concatenate(chunks) if chunks else entries[:0]
+
+    def query_points(self, view):
+        xmin, xmax, ymin, ymax = view
+        points = self._gather(self.point_starts, self.point_order, view)
+        x, y = self.xy[points, 0], self.xy[points, 1]
+        return points[(x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)]
+
+    def query_edges(self, view):
+        xmin, xmax, ymin, ymax = view
+        edges = np.unique(np.concatenate([self._gather(self.edge_starts, self.edge_entries, view),
+                                          self.long_edges]))
+        lo, hi = self.edge_lo[edges], self.edge_hi[edges]
+        return edges[(lo[:, 0] <= xmax) & (hi[:, 0] >= xmin) & (lo[:, 1] <= ymax) & (hi[:, 1] >= ymin)]
+
+    def query(self, view):
+        return self.query_points(view), self.query_edges(view)
+
+
+class KDTree:
+    """
+    2-d tree over points xy for nearest-point lookups in O(log n). Points
+    are split at the median of the wider axis until at most leaf_size
+    remain, and leaves are scanned directly.
+    """
+
+    def __init__(self, xy, leaf_size=16):
+        self.xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(self.xy))
+        # Flat node arrays; a node is a leaf when its axis is -1
+        self.axis, self.split, self.left, self.right, self.start, self.end = [], [], [], [], [], []
+        if len(self.xy):
+            self._build(0, len(self.xy))
+        # The search loop reads single coordinates, which is faster from lists
+        self.xs = self.xy[self.order, 0].tolist()
+        self.ys = self.xy[self.order, 1].tolist()
+        self.ids = self.order.tolist()
+
+    def _build(self, start, end):
+        node = len(self.axis)
+        for values in (self.axis, self.split, self.left, self.right):
+            values.append(-1)
+        self.start.append(start)
+        self.end.append(end)
+        if end - start <= self.leaf_size:
+            return node
+        points = self.order[start:end]
+        spread = self.xy[points].max(axis=0) - self.xy[points].min(axis=0)
+        axis = int(spread[1] > spread[0])
+        mid = (end - start) // 2
+        self.order[start:end] = points[np.argpartition(self.xy[points, axis], mid)]
+        self.axis[node] = axis
+        self.split[node] = float(self.xy[self.order[start + mid], axis])
+        self.left[node] = self._build(start, start + mid)
+        self.right[node] = self._build(start + mid, end)
+        return node
+
+    def nearest(self, point):
+        """(index of the nearest point, its distance); (-1, inf) for an empty tree"""
+        if not self.ids:
+            return -1, float("inf")
+        qx, qy = float(point[0]), float(point[1])
+        best, best_d2 = -1, float("inf")
+        stack = [(0, 0.0)]  # (node, squared distance to the node's side of its parent's split)
+        while stack:
+            node, bound = stack.pop()
+            if bound >= best_d2:
+                continue
+            axis = self.axis[node]
+            if axis == -1:
+                xs, ys = self.xs, self.ys
+                for i in range(self.start[node], self.end[node]):
+                    dx = xs[i] - qx
+                    dy = ys[i] - qy
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2:
+                        best, best_d2 = i, d2
+                continue
+            diff = (qx if axis == 0 else qy) - self.split[node]
+            near, far = (self.left[node], self.right[node]) if diff < 0 else (self.right[node], self.left[node])
+            # Far side pushed first so the near side is searched first
+            stack.append((far, max(bound, diff * diff)))
+            stack.append((near, bound))
+        return self.ids[best], best_d2 ** 0.5
+
+    def nearest_many(self, points):
+        """Nearest point index and distance for each of points, as two arrays"""
+        found = [self.nearest(point) for point in np.asarray(points, dtype=float).reshape(-1, 2)]
+        indices = np.array([i for i, _ in found], dtype=np.int64)
+        distances = np.array([d for _, d in found], dtype=float)
+        return indices, distances
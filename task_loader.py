@@ -0,0 +1,307 @@
+import json
+import re
+from time import perf_counter
+from datetime import time
+from functools import lru_cache
+
+import metrics
+from recurrence import parse_days, parse_date
+
+# Same pattern strptime builds for "%I:%M %p", so valid and invalid input match
+_TIME_PATTERN = re.compile(r"(1[0-2]|0[1-9]|[1-9]):([0-5]\d|\d)\s+(am|pm)", re.IGNORECASE)
+
+# One time object per minute of the day, shared by every parsed task
+_TIMES = tuple(time(m // 60, m % 60) for m in range(24 * 60))
+
+
+@lru_cache(maxsize=4096)
+def parse_minutes(time_str):
+    """
+    Parses "H:MM AM/PM" into minutes since midnight. Accepts and rejects
+    exactly what datetime.strptime(time_str.strip(), "%I:%M %p") does, but
+    without going through strptime; repeated strings come from the cache
+    """
+    time_str = time_str.strip()
+    match = _TIME_PATTERN.fullmatch(time_str)
+    if match is None:
+        raise ValueError(f"time data {time_str!r} does not match format '%I:%M %p'")
+    hour = int(match.group(1)) % 12
+    if match.group(3).lower() == "pm":
+        hour += 12
+    return hour * 60 + int(match.group(2))
+
+
+def minutes_to_time(minutes):
+    return _TIMES[minutes]
+
+
+def format_minutes(minutes):
+    """Formats minutes since midnight the way task files write times, e.g. 1:05 PM"""
+    hour = (minutes // 60) % 12 or 12
+    return f"{hour}:{minutes % 60:02d} {'AM' if minutes < 12 * 60 else 'PM'}"
+
+
+#formatting time
+def parse_time(time_str):
+    return _TIMES[parse_minutes(time_str)]
+
+
+class LoadReport:
+    """Structured report of the records accepted and rejected while loading tasks"""
+
+    def __init__(self, max_samples=50):
+        self.accepted = 0
+        self.rejected = 0
+        self.reasons = {}  # reason -> number of records rejected for it
+        self.samples = []  # details for the first few rejects only
+        self.max_samples = max_samples
+
+    def accept(self):
+        self.accepted += 1
+
+    def reject(self, record, reason, detail):
+        """Counts a rejected record; keeps details for the first max_samples of them"""
+        self.rejected += 1
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append({"record": record, "reason": reason, "detail": detail})
+
+    def summary(self):
+        text = f"Loaded {self.accepted} tasks"
+        if self.rejected:
+            counts = ", ".join(f"{reason}: {count}" for reason, count in self.reasons.items())
+            text += f", rejected {self.rejected} ({counts})"
+        return text
+
+    def to_dict(self):
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "reasons": dict(self.reasons),
+            "samples": list(self.samples),
+        }
+
+
+def _iter_json_lines(f, report):
+    for number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except ValueError as e:
+            report.reject(number, "malformed", str(e))
+
+
+def _element_end(text, start):
+    """
+    Index of the top-level "," or "]" that ends the array element starting
+    at text[start], or None when text stops first. Only used to step over
+    a bad element, so a plain character loop is fast enough
+    """
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            if depth == 0 and ch == "]":
+                return i
+            depth = max(depth - 1, 0)
+        elif ch == "," and depth == 0:
+            return i
+    return None
+
+
+def _iter_json_array(f, report, chunk_size, max_record_size):
+    """
+    Decodes the elements of a top-level JSON array one at a time. Like a
+    bad line in JSON Lines, a bad element (or one not set off by exactly
+    one ",") is rejected and decoding carries on with the next one
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    state = "open"  # open: before "[", first/value: an element is due, next: "," or "]" is due
+    number = 0
+    bad_separator = None  # why the element being decoded is rejected even if it parses
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n":
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                report.reject(number + 1, "malformed", "unexpected end of file")
+                return
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = chunk, 0
+            continue
+
+        ch = buffer[pos]
+        if state == "open":
+            if ch != "[":
+                report.reject(0, "malformed", "expected a JSON array")
+                return
+            state = "first"
+            pos += 1
+            continue
+        if state == "next":
+            if ch == "]":
+                return
+            if ch == ",":
+                pos += 1
+            else:
+                bad_separator = f"expected ',' or ']' after record {number}, found {ch!r}"
+            state = "value"
+            continue
+        if ch == "]":
+            if state == "value":
+                report.reject(number + 1, "malformed", "trailing ',' before ']'")
+            return
+        if ch == ",":
+            report.reject(number + 1, "malformed", "expected a record before ','")
+            state = "value"
+            pos += 1
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            error = None
+        except json.JSONDecodeError as e:
+            # Cut off by the chunk, or really malformed when its end is in sight.
+            # Positions are reported relative to the element, not the buffer
+            item, end = None, _element_end(buffer, pos)
+            error = str(json.JSONDecodeError(e.msg, e.doc[pos:e.pos], e.pos - pos))
+        # A value that runs to the end of the buffer may still be cut off
+        if end is not None and (end < len(buffer) or eof):
+            number += 1
+            if error or bad_separator:
+                report.reject(number, "malformed", bad_separator or error)
+            else:
+                yield number, item
+            bad_separator = None
+            pos = end
+            state = "next"
+            continue
+
+        if eof:
+            report.reject(number + 1, "malformed", f"unexpected end of file ({error})")
+            return
+        if len(buffer) - pos > max_record_size:
+            report.reject(number + 1, "malformed", f"record longer than {max_record_size} characters "
+                                                   "and not valid JSON; the rest of the file was skipped")
+            return
+        # Only the unfinished element is carried over, so memory stays bounded by the chunk size
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_task_records(filename, report, chunk_size=65536, max_record_size=1 << 20):
+    """
+    Yields (record number, raw record) from a JSON array or JSON Lines file
+    without reading the whole file into memory
+    """
+    with open(filename, "r") as f:
+        first = ""
+        while True:
+            ch = f.read(1)
+            if not ch or not ch.isspace():
+                first = ch
+                break
+        f.seek(0)
+        if first == "[":
+            yield from _iter_json_array(f, report, chunk_size, max_record_size)
+        else:
+            yield from _iter_json_lines(f, report)
+
+
+def validate_records(records, valid_locations, report):
+    """Turns raw (number, record) pairs into task dicts, rejecting bad records into the report"""
+    valid_locations = set(valid_locations)
+    for number, item in records:
+        if not isinstance(item, dict):
+            report.reject(number, "not an object", repr(item)[:80])
+            continue
+
+        title = item.get("title") or item.get("className") or item.get("taskName")
+        try:
+            start_str = item["startTime"]
+            end_str = item["endTime"]
+            location = item["location"]
+        except KeyError as e:
+            report.reject(number, "missing field", f"missing {e.args[0]} for task '{title}'")
+            continue
+        priority = item.get("priority", "Medium")
+
+        if not isinstance(location, str) or location not in valid_locations:
+            report.reject(number, "invalid location", f"invalid location '{location}' for task '{title}'")
+            continue
+
+        try:
+            start = parse_time(start_str)
+            end = parse_time(end_str)
+        except (ValueError, AttributeError, TypeError):
+            report.reject(number, "invalid time", f"invalid time '{start_str}' - '{end_str}' for task '{title}'")
+            continue
+
+        if end <= start:
+            report.reject(number, "end before start", f"End time must be after start time for task '{title}'")
+            continue
+
+        task = {
+            "title": title,
+            "start": start,
+            "end" : end,
+            "location": location,
+            "priority" : priority
+        }
+
+        # Optional recurrence: weekday set and date range
+        try:
+            if item.get("days") is not None:
+                task["days"] = parse_days(item["days"])
+            if item.get("startDate") is not None:
+                task["start_date"] = parse_date(item["startDate"])
+            if item.get("endDate") is not None:
+                task["end_date"] = parse_date(item["endDate"])
+        except (ValueError, TypeError) as e:
+            report.reject(number, "invalid recurrence", f"{e} for task '{title}'")
+            continue
+        if "start_date" in task and "end_date" in task and task["end_date"] < task["start_date"]:
+            report.reject(number, "invalid recurrence", f"endDate is before startDate for task '{title}'")
+            continue
+
+        report.accept()
+        yield task
+
+
+def stream_tasks(filename, valid_locations, report=None):
+    """Generator of validated tasks from a JSON array or JSON Lines file"""
+    if report is None:
+        report = LoadReport()
+    return validate_records(iter_task_records(filename, report), valid_locations, report)
+
+
+#loading json tasks
+def load_validate_tasks(filename, valid_locations, report=None):
+    if not metrics.enabled:
+        return list(stream_tasks(filename, valid_locations, report))
+    if report is None:
+        report = LoadReport()
+    started = perf_counter()
+    tasks = list(stream_tasks(filename, valid_locations, report))
+    metrics.record_load(report, perf_counter() - started)
+    return tasks
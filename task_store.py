@@ -0,0 +1,143 @@
+import sys
+from array import array
+
+from scheduling import (PRIORITY_ORDER, PRIORITY_WEIGHTS, to_minutes, weighted_indices,
+                        weighted_from_order, travel_weighted_indices)
+from task_loader import minutes_to_time, stream_tasks
+
+# NumPy is optional; without it the store sorts with plain Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Priority code -> name (the codes are the PRIORITY_ORDER values)
+PRIORITY_NAMES = sorted(PRIORITY_ORDER, key=PRIORITY_ORDER.get)
+MEDIUM_CODE = PRIORITY_ORDER["Medium"]
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class TaskStore:
+    """
+    Columnar task storage for large batches: parallel compact arrays of
+    start/end minutes, priority codes and location indices, plus interned
+    titles, instead of one dict with datetime.time values per task
+    """
+
+    def __init__(self):
+        self.starts = array("H")      # minutes since midnight
+        self.ends = array("H")
+        self.priorities = array("B")  # PRIORITY_ORDER codes
+        self.locations = array("H")   # index into self.location_names
+        self.titles = []
+        self.location_names = []
+        self._location_index = {}
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        store = cls()
+        for task in tasks:
+            store.add_task(task)
+        return store
+
+    @classmethod
+    def from_file(cls, filename, valid_locations, report=None):
+        """Streams a task file straight into the arrays, never holding the dicts"""
+        return cls.from_tasks(stream_tasks(filename, valid_locations, report))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def location_code(self, location):
+        code = self._location_index.get(location)
+        if code is None:
+            code = len(self.location_names)
+            self._location_index[location] = code
+            self.location_names.append(location)
+        return code
+
+    def add(self, title, start, end, location, priority="Medium"):
+        """Appends one task; start and end are datetime.time or minutes"""
+        self.starts.append(to_minutes(start))
+        self.ends.append(to_minutes(end))
+        self.priorities.append(PRIORITY_ORDER.get(priority, MEDIUM_CODE))
+        self.locations.append(self.location_code(location))
+        self.titles.append(sys.intern(title) if isinstance(title, str) else title)
+
+    def add_task(self, task):
+        self.add(task["title"], task["start"], task["end"], task["location"], task.get("priority", "Medium"))
+
+    def task(self, i):
+        """Rebuilds the usual task dict for index i"""
+        return {
+            "title": self.titles[i],
+            "start": minutes_to_time(self.starts[i]),
+            "end": minutes_to_time(self.ends[i]),
+            "location": self.location_names[self.locations[i]],
+            "priority": PRIORITY_NAMES[self.priorities[i]],
+        }
+
+    def tasks(self, indices):
+        return [self.task(i) for i in indices]
+
+    def order_by_end(self):
+        """Task indices sorted by end time"""
+        if np is not None and len(self):
+            return np.argsort(np.frombuffer(self.ends, dtype=np.uint16), kind="stable").tolist()
+        return sorted(range(len(self)), key=self.ends.__getitem__)
+
+    def order_by_priority(self):
+        """Task indices sorted by priority, then end time"""
+        if np is not None and len(self):
+            ends = np.frombuffer(self.ends, dtype=np.uint16)
+            priorities = np.frombuffer(self.priorities, dtype=np.uint8)
+            return np.lexsort((ends, priorities)).tolist()
+        keys = [p * MINUTES_PER_DAY + e for p, e in zip(self.priorities, self.ends)]
+        return sorted(range(len(self)), key=keys.__getitem__)
+
+    def greedy_select(self, mode="end_time"):
+        """Same selection as scheduling.greedy_schedule, returned as indices"""
+        order = self.order_by_priority() if mode == "priority" else self.order_by_end()
+        starts = self.starts
+        ends = self.ends
+        result = []
+        last_end = -1
+        for i in order:
+            if starts[i] >= last_end:
+                result.append(i)
+                last_end = ends[i]
+        return result
+
+    def weighted_select(self, weights=PRIORITY_WEIGHTS, distances=None):
+        """
+        Same selection as scheduling.weighted_schedule, returned as indices.
+        distances is a building-to-building table keyed by location name, or
+        a function of (from, to, departure minute) like timedep.TravelTimes
+        """
+        code_weights = [weights.get(name, weights["Medium"]) for name in PRIORITY_NAMES]
+        task_weights = [code_weights[p] for p in self.priorities]
+
+        if callable(distances):
+            names = self.location_names
+            matrix = lambda a, b, depart: distances(names[a], names[b], depart)
+            _, chosen = travel_weighted_indices(self.starts, self.ends, task_weights, self.locations, matrix)
+            return chosen
+        if distances is not None:
+            # Re-key the table by location code so lookups stay list indexing
+            matrix = [[distances[a][b] for b in self.location_names] for a in self.location_names]
+            _, chosen = travel_weighted_indices(self.starts, self.ends, task_weights, self.locations, matrix)
+            return chosen
+
+        if np is None or not len(self):
+            _, chosen = weighted_indices(self.starts, self.ends, task_weights)
+            return chosen
+
+        # Vectorized: one argsort and one searchsorted for every binary search
+        ends = np.frombuffer(self.ends, dtype=np.uint16)
+        order = np.argsort(ends, kind="stable")
+        starts = np.frombuffer(self.starts, dtype=np.uint16)[order]
+        prev = np.searchsorted(ends[order], starts, side="right")
+        prev = np.minimum(prev, np.arange(len(order)))
+        _, chosen = weighted_from_order(order.tolist(), prev.tolist(), task_weights)
+        return chosen
@@ -0,0 +1,26 @@
+from datetime import date, time
+
+from interval_index import IntervalIndex
+from recurrence import occurs_on, parse_days
+
+
+def test_free_slots_are_the_gaps_between_intervals():
+    index = IntervalIndex()
+    index.insert(time(9), time(10), "a")
+    index.insert(time(9, 30), time(11), "b")
+    index.insert(time(12), time(13), "c")
+    assert index.free_slots(time(8), time(14)) == [
+        (time(8), time(9)), (time(11), time(12)), (time(13), time(14))]
+    index.remove("b")
+    assert index.free_slots(time(9), time(12)) == [(time(10), time(12))]
+
+
+def test_free_slots_only_count_tasks_on_that_day():
+    index = IntervalIndex()
+    index.insert(time(9), time(10), {"days": parse_days("MWF")})
+    index.insert(time(11), time(12), {"start_date": date(2026, 10, 20), "end_date": date(2026, 10, 20)})
+    monday, tuesday = date(2026, 10, 19), date(2026, 10, 20)
+    assert index.free_slots(time(8), time(13), keep=lambda task: occurs_on(task, monday)) == [
+        (time(8), time(9)), (time(10), time(13))]
+    assert index.free_slots(time(8), time(13), keep=lambda task: occurs_on(task, tuesday)) == [
+        (time(8), time(11)), (time(12), time(13))]
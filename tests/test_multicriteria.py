@@ -0,0 +1,50 @@
+import random
+
+import networkx as nx
+
+from campus_core import CampusGraph
+from multicriteria import CRITERIA, dominates, edge_costs
+
+
+def random_attributes(graph, rng):
+    for _, _, data in graph.edges(data=True):
+        data["weight"] = rng.randint(1, 9)
+        data["stairs"] = rng.choice([0, 0, 0, 1, 2])
+        data["shade"] = rng.choice([0, 0.5, 1])
+        if data["stairs"] and rng.random() < 0.3:
+            data["accessible"] = True
+
+
+def path_costs(graph, path):
+    return tuple(map(sum, zip(*(edge_costs(graph.edges[a, b]) for a, b in zip(path, path[1:])))))
+
+
+def test_pareto_routes_match_brute_force():
+    rng = random.Random(1)
+    checked = 0
+    for seed in range(40):
+        graph = nx.gnm_random_graph(9, 16, seed=seed)
+        if not nx.has_path(graph, 0, 8):
+            continue
+        random_attributes(graph, rng)
+        vectors = [path_costs(graph, path) for path in nx.all_simple_paths(graph, 0, 8)]
+        front = {v for v in vectors if not any(w != v and dominates(w, v) for w in vectors)}
+
+        routes, truncated = CampusGraph(graph).pareto_routes(0, 8, max_labels=1000)
+        assert not truncated
+        assert {tuple(route[key] for key in CRITERIA) for route in routes} == front
+        for route in routes:
+            assert path_costs(graph, route["path"]) == tuple(route[key] for key in CRITERIA)
+        checked += 1
+    assert checked > 20
+
+
+def test_pareto_routes_report_truncation():
+    rng = random.Random(3)
+    graph = nx.gnm_random_graph(30, 80, seed=3)
+    random_attributes(graph, rng)
+    campus = CampusGraph(graph)
+    full, truncated = campus.pareto_routes(0, 29, max_labels=10 ** 6)
+    assert not truncated and len(full) > 1
+    _, truncated = campus.pareto_routes(0, 29, max_labels=1)
+    assert truncated
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from bench import geometric_graph, grid_graph
+from campus_core import CampusGraph
+from partition import PartitionedRouter
+
+
+def check_routes(router, graph, queries, seed):
+    flat = CampusGraph(graph)
+    rng = random.Random(seed)
+    names = list(graph)
+    for _ in range(queries):
+        a, b = rng.choice(names), rng.choice(names)
+        distance, path = router.route(a, b)
+        assert distance == flat.dijkstra(a, b)[0]
+        if path:
+            assert path[0] == a and path[-1] == b
+            assert sum(graph.edges[u, v]["weight"] for u, v in zip(path, path[1:])) == distance
+
+
+@pytest.mark.parametrize("make_graph, size, parts", [
+    (grid_graph, 400, 4),
+    (geometric_graph, 600, 3),
+    (grid_graph, 100, 1),
+])
+def test_partitioned_routes_match_flat_dijkstra(make_graph, size, parts):
+    graph = make_graph(size, 7)
+    with PartitionedRouter(graph, parts, processes=False) as router:
+        check_routes(router, graph, 60, 0)
+
+
+def test_partitioned_routes_after_weight_updates():
+    graph = grid_graph(400, 7)
+    with PartitionedRouter(graph, 4, processes=False) as router:
+        rng = random.Random(1)
+        changes = {edge: rng.randint(1, 50) for edge in rng.sample(list(graph.edges), 20)}
+        for (u, v), weight in changes.items():
+            graph.edges[u, v]["weight"] = weight
+        router.update_weights(changes)
+        check_routes(router, graph, 40, 5)
+
+
+def test_partitioned_routes_with_worker_processes():
+    graph = grid_graph(225, 3)
+    with PartitionedRouter(graph, 2, processes=True) as router:
+        check_routes(router, graph, 20, 2)
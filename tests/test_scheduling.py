@@ -0,0 +1,60 @@
+import random
+from datetime import time
+from itertools import combinations
+
+from scheduling import IncrementalSchedule, greedy_schedule, task_weight, weighted_schedule
+
+PRIORITIES = ["High", "Medium", "Low"]
+
+
+def random_tasks(rng, n):
+    tasks = []
+    for i in range(n):
+        start = rng.randrange(8 * 60, 18 * 60)
+        end = start + rng.randrange(10, 120)
+        tasks.append({"title": f"t{i}", "start": time(start // 60, start % 60),
+                      "end": time(min(end, 23 * 60 + 59) // 60, min(end, 23 * 60 + 59) % 60),
+                      "location": "ECS", "priority": rng.choice(PRIORITIES)})
+    return tasks
+
+
+def compatible(tasks):
+    ordered = sorted(tasks, key=lambda task: task["start"])
+    return all(a["end"] <= b["start"] for a, b in zip(ordered, ordered[1:]))
+
+
+def total_weight(tasks):
+    return sum(task_weight(task) for task in tasks)
+
+
+def test_weighted_schedule_is_optimal():
+    rng = random.Random(1)
+    for _ in range(30):
+        tasks = random_tasks(rng, 9)
+        best = max(total_weight(subset)
+                   for size in range(len(tasks) + 1)
+                   for subset in combinations(tasks, size) if compatible(subset))
+        chosen = weighted_schedule(tasks)
+        assert compatible(chosen)
+        assert total_weight(chosen) == best
+
+
+def test_incremental_schedule_matches_full_recomputation():
+    rng = random.Random(2)
+    for mode in ("end_time", "priority", "weighted"):
+        schedule = IncrementalSchedule(mode)
+        current = []
+        for step in range(120):
+            if current and rng.random() < 0.35:
+                task = current.pop(rng.randrange(len(current)))
+                assert schedule.remove(task)
+            else:
+                task = random_tasks(rng, 1)[0]
+                current.append(task)
+                schedule.add(task)
+            result = schedule.result()
+            assert compatible(result)
+            if mode == "weighted":
+                assert total_weight(result) == total_weight(weighted_schedule(current))
+            else:
+                assert {id(t) for t in result} == {id(t) for t in greedy_schedule(current, mode)}, step
@@ -0,0 +1,58 @@
+import io
+from datetime import datetime
+
+import pytest
+
+from task_loader import LoadReport, _iter_json_array, parse_time
+
+RECORD = '{"t": "a,]\\"x"}'
+
+
+def strptime_or_error(text):
+    try:
+        return datetime.strptime(text.strip(), "%I:%M %p").time()
+    except ValueError:
+        return ValueError
+
+
+def parse_or_error(text):
+    try:
+        return parse_time(text)
+    except ValueError:
+        return ValueError
+
+
+def test_parse_time_matches_strptime():
+    samples = [f"{h}:{m:02d} {ampm}" for h in range(0, 14) for m in (0, 5, 59, 60) for ampm in ("AM", "PM")]
+    samples += ["9:30 am", "09:30 PM", " 9:30 AM ", "9:30AM", "9:30  AM", "9:3 AM", "9:30", "",
+                "12:00 AM", "12:00 PM", "1:00 XM", "a:00 AM", "009:30 AM", "9:300 AM"]
+    for text in samples:
+        assert parse_or_error(text) == strptime_or_error(text), text
+
+
+def decode(text, chunk_size):
+    report = LoadReport()
+    records = list(_iter_json_array(io.StringIO(text), report, chunk_size, 1 << 20))
+    return records, report.reasons, [(s["record"], s["detail"]) for s in report.samples]
+
+
+@pytest.mark.parametrize("text", [
+    f'[{RECORD}, 1, "s", [1, [2]], {{"c": {{}}}}]',
+    f'[{RECORD}, {{"a": }}, {{"b": 1}}, 7]',
+    f'[,,{RECORD},,]',
+    f'[{RECORD}{RECORD}, 3]',
+    '[1, {"a": [1, 2}, {"b": 1}]',
+    f'[{RECORD}, {{"b": [1, 2]}}',
+    '[ ]',
+])
+def test_json_array_does_not_depend_on_chunk_size(text):
+    expected = decode(text, 65536)
+    for chunk_size in (1, 2, 3, 7):
+        assert decode(text, chunk_size) == expected
+
+
+def test_json_array_rejects_bad_elements_and_keeps_going():
+    records, reasons, samples = decode(f'[{RECORD}, {{"a": }}, {{"b": 1}}, 7]', 4)
+    assert records == [(1, {"t": 'a,]"x'}), (3, {"b": 1}), (4, 7)]
+    assert reasons == {"malformed": 1}
+    assert samples[0][0] == 2
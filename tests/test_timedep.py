@@ -0,0 +1,80 @@
+import random
+
+import networkx as nx
+import pytest
+
+from campus_core import CampusGraph
+from timedep import DAY, Profile, gate_profile, shuttle_profile
+
+
+def test_profile_rejects_non_fifo():
+    with pytest.raises(ValueError):
+        Profile([(0, 30), (10, 0)])
+    with pytest.raises(ValueError):
+        Profile([(100, 10), (100, 5)])
+    # Falling by exactly one minute per minute is still FIFO
+    Profile([(0, 10), (10, 0)])
+
+
+def test_shuttle_and_gate_profiles():
+    shuttle = shuttle_profile(5, [480, 510, 540])
+    assert shuttle(479) == pytest.approx(6)
+    # Reaching the stop as it leaves means waiting for the next one
+    assert shuttle(480) == pytest.approx(35)
+    assert shuttle(541) == pytest.approx(1385 - 1)
+    gate = gate_profile(3, 420, 1320)
+    assert gate(419) == pytest.approx(4)
+    assert gate(1000) == pytest.approx(3)
+    assert gate(1320) == pytest.approx(3 + 540)
+
+
+def random_profile(rng):
+    points = []
+    t = 0
+    while t < DAY:
+        points.append((t, rng.uniform(1, 20)))
+        t += rng.uniform(30, 300)
+    try:
+        return Profile(points)
+    except ValueError:
+        return None
+
+
+def relaxed_arrivals(graph, source, depart):
+    """Earliest arrivals by relaxing every edge until nothing changes"""
+    best = {n: float("inf") for n in graph}
+    best[source] = depart
+    changed = True
+    while changed:
+        changed = False
+        for u, v, data in graph.edges(data=True):
+            for a, b in ((u, v), (v, u)):
+                if best[a] == float("inf"):
+                    continue
+                profile = data.get("profile")
+                arrival = best[a] + (profile(best[a]) if profile else data["weight"])
+                if arrival < best[b] - 1e-9:
+                    best[b] = arrival
+                    changed = True
+    return best
+
+
+def test_earliest_arrivals_match_relaxation():
+    rng = random.Random(3)
+    for seed in range(30):
+        graph = nx.gnm_random_graph(12, 25, seed=seed)
+        for _, _, data in graph.edges(data=True):
+            data["weight"] = rng.randint(1, 10)
+            if rng.random() < 0.6:
+                profile = random_profile(rng)
+                if profile:
+                    data["profile"] = profile
+        campus = CampusGraph(graph)
+        depart = rng.uniform(0, DAY)
+        arrivals = campus.earliest_arrivals(0, depart)
+        expected = relaxed_arrivals(graph, 0, depart)
+        for node in graph:
+            assert arrivals[node] == pytest.approx(expected[node], abs=1e-6)
+        minutes, path = campus.travel_time(0, 11, depart)
+        if path:
+            assert depart + minutes == pytest.approx(arrivals[11])
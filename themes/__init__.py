@@ -0,0 +1,144 @@
+"""
+Look-and-feel plug-ins for the navigator.
+
+A theme is a module that defines any of:
+
+    WINDOW_TITLE, GEOMETRY  window title and size
+    HEADER                  (title, subtitle) shown above the tabs, or None
+    STATUS_BAR              whether to show a status bar at the bottom
+    RESULT_PANELS           whether search and route results sit in a bordered
+                            panel with a header (a terminal-style output box)
+    RESET_BUTTONS           whether the search and route tabs get a Reset button
+    COLORS, FONTS           named colors and (family, size, ...) fonts
+    TABS, MESSAGES          tab names and the texts the navigator shows
+    HOME_TEXT               the welcome text on the Home tab
+    MAP_STYLE               overrides for campus_core.MAP_STYLE
+    make_button(master, kind="primary", **kwargs)
+    configure_styles(root)  ttk styling
+
+Anything a theme leaves out falls back to DEFAULTS. Themes are imported
+only when first asked for, so unused ones never load.
+"""
+import importlib
+
+# name -> module implementing it; register_theme adds more
+_MODULES = {
+    "classic": "themes.classic",
+    "cyberpunk": "themes.cyberpunk",
+    "minimal": "themes.minimal",
+}
+_loaded = {}
+
+DEFAULTS = {
+    "WINDOW_TITLE": "CSUF Smart Campus Navigator",
+    "GEOMETRY": "800x600",
+    "HEADER": None,
+    "STATUS_BAR": False,
+    "RESULT_PANELS": False,
+    "RESET_BUTTONS": False,
+    "TABS": {
+        "home": "Home",
+        "search": "Search Buildings",
+        "path": "Find Shortest Path",
+        "schedule": "Create a Schedule",
+        "diagnostics": "Diagnostics",
+    },
+    "MESSAGES": {
+        "ready": "Ready",
+        "home_title": "CSUF Smart Campus Navigator",
+        "search_title": "Search Buildings",
+        "schedule_title": "Create a Schedule",
+        "search_prompt": "Enter the name of the building to search:",
+        "search_button": "Search",
+        "search_waiting": "",
+        "search_results_header": "Search Results",
+        "empty_query": "Please enter a building name",
+        "found": "{building} was found!",
+        "not_found": "{query} was not found.",
+        "show_on_map": "Show on Map",
+        "path_title": "Find Shortest Path",
+        "path_prompt": "",
+        "start_label": "Start: ",
+        "end_label": "End: ",
+        "path_button": "Show Distance",
+        "path_waiting": "",
+        "path_results_header": "Route Information",
+        "reset_button": "Reset",
+        "show_path": "Show Path on Map",
+        "play_path": "Play Route on Map",
+        "missing_buildings": "Please select both buildings.",
+        "unknown_building": "{building} is not a campus building.",
+        "search_failed": "Search failed: {error}",
+        "path_failed": "Could not find a path: {error}",
+        "task_failed": "Something went wrong: {error}",
+        "same_building": "You're already there!",
+        "calculating": "Finding the shortest path from {start} to {end}...",
+        "path_found": "Shortest path from {start} to {end} is {distance} units.",
+        "path_details": "Path: {path}",
+        "map_button": "Show Campus Map",
+        "status_found": "Building found: {building}",
+        "status_not_found": "Search failed: {query} not found",
+        "status_empty_query": "Search failed: Empty query",
+        "status_search_reset": "Search cleared",
+        "status_path_reset": "Navigation reset",
+        "status_path": "Route calculated: {start} to {end}",
+        "status_map": "Showing campus map",
+        "status_picked_start": "Start picked on the map: {building}",
+        "status_picked_end": "End picked on the map: {building}",
+    },
+    "HOME_TEXT": "Welcome to the CSUF Smart Campus Navigator!",
+    "MAP_STYLE": {},
+}
+
+
+def available_themes():
+    return sorted(_MODULES)
+
+
+def register_theme(name, module):
+    """Makes a theme module (by import path) available under name"""
+    _MODULES[name] = module
+    _loaded.pop(name, None)
+
+
+def load_theme(name):
+    """Imports the named theme on first use and returns it as a Theme"""
+    theme = _loaded.get(name)
+    if theme is None:
+        if name not in _MODULES:
+            raise ValueError(f"unknown theme '{name}' (available: {', '.join(available_themes())})")
+        theme = Theme(name, importlib.import_module(_MODULES[name]))
+        _loaded[name] = theme
+    return theme
+
+
+class Theme:
+    """A loaded theme module with DEFAULTS filled in for what it leaves out"""
+
+    def __init__(self, name, module):
+        self.name = name
+        self.module = module
+        self.window_title = getattr(module, "WINDOW_TITLE", DEFAULTS["WINDOW_TITLE"])
+        self.geometry = getattr(module, "GEOMETRY", DEFAULTS["GEOMETRY"])
+        self.header = getattr(module, "HEADER", DEFAULTS["HEADER"])
+        self.status_bar = getattr(module, "STATUS_BAR", DEFAULTS["STATUS_BAR"])
+        self.result_panels = getattr(module, "RESULT_PANELS", DEFAULTS["RESULT_PANELS"])
+        self.reset_buttons = getattr(module, "RESET_BUTTONS", DEFAULTS["RESET_BUTTONS"])
+        self.colors = module.COLORS
+        self.fonts = module.FONTS
+        self.tabs = dict(DEFAULTS["TABS"], **getattr(module, "TABS", {}))
+        self.messages = dict(DEFAULTS["MESSAGES"], **getattr(module, "MESSAGES", {}))
+        self.home_text = getattr(module, "HOME_TEXT", DEFAULTS["HOME_TEXT"])
+        self.map_style = dict(DEFAULTS["MAP_STYLE"], **getattr(module, "MAP_STYLE", {}))
+
+    def text(self, key, **values):
+        return self.messages[key].format(**values)
+
+    def make_button(self, master, kind="primary", **kwargs):
+        """A button of the theme's class; kind picks its colors (primary, path, secondary)"""
+        return self.module.make_button(master, kind, **kwargs)
+
+    def configure_styles(self, root):
+        configure = getattr(self.module, "configure_styles", None)
+        if configure is not None:
+            configure(root)
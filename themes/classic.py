@@ -0,0 +1,78 @@
+"""The original look: light background, orange titles and raised buttons"""
+import tkinter as tk
+
+COLORS = {
+    "window": "#F5F5F5",  # Main background color
+    "bg": None,           # Widgets keep the toolkit's default background
+    "panel": "#F5F5F5",
+    "text": "black",
+    "muted": "black",
+    "title": "#FF6600",   # Orange for titles
+    "header": "#FF6600",
+    "subtitle": "#FF6600",
+    "success": "#008000",  # Green for success messages
+    "warning": "#008000",
+    "error": "#B22222",    # Red for error messages
+    "entry_bg": "white",
+    "entry_fg": "black",
+}
+
+FONTS = {
+    "header": ("Helvetica", 18, "bold"),
+    "subtitle": ("Helvetica", 12),
+    "title": ("Helvetica", 16, "bold"),
+    "heading": ("Helvetica", 14, "bold"),
+    "body": ("Helvetica", 12),
+    "result": ("Helvetica", 14),
+    "small": ("Helvetica", 10),
+    "italic": ("Helvetica", 10, "italic"),
+    "mono": ("Courier", 9),
+}
+
+MESSAGES = {
+    "path_button": "Blammo - Show Distance",
+}
+
+HOME_TEXT = """Welcome to the CSUF Smart Campus Navigator!
+
+        This application helps you navigate around the CSUF campus.
+
+        Features:
+        • Search for buildings
+        • View the campus map
+        • Find the shortest path between buildings
+        • Create an ideal schedule
+
+        Select a tab above to get started.
+        """
+
+# (background, hover background, text color) for each kind of button
+BUTTON_COLORS = {
+    "primary": ("#FFCC99", "#FFA64D", "black"),  # Light orange, darker on hover
+    "search": ("#FFA64D", "#FFA64D", "white"),
+    "path": ("#99CCFF", "#66B2FF", "black"),     # Light blue for Dijkstra buttons
+    "secondary": ("#FFCC99", "#FFA64D", "black"),
+}
+
+
+class ClassicButton(tk.Button):
+    """Raised button that darkens while the mouse is over it"""
+
+    def __init__(self, master=None, hover_bg=None, **kwargs):
+        kwargs.setdefault("relief", "raised")
+        kwargs.setdefault("bd", 3)
+        kwargs.setdefault("font", FONTS["body"])
+        super().__init__(master, **kwargs)
+        self.original_bg = kwargs.get("bg")
+        self.hover_bg = hover_bg or self.original_bg
+        self.bind("<Enter>", lambda e: self.config(bg=self.hover_bg))
+        self.bind("<Leave>", lambda e: self.config(bg=self.original_bg))
+
+
+def make_button(master, kind="primary", **kwargs):
+    bg, hover, fg = BUTTON_COLORS[kind]
+    kwargs.setdefault("bg", bg)
+    kwargs.setdefault("fg", fg)
+    if kind == "path":
+        kwargs.setdefault("font", ("Helvetica", 12, "bold"))
+    return ClassicButton(master, hover_bg=hover, **kwargs)
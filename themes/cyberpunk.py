@@ -0,0 +1,222 @@
+"""Cyberpunk edition: dark panels, neon colors and terminal-style messages"""
+import tkinter as tk
+from tkinter import ttk
+
+# Configure cyberpunk style settings
+DARK_BG = "#121212"  # Nearly black background
+PANEL_BG = "#1E1E1E"  # Dark panel background
+NEON_BLUE = "#00FFFF"  # Cyan neon blue
+NEON_PINK = "#FF00FF"  # Magenta neon pink
+NEON_GREEN = "#39FF14"  # Electric green
+NEON_ORANGE = "#FF9500"  # Neon orange
+NEON_PURPLE = "#BD00FF"  # Neon purple
+TEXT_COLOR = "#FFFFFF"  # White text
+SECONDARY_TEXT = "#AAAAAA"  # Light gray
+
+WINDOW_TITLE = "CSUF Smart Campus Navigator // CYBERPUNK EDITION"
+GEOMETRY = "900x650"
+HEADER = ("CSUF SMART CAMPUS NAVIGATOR", "// CYBERPUNK EDITION 2.0")
+STATUS_BAR = True
+RESULT_PANELS = True
+RESET_BUTTONS = True
+
+COLORS = {
+    "window": DARK_BG,
+    "bg": DARK_BG,
+    "panel": PANEL_BG,
+    "text": TEXT_COLOR,
+    "muted": SECONDARY_TEXT,
+    "title": NEON_ORANGE,
+    "header": NEON_BLUE,
+    "subtitle": NEON_PINK,
+    "success": NEON_GREEN,
+    "warning": NEON_ORANGE,
+    "error": NEON_PINK,
+    "status": NEON_GREEN,
+    "entry_bg": PANEL_BG,
+    "entry_fg": NEON_BLUE,
+    "panel_header": NEON_PURPLE,
+}
+
+FONTS = {
+    "header": ("Consolas", 18, "bold"),
+    "subtitle": ("Consolas", 12),
+    "title": ("Consolas", 16, "bold"),
+    "heading": ("Consolas", 14, "bold"),
+    "body": ("Consolas", 12),
+    "result": ("Consolas", 12),
+    "small": ("Consolas", 10),
+    "italic": ("Consolas", 10, "italic"),
+    "mono": ("Consolas", 9),
+}
+
+TABS = {
+    "home": "HOME_SYS",
+    "search": "FIND_NODE",
+    "path": "PATH_CALC",
+    "schedule": "SCHED_OPT",
+    "diagnostics": "DIAG_LOG",
+}
+
+MESSAGES = {
+    "ready": "SYSTEM READY",
+    "home_title": "[ WELCOME TO THE GRID ]",
+    "search_title": "// NODE SEARCH PROTOCOL",
+    "schedule_title": "// SCHEDULE OPTIMIZER",
+    "search_prompt": "INPUT TARGET NODE IDENTIFIER:",
+    "search_button": "SCAN",
+    "search_waiting": "> AWAITING SEARCH QUERY...",
+    "search_results_header": "// SCAN RESULTS",
+    "empty_query": "> ERROR: EMPTY SEARCH QUERY",
+    "found": "> TARGET NODE [{building}] LOCATED",
+    "not_found": "> ERROR: NODE [{query}] NOT FOUND IN DATABASE",
+    "show_on_map": "VISUALIZE NODE",
+    "path_title": "// OPTIMAL PATH CALCULATOR",
+    "path_prompt": "SELECT SOURCE AND DESTINATION NODES:",
+    "start_label": "SOURCE:",
+    "end_label": "DESTINATION:",
+    "path_button": "CALCULATE OPTIMAL PATH",
+    "path_waiting": "> AWAITING NODE SELECTION...",
+    "path_results_header": "// PATH CALCULATION RESULTS",
+    "reset_button": "RESET",
+    "show_path": "VISUALIZE PATH",
+    "play_path": "RUN PATH SIMULATION",
+    "missing_buildings": "> ERROR: SOURCE OR DESTINATION NODE NOT SPECIFIED",
+    "unknown_building": "> ERROR: NODE [{building}] NOT IN NETWORK",
+    "search_failed": "> ERROR: SCAN FAILED ({error})",
+    "path_failed": "> ERROR: PATH CALCULATION FAILED ({error})",
+    "task_failed": "SYSTEM FAULT: {error}",
+    "same_building": "> ALERT: SOURCE AND DESTINATION NODES ARE IDENTICAL",
+    "calculating": "> CALCULATING PATH {start} → {end}...",
+    "path_found": "> OPTIMAL PATH FOUND: DISTANCE = {distance} UNITS",
+    "path_details": "> PATH: {path}",
+    "map_button": "LAUNCH MAP_VIEW",
+    "status_found": "NODE FOUND: {building}",
+    "status_not_found": "SEARCH FAILED: {query} NOT FOUND",
+    "status_empty_query": "SEARCH FAILED: EMPTY QUERY",
+    "status_search_reset": "SEARCH BUFFER CLEARED",
+    "status_path_reset": "PATH CALCULATION RESET",
+    "status_path": "PATH CALCULATED: {start} TO {end}",
+    "status_map": "DISPLAYING CAMPUS NETWORK MAP",
+    "status_picked_start": "SOURCE NODE LOCKED: {building}",
+    "status_picked_end": "TARGET NODE LOCKED: {building}",
+}
+
+HOME_TEXT = """
+        >>> CAMPUS NAVIGATION SYSTEM ONLINE <<<
+
+        SELECT MODULE:
+        • FIND_NODE - Search for buildings in the campus network
+        • PATH_CALC - Calculate optimal routes between nodes
+        • SCHED_OPT - Build an optimal class schedule
+        • MAP_VIEW - Visualize the entire campus network
+
+        [ SYSTEM V2.0 - POWERED BY NETRUNNER OS ]
+        """
+
+MAP_STYLE = {
+    "mpl_style": "dark_background",
+    "background": DARK_BG,
+    "font_family": "monospace",
+    "edge_color": "#333333",
+    "edge_alpha": 0.4,
+    "edge_width": 1.0,
+    "path_color": NEON_GREEN,
+    "path_width": 2.5,
+    "path_glow_width": 8,
+    "arrow_size": 15,
+    "node_colors": {"start": NEON_BLUE, "end": NEON_PINK, "path": NEON_GREEN, "other": "#444444",
+                    "highlight": NEON_ORANGE, "plain": "#666666"},
+    "node_sizes": {"start": 800, "end": 800, "path": 600, "other": 400,
+                   "highlight": 800, "plain": 500},
+    "node_glow": True,
+    "node_edge_color": "white",
+    "node_edge_width": 1.0,
+    "label_color": "white",
+    "edge_label_color": NEON_BLUE,
+    "title_color": NEON_GREEN,
+    "title_weight": "bold",
+    "footer_color": NEON_BLUE,
+    "path_title": "OPTIMAL PATH: {path}",
+    "map_title": "CSUF CAMPUS NETWORK MAP",
+    "distance_footer": "TOTAL DISTANCE: {distance} UNITS",
+    "highlight_footer": "HIGHLIGHTED NODE: {building}",
+    "walker_color": NEON_PINK,
+}
+
+BUTTON_COLORS = {
+    "primary": NEON_BLUE,
+    "search": NEON_GREEN,
+    "path": NEON_ORANGE,
+    "secondary": NEON_PINK,
+}
+
+
+def configure_styles(root):
+    style = ttk.Style(root)
+
+    # Configure the notebook style
+    style.configure("TNotebook", background=DARK_BG, borderwidth=0)
+    style.configure("TNotebook.Tab", background=PANEL_BG, foreground=TEXT_COLOR,
+                    padding=[10, 5], font=("Consolas", 10, "bold"))
+    style.map("TNotebook.Tab", background=[("selected", DARK_BG)],
+              foreground=[("selected", NEON_BLUE)])
+
+    # Configure frame style
+    style.configure("TFrame", background=DARK_BG)
+
+    # Configure label style
+    style.configure("TLabel", background=DARK_BG, foreground=TEXT_COLOR, font=("Consolas", 10))
+
+    # Configure combobox style
+    style.configure("TCombobox", fieldbackground=PANEL_BG, background=PANEL_BG,
+                    foreground=TEXT_COLOR, arrowcolor=NEON_GREEN)
+    style.map("TCombobox", fieldbackground=[("readonly", PANEL_BG)],
+              selectbackground=[("readonly", NEON_BLUE)])
+
+
+class NeonButton(tk.Button):
+    """Custom button class with neon glow effect"""
+
+    def __init__(self, master=None, **kwargs):
+        # Default configuration
+        kwargs.setdefault("relief", "flat")
+        kwargs.setdefault("borderwidth", 0)
+        kwargs.setdefault("padx", 15)
+        kwargs.setdefault("pady", 8)
+        kwargs.setdefault("font", ("Consolas", 10, "bold"))
+        kwargs.setdefault("cursor", "hand2")
+
+        # Initialize the button
+        super().__init__(master, **kwargs)
+
+        # Store original background
+        self.original_bg = kwargs.get("bg", kwargs.get("background", PANEL_BG))
+        self.hover_bg = kwargs.get("activebackground", self.calculate_hover_color(self.original_bg))
+
+        # Bind events
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
+
+    def calculate_hover_color(self, color):
+        """Calculate a brighter version of the color for hover effect"""
+        if color == NEON_BLUE: return "#80FFFF"
+        if color == NEON_PINK: return "#FF80FF"
+        if color == NEON_GREEN: return "#80FF80"
+        if color == NEON_ORANGE: return "#FFAA40"
+        if color == NEON_PURPLE: return "#D580FF"
+        return color  # Default fallback
+
+    def _on_enter(self, event):
+        """Mouse enter event - brighten button"""
+        self.config(bg=self.hover_bg)
+
+    def _on_leave(self, event):
+        """Mouse leave event - restore button"""
+        self.config(bg=self.original_bg)
+
+
+def make_button(master, kind="primary", **kwargs):
+    kwargs.setdefault("bg", BUTTON_COLORS[kind])
+    kwargs.setdefault("fg", TEXT_COLOR)
+    return NeonButton(master, **kwargs)
@@ -0,0 +1,204 @@
+"""Minimal edition: white panels, one blue accent and flat buttons"""
+import tkinter as tk
+from tkinter import ttk
+
+# Configure minimalist style settings
+PRIMARY_COLOR = "#2979FF"  # Blue accent
+SECONDARY_COLOR = "#757575"  # Medium gray
+BG_COLOR = "#FFFFFF"  # White background
+PANEL_BG = "#F5F5F5"  # Light gray panel
+TEXT_COLOR = "#212121"  # Nearly black text
+HIGHLIGHT_COLOR = "#FF5722"  # Orange highlight
+SUCCESS_COLOR = "#4CAF50"  # Green
+WARNING_COLOR = "#FFC107"  # Amber
+ERROR_COLOR = "#F44336"  # Red
+
+GEOMETRY = "900x650"
+HEADER = ("CSUF Smart Campus Navigator", "")
+STATUS_BAR = True
+RESULT_PANELS = True
+RESET_BUTTONS = True
+
+COLORS = {
+    "window": BG_COLOR,
+    "bg": BG_COLOR,
+    "panel": PANEL_BG,
+    "text": TEXT_COLOR,
+    "muted": SECONDARY_COLOR,
+    "title": PRIMARY_COLOR,
+    "header": PRIMARY_COLOR,
+    "subtitle": SECONDARY_COLOR,
+    "success": SUCCESS_COLOR,
+    "warning": WARNING_COLOR,
+    "error": ERROR_COLOR,
+    "status": SECONDARY_COLOR,
+    "entry_bg": BG_COLOR,
+    "entry_fg": TEXT_COLOR,
+    "panel_header": SECONDARY_COLOR,
+}
+
+FONTS = {
+    "header": ("Helvetica", 18, "bold"),
+    "subtitle": ("Helvetica", 12),
+    "title": ("Helvetica", 16, "bold"),
+    "heading": ("Helvetica", 14, "bold"),
+    "body": ("Helvetica", 11),
+    "result": ("Helvetica", 12),
+    "small": ("Helvetica", 10),
+    "italic": ("Helvetica", 10, "italic"),
+    "mono": ("Courier", 9),
+}
+
+TABS = {
+    "home": "Home",
+    "search": "Search",
+    "path": "Navigation",
+    "schedule": "Schedule",
+    "diagnostics": "Diagnostics",
+}
+
+MESSAGES = {
+    "home_title": "Welcome to Campus Navigator",
+    "search_title": "Building Search",
+    "schedule_title": "Schedule",
+    "search_prompt": "Enter building name to search:",
+    "search_waiting": "Enter a building name to search",
+    "found": "Building '{building}' found",
+    "not_found": "Building '{query}' not found",
+    "path_title": "Campus Navigation",
+    "path_prompt": "Select start and destination buildings:",
+    "start_label": "Start:",
+    "end_label": "Destination:",
+    "path_button": "Find Route",
+    "path_waiting": "Select start and destination buildings",
+    "show_path": "View Route on Map",
+    "play_path": "Play Route",
+    "missing_buildings": "Please select both start and destination",
+    "same_building": "Start and destination are the same",
+    "calculating": "Finding a route from {start} to {end}...",
+    "path_found": "Route found: {distance} distance units",
+    "map_button": "View Map",
+    "status_found": "Building found: {building}",
+    "status_not_found": "Search failed: {query} not found",
+    "status_path": "Route calculated: {start} to {end}",
+    "status_map": "Showing campus map",
+}
+
+HOME_TEXT = """
+        This application helps you navigate the CSUF campus efficiently.
+
+        Available features:
+        • Search - Find buildings on campus
+        • Navigation - Calculate optimal routes between buildings
+        • Schedule - Plan your classes and tasks
+        • Map View - Visualize the campus network
+
+        Select an option from the tabs above or use the Map View button below.
+        """
+
+MAP_STYLE = {
+    "font_family": "sans-serif",
+    "edge_color": SECONDARY_COLOR,
+    "edge_alpha": 0.6,
+    "path_color": PRIMARY_COLOR,
+    "path_width": 2.5,
+    "arrow_size": 15,
+    "node_colors": {"start": PRIMARY_COLOR, "end": HIGHLIGHT_COLOR, "path": SUCCESS_COLOR,
+                    "other": SECONDARY_COLOR, "highlight": HIGHLIGHT_COLOR, "plain": SECONDARY_COLOR},
+    "node_sizes": {"start": 700, "end": 700, "path": 600, "other": 400,
+                   "highlight": 700, "plain": 500},
+    "node_edge_color": "white",
+    "label_color": "white",
+    "edge_label_color": TEXT_COLOR,
+    "title_color": PRIMARY_COLOR,
+    "title_weight": "bold",
+    "footer_color": SECONDARY_COLOR,
+    "path_title": "Route: {path}",
+    "map_title": "CSUF Campus Map",
+    "walker_color": HIGHLIGHT_COLOR,
+    "walker_size": 10,
+    "walked_width": 4.0,
+}
+
+BUTTON_COLORS = {
+    "primary": PRIMARY_COLOR,
+    "search": PRIMARY_COLOR,
+    "path": PRIMARY_COLOR,
+    "secondary": SECONDARY_COLOR,
+}
+
+
+# Style configuration for ttk elements
+def configure_styles(root):
+    style = ttk.Style(root)
+
+    # Configure the notebook style
+    style.configure("TNotebook", background=BG_COLOR, borderwidth=0)
+    style.configure("TNotebook.Tab", background=PANEL_BG, foreground=TEXT_COLOR,
+                    padding=[12, 6], font=("Helvetica", 10))
+    style.map("TNotebook.Tab", background=[("selected", BG_COLOR)],
+              foreground=[("selected", PRIMARY_COLOR)])
+
+    # Configure frame style
+    style.configure("TFrame", background=BG_COLOR)
+
+    # Configure label style
+    style.configure("TLabel", background=BG_COLOR, foreground=TEXT_COLOR, font=("Helvetica", 10))
+
+    # Configure combobox style
+    style.configure("TCombobox", fieldbackground=BG_COLOR, background=BG_COLOR,
+                    foreground=TEXT_COLOR)
+    style.map("TCombobox", fieldbackground=[("readonly", BG_COLOR)],
+              selectbackground=[("readonly", PRIMARY_COLOR)])
+
+    # Configure buttons
+    style.configure("TButton", background=PRIMARY_COLOR, foreground=BG_COLOR,
+                    borderwidth=0, font=("Helvetica", 10))
+    style.map("TButton", background=[("active", PRIMARY_COLOR)],
+              foreground=[("active", BG_COLOR)])
+
+
+class ModernButton(tk.Button):
+    """Custom button class with modern, minimalist styling"""
+
+    def __init__(self, master=None, **kwargs):
+        # Default configuration
+        kwargs.setdefault("relief", "flat")
+        kwargs.setdefault("borderwidth", 0)
+        kwargs.setdefault("padx", 15)
+        kwargs.setdefault("pady", 8)
+        kwargs.setdefault("font", ("Helvetica", 10))
+        kwargs.setdefault("cursor", "hand2")
+
+        # Initialize the button
+        super().__init__(master, **kwargs)
+
+        # Store original background
+        self.original_bg = kwargs.get("bg", kwargs.get("background", PRIMARY_COLOR))
+        self.hover_bg = kwargs.get("activebackground", self.calculate_hover_color(self.original_bg))
+
+        # Bind events
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
+
+    def calculate_hover_color(self, color):
+        """Calculate a slightly darker version of the color for hover effect"""
+        if color == PRIMARY_COLOR: return "#1565C0"  # Darker blue
+        if color == HIGHLIGHT_COLOR: return "#E64A19"  # Darker orange
+        if color == SUCCESS_COLOR: return "#388E3C"  # Darker green
+        if color == ERROR_COLOR: return "#D32F2F"  # Darker red
+        return color  # Default fallback
+
+    def _on_enter(self, event):
+        """Mouse enter event - darken button for hover effect"""
+        self.config(bg=self.hover_bg)
+
+    def _on_leave(self, event):
+        """Mouse leave event - restore button"""
+        self.config(bg=self.original_bg)
+
+
+def make_button(master, kind="primary", **kwargs):
+    kwargs.setdefault("bg", BUTTON_COLORS[kind])
+    kwargs.setdefault("fg", BG_COLOR)
+    return ModernButton(master, **kwargs)
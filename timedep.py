@@ -0,0 +1,179 @@
+"""
+Travel times that depend on the time of day.
+
+An edge may carry a "profile": its travel time in minutes as a function of
+the minute it is entered, piecewise linear between breakpoints and
+repeating every day. Profiles model crowds at class changes, shuttles
+(wait for the next departure, then ride) and gates that lock at night
+(wait for them to open). Edges without one take "weight" minutes at any
+hour.
+
+Profiles keep their breakpoints in two float32 arrays, and index_profiles
+shares one Profile between all edges with the same breakpoints, so a big
+graph with a handful of distinct timetables stores each only once.
+
+Every profile must be FIFO: leaving later never gets you there earlier,
+i.e. the travel time never falls faster than one minute per minute and
+only jumps up. Profile rejects anything else. With FIFO edges, Dijkstra
+keyed on arrival time (earliest_arrivals) is exact, and the arrival time
+is non-decreasing in the departure time, which lets the scheduler binary
+search over departure times just as it does with fixed walking times.
+"""
+import bisect
+import heapq
+from array import array
+
+DAY = 24 * 60
+CACHE_SIZE = 4096  # departure times whose arrivals TravelTimes keeps
+
+
+class Profile:
+    """Periodic piecewise-linear travel time; points are (minute of day, travel minutes)"""
+
+    __slots__ = ("times", "values")
+
+    def __init__(self, points):
+        # Stable sort: two points at one minute are a jump, in the order given
+        points = sorted(((float(t) % DAY, float(v)) for t, v in points), key=lambda point: point[0])
+        if not points:
+            raise ValueError("a profile needs at least one point")
+        # Drop points that lie on the line through their neighbours
+        kept = [points[0]]
+        for i in range(1, len(points) - 1):
+            (t0, v0), (t1, v1), (t2, v2) = kept[-1], points[i], points[i + 1]
+            if t2 == t0 or t1 in (t0, t2) or abs(v0 + (v2 - v0) * (t1 - t0) / (t2 - t0) - v1) > 1e-9:
+                kept.append(points[i])
+        if len(points) > 1:
+            kept.append(points[-1])
+        self.times = array("f", [t for t, _ in kept])
+        self.values = array("f", [v for _, v in kept])
+        self._check_fifo()
+
+    def _check_fifo(self):
+        n = len(self.times)
+        for i in range(n):
+            t0, v0 = self.times[i], self.values[i]
+            t1, v1 = (self.times[i + 1], self.values[i + 1]) if i + 1 < n else (self.times[0] + DAY, self.values[0])
+            if v0 < 0:
+                raise ValueError(f"negative travel time at minute {t0:g}")
+            if t1 == t0:
+                if v1 < v0:
+                    raise ValueError(f"travel time drops at minute {t0:g}, so leaving later would arrive sooner")
+            elif (v1 - v0) / (t1 - t0) < -1 - 1e-6:
+                raise ValueError(f"travel time falls faster than the clock after minute {t0:g}, "
+                                 "so leaving later would arrive sooner")
+
+    @classmethod
+    def constant(cls, minutes):
+        return cls([(0, minutes)])
+
+    def __call__(self, depart):
+        """Travel minutes when entering the edge at minute depart (any day)"""
+        times, values = self.times, self.values
+        t = depart % DAY
+        i = bisect.bisect_right(times, t) - 1
+        if i < 0:
+            # Before the first breakpoint: on the segment wrapping round from yesterday
+            i, t = len(times) - 1, t + DAY
+        if i + 1 < len(times):
+            t1, v1 = times[i + 1], values[i + 1]
+        else:
+            t1, v1 = times[0] + DAY, values[0]
+        t0, v0 = times[i], values[i]
+        if t1 == t0:
+            return v0
+        return v0 + (v1 - v0) * (t - t0) / (t1 - t0)
+
+    def key(self):
+        return self.times.tobytes() + self.values.tobytes()
+
+    def __reduce__(self):
+        return Profile, (list(zip(self.times, self.values)),)
+
+
+def gate_profile(walk, opens, closes):
+    """A walk through a gate that is open from minute opens until minute closes; at other times wait for it"""
+    closed = (opens - closes) % DAY
+    # Leaving at closing time or later means waiting until it opens again
+    return Profile([(opens, walk), (closes, walk), (closes, walk + closed)])
+
+
+def shuttle_profile(ride, departures):
+    """
+    A shuttle that leaves at the given minutes of the day and takes ride
+    minutes; arriving at the stop as it leaves means waiting for the next one
+    """
+    departures = sorted(set(d % DAY for d in departures))
+    points = []
+    for i, d in enumerate(departures):
+        following = departures[i + 1] if i + 1 < len(departures) else departures[0] + DAY
+        # Just in time for this one, then a jump up to waiting for the next
+        points += [(d, ride), (d, ride + following - d)]
+    return Profile(points)
+
+
+def index_profiles(graph, name_to_index):
+    """
+    Adjacency list of (v, minutes, profile) for graph, where profile is None
+    on edges with a fixed time of minutes ("weight"). A "profile" attribute
+    may be a Profile or a list of (minute, travel minutes) points; equal
+    profiles are shared
+    """
+    shared = {}
+    adjacency = [[] for _ in range(len(name_to_index))]
+    for u, v, data in graph.edges(data=True):
+        profile = data.get("profile")
+        if profile is not None:
+            if not isinstance(profile, Profile):
+                profile = Profile(profile)
+            profile = shared.setdefault(profile.key(), profile)
+        weight = data.get("weight", 1)
+        adjacency[name_to_index[u]].append((name_to_index[v], weight, profile))
+        adjacency[name_to_index[v]].append((name_to_index[u], weight, profile))
+    return adjacency
+
+
+def earliest_arrivals(adjacency, src, depart):
+    """
+    Time-dependent Dijkstra: the earliest arrival minute at every node when
+    leaving src at minute depart, and each node's previous stop. Exact
+    because every profile is FIFO
+    """
+    n = len(adjacency)
+    arrival = [float('inf')] * n
+    prev = [None] * n
+    arrival[src] = depart
+    pq = [(depart, src)]
+    while pq:
+        t, u = heapq.heappop(pq)
+        if t > arrival[u]:
+            continue
+        for v, weight, profile in adjacency[u]:
+            reached = t + (weight if profile is None else profile(t))
+            if reached < arrival[v]:
+                arrival[v] = reached
+                prev[v] = u
+                heapq.heappush(pq, (reached, v))
+    return arrival, prev
+
+
+class TravelTimes:
+    """
+    Walking minutes between buildings at a given departure minute, for the
+    scheduler: travel(a, b, depart). One time-dependent Dijkstra per
+    (building, departure minute) answers every destination, and its result
+    is kept for later questions
+    """
+
+    def __init__(self, campus):
+        self.campus = campus
+        self._arrivals = {}
+
+    def __call__(self, source, target, depart):
+        key = (source, depart)
+        arrivals = self._arrivals.get(key)
+        if arrivals is None:
+            if len(self._arrivals) >= CACHE_SIZE:
+                self._arrivals.clear()
+            arrivals = self._arrivals[key] = self.campus.earliest_arrivals(source, depart)
+        return arrivals[target] - depart